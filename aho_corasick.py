@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Aho-Corasick-Automat
+Findet beliebig viele Suchbegriffe in einem einzigen Durchlauf über den
+Text. Die Laufzeit hängt nur von Textlänge und Trefferzahl ab, nicht von
+der Anzahl der Begriffe.
+
+    automaton = Automaton()
+    automaton.add('pelvic tilt', 'pt')
+    automaton.build()
+    for start, end, value in automaton.finditer(text.lower()):
+        ...
+"""
+
+
+class Automaton:
+    """Trie mit Fehler-Links; nach build() nur noch lesend"""
+
+    __slots__ = ('_goto', '_fail', '_out', '_built')
+
+    def __init__(self):
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+        self._built = False
+
+    def add(self, pattern, value):
+        """Fügt einen Suchbegriff hinzu (vor build())"""
+        if self._built:
+            raise RuntimeError("Automat ist bereits gebaut")
+        if not pattern:
+            return
+        node = 0
+        for char in pattern:
+            following = self._goto[node].get(char)
+            if following is None:
+                following = len(self._goto)
+                self._goto[node][char] = following
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            node = following
+        self._out[node] += ((len(pattern), value),)
+
+    def build(self):
+        """Berechnet die Fehler-Links (Breitensuche über den Trie)"""
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for char, following in self._goto[node].items():
+                queue.append(following)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[following] = target if target != following else 0
+                self._out[following] += self._out[self._fail[following]]
+        self._built = True
+        return self
+
+    def finditer(self, text, start=0, end=None):
+        """Alle Treffer als (start, end, value), sortiert nach Trefferende"""
+        if not self._built:
+            self.build()
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for i in range(start, len(text) if end is None else end):
+            char = text[i]
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for length, value in out[state]:
+                yield i - length + 1, i + 1, value
+
+
+def leftmost_longest(matches):
+    """Nicht überlappende Treffer: frühester Start, bei Gleichstand der längste"""
+    selected = []
+    last_end = -1
+    for start, end, value in sorted(matches, key=lambda m: (m[0], m[0] - m[1])):
+        if start >= last_end:
+            selected.append((start, end, value))
+            last_end = end
+    return selected
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Kompaktes Artikel-Modell
+Article -> Section -> Block mit __slots__. Ein Block speichert keinen
+kopierten Text, sondern nur die Spanne seines Inhalts im Quelltext der
+Seite; Text und bereinigtes HTML entstehen erst beim Zugriff. Blockarten
+und Kategorien sind internierte Strings und teilen sich einen Speicherplatz.
+So passt das Modell der ganzen Website neben den Quelltexten in den
+Speicher.
+
+    article = parse_article(source, 'rosa/index.html')
+    for section in article.sections:
+        print(section.id, section.title, [block.kind for block in section.blocks])
+
+Zerlegung wie früher ContentExtractor (convert_to_new_template2.py):
+  - erstes <h1> ist der Titel
+  - jedes <h2> beginnt einen Abschnitt (id aus dem Attribut, sonst aus dem Titel)
+  - h3, h4, p, ul, ol und table im Abschnitt sind Blöcke; leere Absätze,
+    Listen ohne <li> und Tabellen ohne <tr> fallen weg
+
+Verwendung:
+  python3 article_model.py    # Modell der Website laden, Größe ausgeben
+"""
+
+import html
+import re
+import sys
+
+from html_matcher import find_elements, iter_tags
+from site_manifest import BASE_PATH, load_manifest
+from text_vectors import html_text
+
+# Seitenarten, die load_articles() einliest
+MODEL_KINDS = ('article', 'paper')
+
+# Block-Elemente: Absätze und Überschriften enden am nächsten Block, Listen
+# und Tabellen erst an ihrem eigenen End-Tag
+TEXT_BLOCKS = frozenset({'h3', 'h4', 'p'})
+CONTAINER_BLOCKS = frozenset({'ul', 'ol', 'table'})
+# Elemente, deren Beginn einen offenen Absatz schließt (wie im Browser)
+PARAGRAPH_CLOSERS = frozenset({'h1', 'h2', 'h3', 'h4', 'p', 'ul', 'ol', 'table', 'div', 'section', 'article'})
+
+# Inline-Elemente: ihr End-Tag schließt keinen offenen Absatz
+INLINE_TAGS = frozenset({'a', 'abbr', 'b', 'cite', 'code', 'em', 'i', 'mark', 'small', 'span', 'strong', 'sub', 'sup'})
+
+# Pflicht-Kind eines Containers, damit er als Block zählt
+CONTAINER_ITEMS = {'ul': 'li', 'ol': 'li', 'table': 'tr'}
+
+# Eine Instanz pro Tag-Name (iter_tags liefert bei jedem Tag einen neuen String)
+_KINDS = {name: sys.intern(name) for name in TEXT_BLOCKS | CONTAINER_BLOCKS}
+
+_ID = re.compile(r'\bid\s*=\s*(["\'])(.*?)\1', re.I | re.S)
+_LEADING_TEXT = re.compile(r'\s*[^<\s]')
+_TEXT_AFTER_TAG = re.compile(r'>\s*[^<\s]')
+_CELL = re.compile(r'<(t[hd])\b[^>]*>(.*?)</\1\s*>', re.I | re.S)
+
+
+def make_id(text):
+    """ID aus einem Titel (Umlaute ausgeschrieben, höchstens 50 Zeichen)"""
+    text = text.lower()
+    text = text.replace('ä', 'ae').replace('ö', 'oe').replace('ü', 'ue').replace('ß', 'ss')
+    text = re.sub(r'[^a-z0-9]+', '-', text).strip('-')
+    return text[:50] if text else 'section'
+
+
+def _escape(text):
+    return html.escape(text, quote=False)
+
+
+def _has_text(source, start, end):
+    """True, wenn zwischen den Tags der Spanne sichtbarer Text steht (ohne Kopie)"""
+    return bool(_LEADING_TEXT.match(source, start, end) or _TEXT_AFTER_TAG.search(source, start, end))
+
+
+class Block:
+    """Absatz, Überschrift, Liste oder Tabelle als Spanne [start, end) im Quelltext"""
+
+    __slots__ = ('kind', 'source', 'start', 'end')
+
+    def __init__(self, kind, source, start, end):
+        self.kind = kind
+        self.source = source
+        self.start = start
+        self.end = end
+
+    def __repr__(self):
+        return f'<Block {self.kind} {self.start}:{self.end}>'
+
+    @property
+    def raw(self):
+        """Inneres HTML aus der Quelle"""
+        return self.source[self.start:self.end]
+
+    @property
+    def text(self):
+        """Sichtbarer Text ohne Tags"""
+        return html_text(self.raw)
+
+    def items(self):
+        """Texte der Listenpunkte bzw. Zeilen als Listen von (Tag, Zelltext)"""
+        raw = self.raw
+        if self.kind == 'table':
+            return [
+                [(cell.group(1).lower(), html_text(cell.group(2))) for cell in _CELL.finditer(raw, start, end)]
+                for start, end in find_elements(raw, 'tr')
+            ]
+        return [html_text(raw[raw.index('>', start) + 1:end]) for start, end in find_elements(raw, 'li')]
+
+    def html(self):
+        """Bereinigtes HTML ohne Attribute und Inline-Tags"""
+        if self.kind in TEXT_BLOCKS:
+            return f'<{self.kind}>{_escape(self.text)}</{self.kind}>'
+        if self.kind == 'table':
+            rows = ''.join(
+                '<tr>' + ''.join(f'<{tag}>{_escape(text)}</{tag}>' for tag, text in row) + '</tr>'
+                for row in self.items()
+            )
+            return f'<table>{rows}</table>'
+        items = ''.join(f'<li>{_escape(text)}</li>' for text in self.items())
+        return f'<{self.kind}>{items}</{self.kind}>'
+
+
+class Section:
+    """Abschnitt ab einem <h2>"""
+
+    __slots__ = ('id', 'title', 'blocks')
+
+    def __init__(self, section_id, title):
+        self.id = section_id
+        self.title = title
+        self.blocks = []
+
+    def __repr__(self):
+        return f'<Section {self.id} ({len(self.blocks)} Blöcke)>'
+
+
+class Article:
+    """Eine Seite: Quelltext, Titel, Kategorie und Abschnitte"""
+
+    __slots__ = ('path', 'source', 'title', 'category', 'sections')
+
+    def __init__(self, path, source, title='', category=None, sections=None):
+        self.path = path
+        self.source = source
+        self.title = title
+        self.category = sys.intern(category) if category else None
+        self.sections = sections if sections is not None else []
+
+    def __repr__(self):
+        return f'<Article {self.path} ({len(self.sections)} Abschnitte)>'
+
+    def blocks(self):
+        for section in self.sections:
+            yield from section.blocks
+
+
+def parse_article(source, path=None, category=None):
+    """Zerlegt den Quelltext einer Seite in ein Article-Modell"""
+    article = Article(path, source, category=category)
+    section = None
+    # Offener Block: (Art, Start des Inhalts); bei Containern Tiefe und ob ein Eintrag kam
+    block = None
+    depth = 0
+    has_item = False
+    # Offene Überschrift (h1 oder h2): (Name, Start des Inhalts, id)
+    heading = None
+
+    def close_text_block(end):
+        if section is not None and _has_text(source, block[1], end):
+            section.blocks.append(Block(block[0], source, block[1], end))
+
+    for start, end, name, is_end in iter_tags(source):
+        if block is not None:
+            kind = block[0]
+            if kind in CONTAINER_BLOCKS:
+                if name == kind:
+                    depth += -1 if is_end else 1
+                    if depth == 0:
+                        if has_item:
+                            section.blocks.append(Block(kind, source, block[1], start))
+                        block = None
+                elif name == CONTAINER_ITEMS[kind] and not is_end:
+                    has_item = True
+                continue
+            if is_end and name == kind:
+                close_text_block(start)
+                block = None
+                continue
+            if name in INLINE_TAGS or (not is_end and name not in PARAGRAPH_CLOSERS):
+                continue
+            close_text_block(start)
+            block = None
+
+        if heading is not None:
+            if is_end and name == heading[0]:
+                title = html_text(source[heading[1]:start])
+                if heading[0] == 'h1':
+                    article.title = title
+                else:
+                    section = Section(heading[2] or make_id(title), title)
+                    article.sections.append(section)
+                heading = None
+            continue
+
+        if is_end:
+            continue
+        if (name == 'h1' and not article.title) or name == 'h2':
+            section_id = _ID.search(source, start, end) if name == 'h2' else None
+            heading = (name, end, html.unescape(section_id.group(2)) if section_id else None)
+        elif section is not None and name in _KINDS and source[end - 2] != '/':
+            block = (_KINDS[name], end)
+            depth = 1
+            has_item = False
+
+    return article
+
+
+def load_articles(manifest=None, kinds=MODEL_KINDS):
+    """Modell aller Artikel und Paper der Website (Seiten, die fehlen, werden übersprungen)"""
+    manifest = manifest or load_manifest()
+    articles = []
+    for page in manifest.of_kind(*kinds):
+        try:
+            source = (BASE_PATH / page['path']).read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            continue
+        category = manifest.category(page['path'])
+        article = parse_article(source, page['path'], category['name'] if category else None)
+        article.title = article.title or page['title']
+        articles.append(article)
+    return articles
+
+
+def main():
+    import tracemalloc
+
+    print("=" * 60)
+    print("🧱 Artikel-Modell")
+    print("=" * 60)
+
+    tracemalloc.start()
+    articles = load_articles()
+    total, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    sources = sum(sys.getsizeof(article.source) for article in articles)
+    sections = sum(len(article.sections) for article in articles)
+    blocks = sum(1 for article in articles for _ in article.blocks())
+
+    print("\n" + "=" * 60)
+    print("ZUSAMMENFASSUNG:")
+    print(f"   📄 Seiten: {len(articles)}")
+    print(f"   📑 Abschnitte: {sections}")
+    print(f"   🧱 Blöcke: {blocks}")
+    print(f"   💾 Speicher: {total / 1024:.0f} KB, davon Quelltexte {sources / 1024:.0f} KB")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Begriffe im Fließtext verlinken
+Alle Begriffe stecken in einem Aho-Corasick-Automaten; jeder Textknoten
+einer Seite wird genau einmal gelesen. Der Aufwand ist linear in der
+Seitengröße, egal wie viele Begriffe es gibt.
+
+Überschriften, Links, Attribute, Code, Navigation und generierte Blöcke
+bleiben unberührt. Pro <section> wird nur das erste Vorkommen eines
+Begriffs verlinkt. Eingefügte Links tragen eine eigene Klasse und werden
+vor jedem Lauf mit unlink() entfernt - so bleiben Läufe idempotent.
+"""
+
+import re
+
+from aho_corasick import Automaton, leftmost_longest
+from html_matcher import VOID_TAGS, find_elements, iter_tags
+from page_blocks import block_spans
+
+# Elemente, in deren Text nie verlinkt wird
+SKIP_TAGS = {
+    'a', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'script', 'style', 'nav',
+    'header', 'footer', 'aside', 'button', 'code', 'pre', 'title',
+    'textarea', 'svg', 'select', 'label',
+}
+
+# Element, innerhalb dessen jeder Begriff höchstens einmal verlinkt wird
+SCOPE_TAG = 'section'
+
+_COMMENT = re.compile(r'(<!--.*?-->)', re.S)
+
+
+def compile_terms(terms):
+    """
+    Automat aus (Begriff, Schlüssel)-Paaren. Begriffe in Großbuchstaben
+    (Abkürzungen wie PI oder SS) müssen exakt passen, alle anderen
+    unabhängig von Groß-/Kleinschreibung.
+    """
+    automaton = Automaton()
+    for pattern, key in terms:
+        pattern = pattern.strip()
+        if pattern:
+            automaton.add(pattern.lower(), (key, pattern if pattern.isupper() else None))
+    return automaton.build()
+
+
+def _is_word(char):
+    return char.isalnum() or char == '_'
+
+
+def find_terms(text, automaton):
+    """Nicht überlappende Treffer als (start, end, Schlüssel), nur ganze Wörter"""
+    folded = text.lower()
+    if len(folded) != len(text):
+        # Sonderfälle wie 'İ' ändern die Länge - dann nur exakte Treffer
+        folded = text
+    found = []
+    for start, end, (key, exact) in automaton.finditer(folded):
+        if exact is not None and text[start:end] != exact:
+            continue
+        if (start > 0 and _is_word(text[start - 1])) or (end < len(text) and _is_word(text[end])):
+            continue
+        found.append((start, end, key))
+    return leftmost_longest(found)
+
+
+def content_region(html):
+    """(start, end) des Inhalts (<article>, sonst <main>) oder None"""
+    spans = find_elements(html, 'article') or find_elements(html, 'main')
+    return spans[0] if spans else None
+
+
+def link_terms(html, automaton, render, region=None):
+    """
+    Verlinkt Begriffe in den Textknoten von html[region] (Standard: ganze
+    Seite). render(Schlüssel, Text) liefert das Link-HTML oder None, wenn
+    nicht verlinkt werden soll. Gibt (neues HTML, verlinkte Schlüssel in
+    Reihenfolge) zurück.
+    """
+    start, stop = region or (0, len(html))
+    generated = block_spans(html)
+    pieces = [html[:start]]
+    linked = []
+    open_skips = dict.fromkeys(SKIP_TAGS, 0)
+    skipping = 0
+    scopes = [set()]
+
+    def link_text(text, offset):
+        # Generierte Blöcke liegen immer zwischen Tags (Marker sind Kommentare)
+        if skipping or any(lo <= offset < hi for lo, hi in generated):
+            pieces.append(text)
+            return
+        for n, part in enumerate(_COMMENT.split(text)):
+            if n % 2 or not part.strip():
+                pieces.append(part)
+                continue
+            pos = 0
+            for match_start, match_end, key in find_terms(part, automaton):
+                if key in scopes[-1]:
+                    continue
+                link = render(key, part[match_start:match_end])
+                if link is None:
+                    continue
+                scopes[-1].add(key)
+                linked.append(key)
+                pieces.append(part[pos:match_start])
+                pieces.append(link)
+                pos = match_end
+            pieces.append(part[pos:])
+
+    text_start = start
+    for tag_start, tag_end, name, is_end in iter_tags(html, start=start):
+        if tag_start >= stop:
+            break
+        link_text(html[text_start:tag_start], text_start)
+        pieces.append(html[tag_start:tag_end])
+        text_start = tag_end
+
+        self_closing = name in VOID_TAGS or html[tag_end - 2] == '/'
+        if name in open_skips:
+            if not is_end and not self_closing:
+                open_skips[name] += 1
+                skipping += 1
+            elif is_end and open_skips[name]:
+                open_skips[name] -= 1
+                skipping -= 1
+        elif name == SCOPE_TAG:
+            if not is_end:
+                scopes.append(set())
+            elif len(scopes) > 1:
+                scopes.pop()
+
+    if text_start < stop:
+        link_text(html[text_start:stop], text_start)
+        text_start = stop
+    pieces.append(html[text_start:])
+    return ''.join(pieces), linked
+
+
+def unlink(html, css_class):
+    """Entfernt alle Links mit der Klasse css_class und behält ihren Text"""
+    pattern = re.compile(r'<a\b[^>]*\bclass="' + re.escape(css_class) + r'"[^>]*>(.*?)</a>', re.S)
+    return pattern.sub(r'\1', html)
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Backlinks ("Zitiert in")
+Kehrt den Link-Graphen um und schreibt in jeden Artikel und jedes Paper
+einen Block mit den Seiten, die darauf verweisen:
+
+    <!-- generated:backlinks -->...<!-- /generated:backlinks -->
+
+Als Verweis zählen Links im Inhalt (siehe link_graph.py), Zitate aus dem
+Literaturverzeichnis (papers/bibliography.json) und die Zuordnung eines
+Papers zu seinem Übersichtsartikel.
+
+Inkrementell: .build/backlinks.json merkt sich pro Seite die eingehenden
+Verweise. Neu geschrieben werden nur Seiten, deren Verweise sich geändert
+haben oder die seit dem letzten Lauf bearbeitet wurden.
+
+Verwendung:
+  python3 backlinks.py          # Blöcke aktualisieren
+  python3 backlinks.py --all    # alle Blöcke neu schreiben
+  python3 backlinks.py --remove # Blöcke entfernen
+"""
+
+import argparse
+import html
+import json
+import posixpath
+
+from bibliography import BibliographyError, load_bibliography
+from link_graph import collect_links, invert, load_link_cache, page_stat, store_link_cache
+from page_blocks import remove_block, set_block
+from safe_write import TreeLocked, tree_lock, write_text
+from site_manifest import BASE_PATH, load_manifest
+
+BLOCK_NAME = 'backlinks'
+
+STATE_PATH = BASE_PATH / '.build' / 'backlinks.json'
+STATE_VERSION = 1
+
+# Seitenarten, die verweisen und einen Block bekommen
+BACKLINK_KINDS = ('article', 'paper')
+
+
+def reference_graph(manifest, links, bibliography):
+    """{Quelle: {Ziele}} aus Links, Zitaten und Paper-Zuordnung"""
+    graph = {rel: set(entry['links']) for rel, entry in links.items()}
+    for entry in bibliography.entries:
+        if entry['page']:
+            for source in entry['cited_in']:
+                graph.setdefault(source, set()).add(entry['page'])
+    for page in manifest.of_kind('paper'):
+        parent = manifest.parent(page['path'])
+        if parent is not None:
+            graph.setdefault(parent['path'], set()).add(page['path'])
+    return graph
+
+
+def _label(page):
+    return page['name'] or page['title'] or page['path']
+
+
+def render_backlinks(page, sources):
+    """Block mit relativen Links auf die verweisenden Seiten"""
+    base = posixpath.dirname(page['path'])
+    items = ''.join(
+        f'                    <li><a href="{html.escape(posixpath.relpath(source["path"], base))}">'
+        f'{html.escape(_label(source), quote=False)}</a></li>\n'
+        for source in sources
+    )
+    return (
+        f'<!-- generated:{BLOCK_NAME} -->\n'
+        f'            <section id="zitiert-in" class="backlinks">\n'
+        f'                <h2>Zitiert in</h2>\n'
+        f'                <ul>\n{items}                </ul>\n'
+        f'            </section>\n'
+        f'            <!-- /generated:{BLOCK_NAME} -->'
+    )
+
+
+def update_page(page_html, page, sources):
+    if not sources:
+        return remove_block(page_html, BLOCK_NAME)
+    return set_block(page_html, BLOCK_NAME, render_backlinks(page, sources))
+
+
+def load_state():
+    try:
+        data = json.loads(STATE_PATH.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if data.get('version') != STATE_VERSION:
+        return {}
+    return data['pages']
+
+
+def store_state(pages):
+    try:
+        STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        write_text(STATE_PATH, json.dumps({'version': STATE_VERSION, 'pages': pages}, ensure_ascii=False))
+    except OSError:
+        # Ohne Zustand wird beim nächsten Mal alles neu geschrieben
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backlink-Blöcke in die Seiten schreiben")
+    parser.add_argument('--all', action='store_true', help="alle Blöcke neu schreiben")
+    parser.add_argument('--remove', action='store_true', help="Blöcke entfernen")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("↩️  Backlinks")
+    print("=" * 60)
+
+    try:
+        tree_lock()
+    except TreeLocked as e:
+        print(f"❌ {e}")
+        return
+
+    try:
+        bibliography = load_bibliography()
+    except BibliographyError as e:
+        print(f"❌ {e}")
+        return
+
+    manifest = load_manifest()
+    pages = manifest.of_kind(*BACKLINK_KINDS)
+    kinds = {page['path']: page for page in pages}
+    links, scanned = collect_links(list(kinds), load_link_cache())
+
+    graph = reference_graph(manifest, links, bibliography)
+    inbound = invert({source: targets for source, targets in graph.items() if source in kinds})
+
+    previous = {} if args.all or args.remove else load_state()
+    state = {}
+    updated = 0
+    unchanged = 0
+    for page in pages:
+        path = BASE_PATH / page['path']
+        sources = [] if args.remove else inbound.get(page['path'], [])
+        try:
+            stat = page_stat(path)
+        except OSError as e:
+            print(f"  ⚠️  {page['path']}: {e}")
+            continue
+        known = previous.get(page['path'])
+        if known is not None and known['stat'] == stat and known['inbound'] == sources:
+            state[page['path']] = known
+            unchanged += 1
+            continue
+
+        page_html = path.read_text(encoding='utf-8')
+        ordered = sorted(
+            (kinds[source] for source in sources),
+            key=lambda other: (other['kind'] != 'article', _label(other).lower()),
+        )
+        new_html = update_page(page_html, page, ordered)
+        if new_html != page_html:
+            write_text(path, new_html)
+            stat = page_stat(path)
+            if page['path'] in links:
+                # Der Block zählt nicht zum Link-Graphen - Einträge bleiben gültig
+                links[page['path']]['stat'] = stat
+            updated += 1
+            print(f"  ✅ {page['path']} ({len(sources)} Verweise)")
+        state[page['path']] = {'stat': stat, 'inbound': sources}
+
+    store_link_cache(links)
+    store_state(state)
+    without = sum(1 for page in pages if not inbound.get(page['path']))
+
+    print("\n" + "=" * 60)
+    print("ZUSAMMENFASSUNG:")
+    print(f"   📄 Seiten: {len(pages)} ({scanned} Links neu eingelesen)")
+    print(f"   ↩️  Ohne Verweise: {without}")
+    print(f"   ⏭️  Unverändert: {unchanged}")
+    print(f"   ✅ Aktualisiert: {updated}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Write-Ahead-Journal für Stapelläufe
+Konverter, die viele Seiten umschreiben (ultra_minimal.py,
+update_all_articles.py), protokollieren jeden Schritt in
+.build/journal/<name>.jsonl, bevor er passiert:
+
+    {"op": "begin", "directory", "files": [...]}       geplante Dateien
+    {"op": "intent", "file", "before", "after"}       vor dem Schreiben
+    {"op": "done", "file", "status"}                   nach dem Schreiben
+    {"op": "end"}                                      Lauf vollständig
+
+Jede Zeile wird sofort auf die Platte geschrieben (fsync) und ist damit
+ein Checkpoint. Bricht ein Lauf ab, setzt --resume genau dort fort:
+erledigte Dateien werden übersprungen, bei einer unterbrochenen Datei
+entscheidet der Hash des aktuellen Inhalts:
+  - alter Inhalt  -> Datei wird normal verarbeitet
+  - neuer Inhalt  -> Schreiben war fertig, nur "done" fehlte
+  - etwas anderes -> halb geschrieben, der alte Inhalt wird aus
+                     .build/journal/<name>/ zurückgeschrieben
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+
+from safe_write import write_text
+from site_manifest import BASE_PATH
+
+JOURNAL_DIR = BASE_PATH / '.build' / 'journal'
+
+
+class JournalError(Exception):
+    """Journal fehlt, ist unvollständig oder eine Datei lässt sich nicht wiederherstellen"""
+
+
+def content_digest(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+class Journal:
+    """Journal eines Stapellaufs; Dateien werden relativ zu directory geführt"""
+
+    def __init__(self, name, directory=BASE_PATH):
+        self.name = name
+        self.directory = Path(directory)
+        self.path = JOURNAL_DIR / f'{name}.jsonl'
+        # Alter Inhalt der Dateien, die gerade geschrieben werden
+        self.images = JOURNAL_DIR / name
+        self.files = []
+        self.done = {}
+        self.pending = {}
+        self._handle = None
+
+    def _scan(self):
+        """(lesbare Einträge, Länge des lesbaren Anfangs in Bytes)"""
+        try:
+            data = self.path.read_bytes()
+        except FileNotFoundError:
+            return [], 0
+        records = []
+        valid = 0
+        for line in data.splitlines(keepends=True):
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                # Letzte Zeile beim Absturz nur halb geschrieben
+                break
+            valid += len(line)
+        return records, valid
+
+    def _records(self):
+        return self._scan()[0]
+
+    def unfinished(self):
+        """True, wenn ein begonnener Lauf nicht mit "end" abgeschlossen wurde"""
+        records = self._records()
+        return bool(records) and records[-1]['op'] != 'end'
+
+    def _load(self):
+        for record in self._records():
+            op = record['op']
+            if op == 'begin':
+                self.directory = Path(record['directory'])
+                self.files = record['files']
+                self.done = {}
+                self.pending = {}
+            elif op == 'intent':
+                self.pending[record['file']] = record
+            elif op == 'done':
+                self.pending.pop(record['file'], None)
+                self.done[record['file']] = record['status']
+
+    def _truncate(self):
+        """Schneidet eine halb geschriebene letzte Zeile ab, damit neue Einträge lesbar bleiben"""
+        _, valid = self._scan()
+        with open(self.path, 'r+b') as handle:
+            handle.truncate(valid)
+            if valid:
+                handle.seek(valid - 1)
+                if handle.read(1) != b'\n':
+                    handle.write(b'\n')
+            handle.flush()
+            os.fsync(handle.fileno())
+
+    def _open(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = open(self.path, 'a', encoding='utf-8')
+
+    def _append(self, **record):
+        self._handle.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+
+    def begin(self, paths):
+        """Startet einen neuen Lauf über paths (ein altes Journal wird verworfen)"""
+        self.files = [self.relative(path) for path in paths]
+        self.done = {}
+        self.pending = {}
+        shutil.rmtree(self.images, ignore_errors=True)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        write_text(self.path, '')
+        self._open()
+        self._append(op='begin', directory=str(self.directory.resolve()), files=self.files)
+        return [self.directory / rel for rel in self.files]
+
+    def resume(self):
+        """
+        Setzt einen abgebrochenen Lauf fort: repariert die unterbrochene Datei
+        und liefert die geplanten Dateien in der ursprünglichen Reihenfolge.
+        """
+        if not self.unfinished():
+            raise JournalError(f"Kein abgebrochener Lauf in {self.path}")
+        self._load()
+        self._truncate()
+        self._open()
+        for rel, intent in list(self.pending.items()):
+            self._recover(rel, intent)
+        return [self.directory / rel for rel in self.files]
+
+    def _recover(self, rel, intent):
+        path = self.directory / rel
+        current = content_digest(path.read_text(encoding='utf-8')) if path.is_file() else None
+        if current == intent['after']:
+            self.finish(path, 'updated')
+        elif current != intent['before']:
+            image = self.images / rel
+            original = image.read_text(encoding='utf-8') if image.is_file() else None
+            if original is None or content_digest(original) != intent['before']:
+                raise JournalError(f"{rel}: halb geschrieben und alter Inhalt nicht im Journal")
+            write_text(path, original)
+            print(f"  ♻️  {rel} wiederhergestellt")
+        self.pending.pop(rel, None)
+
+    def is_done(self, path):
+        return self.relative(path) in self.done
+
+    def relative(self, path):
+        return Path(path).resolve().relative_to(self.directory.resolve()).as_posix()
+
+    def write(self, path, old, new):
+        """
+        Schreibt new nach path: erst den alten Inhalt ins Journal-Verzeichnis,
+        dann die Absicht ins Journal, dann die Datei, dann "done". Der alte
+        Inhalt wird nur für die Datei gehalten, die gerade geschrieben wird.
+        """
+        rel = self.relative(path)
+        image = self.images / rel
+        image.parent.mkdir(parents=True, exist_ok=True)
+        write_text(image, old)
+        self._append(op='intent', file=rel, before=content_digest(old), after=content_digest(new))
+        write_text(Path(path), new)
+        self.finish(path, 'updated')
+        image.unlink()
+
+    def finish(self, path, status):
+        """Markiert eine Datei als erledigt (updated, skipped, error)"""
+        rel = self.relative(path)
+        self._append(op='done', file=rel, status=status)
+        self.done[rel] = status
+
+    def end(self):
+        self._append(op='end')
+        self.close()
+        shutil.rmtree(self.images, ignore_errors=True)
+
+    def close(self):
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def counts(self):
+        """Anzahl erledigter Dateien je Status"""
+        counts = {}
+        for status in self.done.values():
+            counts[status] = counts.get(status, 0) + 1
+        return counts
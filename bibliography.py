@@ -0,0 +1,500 @@
+#!/usr/bin/env python3
+"""
+Literaturverzeichnis der ganzen Site
+Sammelt Zitate aus drei Quellen und führt sie in einer Tabelle zusammen
+(papers/bibliography.json):
+
+- Paper-Datensätze (papers/<artikel>/<slug>.json)
+- Paper-Seiten mit "(Autor et al., Jahr)" im Titel; der Ordnername
+  (...tangetal2023) muss dazu passen
+- Literaturlisten der Artikel (<section> mit "Literatur" in der Überschrift)
+
+Jedes Werk bekommt eine stabile ID (tang2023, tang2023b, ...). Bestehende
+IDs bleiben bei jedem Lauf erhalten; spätere Stufen (backlinks.py) lesen
+die Zitate aus dieser Tabelle statt jede Seite neu zu parsen.
+
+Gerendert wird ebenfalls aus der Tabelle: Jede erkannte Literaturangabe
+eines Artikels wird zu <li data-ref="ID"> mit der einheitlichen Angabe aus
+render_reference(); ab dann gilt die ID, der Text wird nicht mehr geparst.
+paper_pages.py zeigt die Zitierweise eines Papers aus demselben Eintrag.
+Nicht erkannte Angaben bleiben unverändert.
+
+Verwendung:
+  python3 bibliography.py
+"""
+
+import difflib
+import html
+import json
+import re
+import string
+import unicodedata
+
+from edit_buffer import EditBuffer
+from html_matcher import find_elements
+from safe_write import TreeLocked, tree_lock, write_text
+from site_manifest import BASE_PATH, clean_text, find_pages, load_manifest, normalize_key
+
+BIBLIOGRAPHY_PATH = BASE_PATH / 'papers' / 'bibliography.json'
+
+# Überschriften von Literaturabschnitten
+REFERENCE_HEADINGS = re.compile(r'Literatur|Referenzen|Quellen', re.I)
+
+# Ab dieser Titel-Ähnlichkeit gelten zwei Zitate als dasselbe Werk
+TITLE_MATCH = 0.75
+
+# Gekürzte Titel: alle (mindestens so viele) Wörter kommen im längeren vor
+MIN_SHORT_TITLE_WORDS = 4
+
+# Abkürzungen in gekürzten Titeln
+TITLE_ABBREVIATIONS = {
+    'tha': 'total hip arthroplasty',
+    'tka': 'total knee arthroplasty',
+}
+
+# Felder eines Eintrags in Ausgabereihenfolge
+FIELDS = ('id', 'authors', 'title', 'journal', 'year', 'details', 'doi', 'pmid', 'page', 'cited_in')
+
+# Bei zusammengeführten Zitaten gilt der längere Wert
+MERGE_LONGER = ('authors', 'title', 'journal', 'details')
+
+# Felder, die aus einer Literaturangabe stammen
+CITATION_FIELDS = ('authors', 'title', 'journal', 'year', 'details', 'doi', 'pmid')
+
+_H2 = re.compile(r'<h2[^>]*>(.*?)</h2>', re.S)
+_ITEM = re.compile(r'<li([^>]*)>(.*?)</li>', re.S)
+_REF = re.compile(r'\bdata-ref="([^"]+)"')
+_EM = re.compile(r'<em>(.*?)</em>', re.S)
+_TAGS = re.compile(r'<[^>]+>')
+_DOI = re.compile(r'\b(10\.\d{4,9}/[^\s"<>]+?)[.,;]?(?=\s|$)', re.I)
+_PMID = re.compile(r'\bPMID:?\s*(\d{5,9})', re.I)
+_YEAR = re.compile(r'\b(19\d{2}|20\d{2})\b')
+# Band/Heft/Seiten enden vor DOI oder PMID
+_DETAILS_END = re.compile(r'\s*(?:\bdoi\b|https?://|\bPMID\b|\b10\.\d{4,9}/)', re.I)
+# Erste Seite bzw. Artikelnummer in den Details ('474(2):386-391' -> '386')
+_FIRST_PAGE = re.compile(r':\s*([A-Za-z]?\d+)')
+# Details, die mit Band oder Heft beginnen ('6:194-199', '(354):82-91')
+_VOLUME = re.compile(r'\(?\d')
+# "Haffer H et al." / "Widmer KH, Zurfluh B." - Autoren enden mit Initialen oder et al.
+_AUTHORS = re.compile(r'^(.*?(?:\bet al|\b[A-Z]{1,3}))\.\s+(.*)$', re.S)
+_TITLE_CITATION = re.compile(r'\(([^(),]+?) et al\.?,?\s*(\d{4})\)\s*$')
+_INITIALS = re.compile(r'\s+[A-Z]{1,3}\.?$')
+
+
+class BibliographyError(Exception):
+    """Literaturverzeichnis kann nicht gelesen werden"""
+
+
+# ============================================================================
+# PARSEN
+# ============================================================================
+
+def first_author(authors):
+    """Nachname des Erstautors ('De Vet JR, ...' -> 'De Vet')"""
+    name = re.split(r',|\bet al\b', authors or '', maxsplit=1)[0].strip()
+    return _INITIALS.sub('', name).strip()
+
+
+def id_base(authors, year):
+    """ASCII-Nachname + Jahr, z.B. 'mueller2024'"""
+    surname = normalize_key(first_author(authors))
+    surname = unicodedata.normalize('NFKD', surname).encode('ascii', 'ignore').decode('ascii')
+    return re.sub(r'[^a-z]', '', surname) + str(year or '')
+
+
+def _title_key(title):
+    words = re.sub(r'[^a-z0-9]+', ' ', normalize_key(title or '')).split()
+    return ' '.join(TITLE_ABBREVIATIONS.get(word, word) for word in words)
+
+
+def parse_reference(item_html):
+    """
+    Zerlegt eine Literaturangabe im Vancouver-Stil:
+    'Autoren. Titel. <em>Journal</em> 2020;6:194-199.'
+    Gibt None zurück, wenn weder Autoren noch Jahr erkennbar sind.
+    """
+    text = clean_text(html.unescape(_TAGS.sub('', item_html)))
+    match = _AUTHORS.match(text)
+    if not match:
+        return None
+    authors, rest = match.group(1) + '.', match.group(2)
+
+    journal = None
+    em = _EM.search(item_html)
+    if em:
+        journal = clean_text(html.unescape(_TAGS.sub('', em.group(1)))).rstrip('.')
+        title = rest.split(journal, 1)[0]
+        tail = rest.split(journal, 1)[1] if journal in rest else ''
+    else:
+        year = _YEAR.search(rest)
+        before = rest[:year.start()] if year else rest
+        # Journal = letzter Satz vor dem Jahr
+        parts = [part for part in re.split(r'(?<=[.?!])\s+', before.strip()) if part]
+        if len(parts) >= 2:
+            journal = parts[-1].rstrip('.')
+            title = ' '.join(parts[:-1])
+        else:
+            title = before
+        tail = rest[year.start():] if year else ''
+
+    year = _YEAR.search(tail)
+    if not year:
+        return None
+    doi = _DOI.search(text)
+    pmid = _PMID.search(text)
+    details = tail[year.end():]
+    marker = _DETAILS_END.search(details)
+    if marker:
+        details = details[:marker.start()]
+    return {
+        'authors': authors,
+        'title': title.strip().rstrip('.').strip() or None,
+        'journal': journal or None,
+        'year': int(year.group(1)),
+        'details': details.strip().lstrip(';').strip().rstrip('.').strip() or None,
+        'doi': doi.group(1) if doi else None,
+        'pmid': pmid.group(1) if pmid else None,
+    }
+
+
+def reference_items(page_html):
+    """
+    Literaturangaben aller Literaturabschnitte einer Seite als Treffer
+    (Gruppe 1: Attribute des <li>, Gruppe 2: Inhalt), in Seitenreihenfolge
+    """
+    items = {}
+    for start, end in find_elements(page_html, 'section'):
+        heading = _H2.search(page_html, start, end)
+        if heading and REFERENCE_HEADINGS.search(heading.group(1)):
+            for item in _ITEM.finditer(page_html, start, end):
+                items.setdefault(item.start(), item)
+    return [items[start] for start in sorted(items)]
+
+
+def item_citation(item):
+    """Zitat einer Literaturangabe; mit data-ref trägt es die ID seines Eintrags"""
+    citation = parse_reference(item.group(2))
+    ref = _REF.search(item.group(1))
+    if ref:
+        citation = dict(citation or {}, id=html.unescape(ref.group(1)))
+    return citation
+
+
+def title_citation(page):
+    """(Autoren, Jahr) aus '... (Tang et al., 2023)', nur wenn der Ordnername passt"""
+    match = _TITLE_CITATION.search(page['title'] or '')
+    if not match:
+        return None
+    authors, year = match.group(1).strip(), int(match.group(2))
+    folder = re.sub(r'[^a-z0-9]', '', normalize_key(page['slug']))
+    if not folder.endswith(f"etal{year}") and f"{id_base(authors, '')}etal" not in folder:
+        return None
+    return f"{authors} et al.", year
+
+
+def record_citation(record):
+    return {
+        'authors': record.get('authors') or None,
+        'title': record['title'],
+        'journal': record.get('journal') or None,
+        'year': int(record['year']) if str(record.get('year', '')).isdigit() else None,
+    }
+
+
+# ============================================================================
+# ZUSAMMENFÜHREN
+# ============================================================================
+
+def first_page(details):
+    match = _FIRST_PAGE.search(details or '')
+    return match.group(1).lower() if match else None
+
+
+def same_work(a, b):
+    """
+    Gleicher Erstautor und Jahr vorausgesetzt: DOI, PMID oder ähnlicher
+    Titel - aber nie bei verschiedener erster Seite
+    """
+    for key in ('doi', 'pmid'):
+        if a.get(key) and b.get(key):
+            return a[key].lower() == b[key].lower()
+    pages = first_page(a.get('details')), first_page(b.get('details'))
+    if all(pages) and pages[0] != pages[1]:
+        return False
+    if not a.get('title') or not b.get('title'):
+        return True
+    ta, tb = _title_key(a['title']), _title_key(b['title'])
+    if ta.startswith(tb) or tb.startswith(ta):
+        return True
+    short, long = sorted((set(ta.split()), set(tb.split())), key=len)
+    if len(short) >= MIN_SHORT_TITLE_WORDS and short <= long:
+        return True
+    return difflib.SequenceMatcher(None, ta, tb).ratio() >= TITLE_MATCH
+
+
+class Bibliography:
+    """Einträge mit Lookups nach ID, Paper-Seite und zitierender Seite"""
+
+    __slots__ = ('entries', '_by_id', '_by_base')
+
+    def __init__(self, entries=()):
+        self.entries = []
+        self._by_id = {}
+        self._by_base = {}
+        for entry in entries:
+            self._index(entry)
+
+    def _index(self, entry):
+        self.entries.append(entry)
+        self._by_id[entry['id']] = entry
+        self._by_base.setdefault(id_base(entry['authors'], entry['year']), []).append(entry)
+
+    def entry(self, entry_id):
+        return self._by_id.get(entry_id)
+
+    def find(self, citation):
+        """Vorhandenen Eintrag für ein Zitat oder None (mehrdeutig = None)"""
+        candidates = [
+            entry for entry in self._by_base.get(id_base(citation['authors'], citation['year']), [])
+            if same_work(entry, citation)
+        ]
+        if len(candidates) == 1 or (candidates and citation.get('title')):
+            return candidates[0]
+        return None
+
+    def for_page(self, path):
+        """Eintrag der Paper-Seite path"""
+        return next((entry for entry in self.entries if entry['page'] == path), None)
+
+    def cited_by(self, path):
+        return [entry for entry in self.entries if path in entry['cited_in']]
+
+
+def new_id(base, taken):
+    """base, base+'b', ..., base+'z', dann base-2, base-3, ... - die erste freie ID"""
+    for candidate in [base] + [base + letter for letter in string.ascii_lowercase[1:]]:
+        if candidate not in taken:
+            return candidate
+    n = 2
+    while f'{base}-{n}' in taken:
+        n += 1
+    return f'{base}-{n}'
+
+
+def collect_citations(directory=BASE_PATH):
+    """
+    Alle Zitate als (Zitat, Paper-Seite, zitierende Seite) und die nicht
+    erkannten Literaturangaben als (Seite, Text).
+    """
+    # paper_pages rendert aus dieser Tabelle und importiert dieses Modul
+    from paper_pages import PaperError, find_records, load_record
+
+    citations = []
+    for path in find_records():
+        try:
+            record = load_record(path)
+        except PaperError as e:
+            print(f"  ⚠️  {e}")
+            continue
+        citations.append((record_citation(record), f"{record['parent']}/{record['slug']}/index.html", None))
+
+    unparsed = []
+    for path in find_pages(directory):
+        rel = path.relative_to(directory).as_posix()
+        try:
+            page_html = path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            continue
+        for item in reference_items(page_html):
+            citation = item_citation(item)
+            if citation is None:
+                unparsed.append((rel, clean_text(_TAGS.sub('', item.group(2)))))
+                continue
+            citations.append((citation, None, rel))
+
+    for page in load_manifest().of_kind('paper'):
+        found = title_citation(page)
+        if found:
+            authors, year = found
+            citations.append(({'authors': authors, 'title': None, 'year': year}, page['path'], None))
+
+    return citations, unparsed
+
+
+def build_bibliography(citations, previous):
+    """
+    Führt Zitate zu Einträgen zusammen. Einträge, die es in previous schon
+    gab, behalten ihre ID. Gibt (Bibliography, Anzahl zusammengeführter Zitate) zurück.
+    """
+    result = Bibliography()
+    taken = {entry['id'] for entry in previous.entries}
+    merged = 0
+
+    for citation, page, cited_in in citations:
+        # Gerenderte Angaben tragen die ID ihres Eintrags - sie gilt vor dem Text
+        ref = citation.pop('id', None)
+        if ref and previous.entry(ref) is not None:
+            citation = {field: previous.entry(ref)[field] for field in CITATION_FIELDS}
+        if not citation.get('authors'):
+            continue
+        entry = (ref and result.entry(ref)) or result.find(citation)
+        if entry is None:
+            old = (ref and previous.entry(ref)) or previous.find(citation)
+            if old is not None and result.entry(old['id']) is None:
+                entry_id = old['id']
+            else:
+                entry_id = new_id(id_base(citation['authors'], citation['year']), taken)
+            taken.add(entry_id)
+            entry = dict.fromkeys(FIELDS)
+            entry.update(citation, id=entry_id, cited_in=[])
+            result._index(entry)
+        else:
+            merged += 1
+            # Die vollständigere Angabe gewinnt (alle Autoren, voller Titel, Heft)
+            for field, value in citation.items():
+                if value and (not entry.get(field) or (
+                    field in MERGE_LONGER and len(str(value)) > len(str(entry[field]))
+                )):
+                    entry[field] = value
+        if page:
+            entry['page'] = page
+        if cited_in and cited_in not in entry['cited_in']:
+            entry['cited_in'].append(cited_in)
+
+    result.entries.sort(key=lambda entry: entry['id'])
+    return result, merged
+
+
+def render_reference(entry):
+    """Literaturangabe als HTML: 'Autoren. Titel. <em>Journal</em> Jahr;Details.'"""
+    authors = entry['authors'] if entry['authors'].endswith('.') else entry['authors'] + '.'
+    parts = [html.escape(authors, quote=False)]
+    if entry['title']:
+        title = entry['title'].rstrip('.')
+        title = title if title.endswith(('?', '!')) else title + '.'
+        parts.append(html.escape(title, quote=False))
+    if entry['journal']:
+        parts.append(f"<em>{html.escape(entry['journal'], quote=False)}</em>")
+    source = str(entry['year'] or '')
+    if entry['details']:
+        # Band/Heft mit Semikolon, Zusätze wie "(Poster)" mit Leerzeichen
+        separator = ';' if _VOLUME.match(entry['details']) else ' '
+        source += separator + html.escape(entry['details'], quote=False)
+    if source:
+        parts.append(source + '.')
+    if entry['doi']:
+        doi = html.escape(entry['doi'])
+        parts.append(f'<a href="https://doi.org/{doi}">doi:{doi}</a>')
+    if entry['pmid']:
+        parts.append(f"PMID: {entry['pmid']}")
+    return ' '.join(parts)
+
+
+def render_reference_lists(page_html, bibliography):
+    """
+    Rendert die Literaturlisten einer Seite aus der Tabelle: erkannte
+    Angaben werden zu <li data-ref="ID">, nicht erkannte bleiben stehen
+    """
+    buffer = EditBuffer(page_html)
+    for item in reference_items(page_html):
+        citation = item_citation(item)
+        if citation is None:
+            continue
+        ref = citation.pop('id', None)
+        entry = (ref and bibliography.entry(ref)) or bibliography.find(citation)
+        if entry is None:
+            continue
+        buffer.replace(
+            item.start(), item.end(),
+            f'<li data-ref="{html.escape(entry["id"])}">{render_reference(entry)}</li>'
+        )
+    return buffer.text()
+
+
+def render_pages(bibliography, directory=BASE_PATH):
+    """Schreibt die Literaturlisten aller Seiten neu; Liste der geänderten Seiten"""
+    changed = []
+    for path in find_pages(directory):
+        try:
+            page_html = path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            continue
+        updated = render_reference_lists(page_html, bibliography)
+        if updated != page_html:
+            write_text(path, updated)
+            changed.append(path.relative_to(directory).as_posix())
+    return changed
+
+
+def load_bibliography(path=BIBLIOGRAPHY_PATH):
+    """Liest das Literaturverzeichnis; fehlt die Datei, ist es leer"""
+    try:
+        data = json.loads(path.read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        return Bibliography()
+    except ValueError as e:
+        raise BibliographyError(f"{path.name}: kein gültiges JSON ({e})") from None
+    return Bibliography(data)
+
+
+def store_bibliography(bibliography, path=BIBLIOGRAPHY_PATH):
+    """Schreibt das Verzeichnis, wenn es sich geändert hat. Gibt True zurück, wenn geschrieben."""
+    text = json.dumps(bibliography.entries, ensure_ascii=False, indent=1) + '\n'
+    try:
+        if path.read_text(encoding='utf-8') == text:
+            return False
+    except FileNotFoundError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_text(path, text)
+    return True
+
+
+def main():
+    print("=" * 60)
+    print("📚 Literaturverzeichnis")
+    print("=" * 60)
+
+    try:
+        tree_lock()
+    except TreeLocked as e:
+        print(f"❌ {e}")
+        return
+
+    try:
+        previous = load_bibliography()
+    except BibliographyError as e:
+        print(f"❌ {e}")
+        return
+
+    citations, unparsed = collect_citations()
+    bibliography, merged = build_bibliography(citations, previous)
+    written = store_bibliography(bibliography)
+    rendered = render_pages(bibliography)
+
+    known = {entry['id'] for entry in previous.entries}
+    added = [entry['id'] for entry in bibliography.entries if entry['id'] not in known]
+    removed = known - {entry['id'] for entry in bibliography.entries}
+    for entry_id in added:
+        print(f"  ➕ {entry_id}")
+    for entry_id in sorted(removed):
+        print(f"  ➖ {entry_id}")
+    for rel, text in unparsed:
+        print(f"  ⚠️  {rel}: {text[:60]}")
+    for rel in rendered:
+        print(f"  ✅ {rel}: Literaturliste aus der Tabelle gerendert")
+
+    print("\n" + "=" * 60)
+    print("ZUSAMMENFASSUNG:")
+    print(f"   📚 Einträge: {len(bibliography.entries)} (aus {len(citations)} Zitaten, {merged} zusammengeführt)")
+    print(f"   📄 Paper-Seiten mit ID: {sum(1 for entry in bibliography.entries if entry['page'])}")
+    print(f"   ➕ Neu: {len(added)}   ➖ Entfallen: {len(removed)}")
+    print(f"   📝 Literaturlisten neu gerendert: {len(rendered)} Seiten")
+    if unparsed:
+        print(f"   ⚠️  Nicht erkannt: {len(unparsed)}")
+    print(f"   💾 {BIBLIOGRAPHY_PATH.relative_to(BASE_PATH)}: {'aktualisiert' if written else 'unverändert'}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
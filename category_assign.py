@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Kategorien per Textähnlichkeit vorschlagen
+Bildet aus den Artikeln (und ihren Papern) jeder Kategorie einen
+TF-IDF-Schwerpunkt und ordnet Seiten ohne Kategorie dem nächsten
+Schwerpunkt zu. Zusätzlich werden Artikel gemeldet, deren Text deutlich
+besser zu einer anderen Kategorie passt.
+
+Mit --assign wird die vorgeschlagene Kategorie in den Hero-Bereich der
+Seite geschrieben (<span class="article-category">⚕️ Therapie</span>);
+das Manifest und category_cards.py übernehmen sie von dort.
+
+Die Termhäufigkeiten kommen aus .build/terms.json (Hash pro Seite), nur
+geänderte Seiten werden neu eingelesen.
+
+Verwendung:
+  python3 category_assign.py            # Vorschläge anzeigen
+  python3 category_assign.py --assign   # Vorschläge in die Seiten schreiben
+"""
+
+import argparse
+import re
+
+from safe_write import TreeLocked, tree_lock, write_text
+from site_manifest import BASE_PATH, load_manifest
+from text_vectors import collect_terms, load_term_cache, nearest_centroids, store_term_cache, tfidf_rows
+
+# Seitenarten, deren Kategorie feststeht (Trainingsdaten)
+LABELED_KINDS = ('article', 'paper')
+
+# Mindest-Ähnlichkeit und Abstand zur zweitbesten Kategorie für --assign
+MIN_SCORE = 0.15
+MIN_MARGIN = 0.03
+
+# Seiten mit weniger verschiedenen Wörtern (Platzhalter) werden weder
+# zugeordnet noch für die Schwerpunkte verwendet
+MIN_TERMS = 30
+
+# Abstand, ab dem ein einsortierter Artikel als Abweichung gemeldet wird
+MISMATCH_MARGIN = 0.05
+
+# Breite der Matrix - Schwerpunkte vergleichen alle Terme einer Seite,
+# nicht nur die stärksten (Aufwand linear in der Textlänge)
+MAX_FEATURES = 4096
+
+_HERO_CATEGORY = re.compile(r'(<span class="article-category">)(.*?)(</span>)', re.S)
+
+
+def page_label(page, manifest):
+    """Kategorie-Index einer Seite (Paper erben die ihres Artikels) oder None"""
+    if page['kind'] not in LABELED_KINDS:
+        return None
+    category = manifest.category(page['path'])
+    return manifest.categories.index(category) if category is not None else None
+
+
+def has_text(entry):
+    return len(entry['terms']) >= MIN_TERMS
+
+
+def classify(manifest, pages, entries):
+    """Pro Seite die Kategorien als (Index, Ähnlichkeit), beste zuerst"""
+    documents = [entries[page['path']]['terms'] for page in pages]
+    training = [
+        page_label(page, manifest) if has_text(entries[page['path']]) else None
+        for page in pages
+    ]
+    vocabulary, rows = tfidf_rows(documents, max_features=MAX_FEATURES)
+    return nearest_centroids(rows, training, len(vocabulary))
+
+
+def is_confident(ranking):
+    if not ranking:
+        return False
+    best = ranking[0][1]
+    runner_up = ranking[1][1] if len(ranking) > 1 else 0.0
+    return best >= MIN_SCORE and best - runner_up >= MIN_MARGIN
+
+
+def set_hero_category(page_html, label):
+    """Ersetzt die Kategorie im Hero-Bereich; ohne Hero-Kategorie None"""
+    if not _HERO_CATEGORY.search(page_html):
+        return None
+    return _HERO_CATEGORY.sub(lambda m: m.group(1) + label + m.group(3), page_html, count=1)
+
+
+def category_label(category):
+    return f"{category['icon']} {category['name']}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kategorien für Seiten ohne Kategorie vorschlagen")
+    parser.add_argument('--assign', action='store_true', help="Vorschläge in die Seiten schreiben")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("🧭 Kategorie-Vorschläge")
+    print("=" * 60)
+
+    if args.assign:
+        try:
+            tree_lock()
+        except TreeLocked as e:
+            print(f"❌ {e}")
+            return
+
+    manifest = load_manifest()
+    pages = [
+        page for page in manifest.pages
+        if page['kind'] in LABELED_KINDS or page['kind'] == 'unlisted'
+    ]
+    texts, entries, scanned = collect_terms([page['path'] for page in pages], load_term_cache())
+    store_term_cache(entries)
+    pages = [page for page in pages if page['path'] in texts]
+
+    rankings = classify(manifest, pages, entries)
+
+    proposals = []
+    mismatches = []
+    placeholders = []
+    for page, ranking in zip(pages, rankings):
+        label = page_label(page, manifest)
+        if not ranking or not has_text(entries[page['path']]):
+            # Ohne Text gibt es nichts einzuordnen - weder Vorschlag noch Abweichung
+            if label is None:
+                placeholders.append(page)
+            continue
+        best, score = ranking[0]
+        if label is None:
+            proposals.append((page, best, score, is_confident(ranking)))
+        elif page['kind'] == 'article' and best != label:
+            own = dict(ranking)[label]
+            if score - own >= MISMATCH_MARGIN:
+                mismatches.append((page, label, best, score - own))
+
+    assigned = 0
+    if proposals:
+        print("\n📄 Seiten ohne Kategorie:")
+    for page, best, score, confident in proposals:
+        label = category_label(manifest.categories[best])
+        marker = '✅' if confident else '❔'
+        print(f"  {marker} {page['path']} → {label} ({score:.2f})")
+        if not (args.assign and confident):
+            continue
+        updated = set_hero_category(texts[page['path']], label)
+        if updated is None:
+            print("     ⚠️  Kein Hero-Bereich mit Kategorie - bitte von Hand eintragen")
+            continue
+        if updated != texts[page['path']]:
+            write_text(BASE_PATH / page['path'], updated)
+            assigned += 1
+
+    if placeholders:
+        print("\n📭 Zu wenig Text für einen Vorschlag:")
+        for page in placeholders:
+            print(f"  {page['path']}")
+
+    if mismatches:
+        print("\n🔀 Artikel, die besser woanders passen:")
+        for page, label, best, margin in mismatches:
+            current = manifest.categories[label]['name']
+            print(f"  {page['path']}: {current} → {manifest.categories[best]['name']} (+{margin:.2f})")
+
+    print("\n" + "=" * 60)
+    print("ZUSAMMENFASSUNG:")
+    print(f"   📄 Seiten: {len(pages)} ({scanned} neu eingelesen)")
+    print(f"   🧭 Ohne Kategorie: {len(proposals) + len(placeholders)} ({len(placeholders)} mit zu wenig Text)")
+    print(f"   🔀 Abweichungen: {len(mismatches)}")
+    if args.assign:
+        print(f"   ✅ Zugeordnet: {assigned}")
+        if assigned:
+            print("   👉 Jetzt category_cards.py ausführen, um die Karten zu aktualisieren")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Kategorie-Karten der Übersichtsseite erzeugen
+Rendert die Karten in huefte/index.html (Titel, Kurzbeschreibung aus dem
+ersten Absatz jedes Artikels, Anzahl) aus dem Site-Manifest und hält die
+Artikel-Zählung in der README aktuell.
+
+Nur Karten, deren Inhalt sich geändert hat, werden in der Seite ersetzt.
+Ein neuer Artikel braucht keinen manuellen Eintrag: Die Kategorie im
+Hero-Bereich (<span class="article-category">⚕️ Therapie</span>) reicht.
+
+Verwendung:
+  python3 category_cards.py
+"""
+
+import html
+import posixpath
+
+from html_matcher import find_elements
+from page_blocks import set_block, wrap
+from safe_write import TreeLocked, tree_lock, write_text
+from site_manifest import BASE_PATH, CARD_START, OVERVIEW_PAGE, build_manifest
+from template_engine import get_template
+
+README_PATH = BASE_PATH / 'README.md'
+
+CARD_TEMPLATE = 'partials/category_card'
+ARTICLE_TEMPLATE = 'partials/category_article'
+
+_SUMMARY = '<small class="article-summary">{}</small>'
+
+
+def escape(text):
+    return html.escape(text, quote=False)
+
+
+def render_article(article, page):
+    """Ein Artikel-Link der Karte"""
+    summary = page['summary'] if page else ''
+    return get_template(ARTICLE_TEMPLATE).render(
+        href=html.escape(posixpath.relpath(article['path'], posixpath.dirname(OVERVIEW_PAGE))),
+        name=escape(article['name']),
+        summary=_SUMMARY.format(escape(summary)) if summary else ''
+    )
+
+
+def render_card(category, manifest):
+    """Eine Kategorie-Karte; Links auf fehlende Seiten entfallen"""
+    links = []
+    for article in category['articles']:
+        page = manifest.page(article['path'])
+        if page is None:
+            print(f"  ⚠️  {category['name']}: {article['path']} fehlt - Link entfernt")
+            continue
+        links.append(render_article(article, page))
+
+    return get_template(CARD_TEMPLATE).render_text(
+        icon=category['icon'],
+        name=escape(category['name']),
+        count=len(links),
+        description=escape(category['description']),
+        articles=b'\n'.join(links)
+    )
+
+
+def update_cards(page_html, manifest):
+    """
+    Ersetzt geänderte Karten in der Übersichtsseite.
+    Gibt (html, Namen der geänderten Kategorien) zurück.
+    """
+    spans = find_elements(page_html, 'div', CARD_START)
+    if len(spans) != len(manifest.categories):
+        raise ValueError(f"{len(spans)} Karten in der Seite, {len(manifest.categories)} im Manifest")
+
+    parts = []
+    changed = []
+    pos = 0
+    for (start, end), category in zip(spans, manifest.categories):
+        card = render_card(category, manifest)
+        parts.append(page_html[pos:start])
+        parts.append(card)
+        if card != page_html[start:end]:
+            changed.append(category['name'])
+        pos = end
+    parts.append(page_html[pos:])
+    return ''.join(parts), changed
+
+
+def _count_label(category, manifest):
+    count = sum(1 for article in category['articles'] if manifest.page(article['path']))
+    return f"{category['name']} ({count} Artikel)"
+
+
+def readme_blocks(manifest):
+    """Inhalt der generierten README-Blöcke (<!-- generated:NAME -->...<!-- /generated:NAME -->)"""
+    overview = [f"{len(manifest.categories)} Kategorien in 2-Spalten-Layout:"]
+    for category in manifest.categories:
+        overview.append(f"- {category['icon']} {_count_label(category, manifest)}")
+
+    articles = []
+    for category in manifest.categories:
+        if articles:
+            articles.append('')
+        articles.append(f"### {_count_label(category, manifest)}")
+        for article in category['articles']:
+            if manifest.page(article['path']):
+                articles.append(f"- {article['path']}")
+
+    return {
+        'category-overview': '\n'.join(overview),
+        'category-articles': '\n'.join(articles),
+    }
+
+
+def update_readme(manifest):
+    """Aktualisiert die Artikel-Zählung in der README. Gibt True zurück, wenn geändert."""
+    try:
+        text = README_PATH.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        return False
+
+    updated = text
+    for name, content in readme_blocks(manifest).items():
+        updated = set_block(updated, name, wrap(name, content), anchor=None)
+    if updated == text:
+        return False
+    write_text(README_PATH, updated)
+    return True
+
+
+def main():
+    print("=" * 60)
+    print("🗂️  Kategorie-Karten")
+    print("=" * 60)
+
+    try:
+        tree_lock()
+    except TreeLocked as e:
+        print(f"❌ {e}")
+        return
+
+    manifest = build_manifest()
+    overview = BASE_PATH / OVERVIEW_PAGE
+    page_html = overview.read_text(encoding='utf-8')
+
+    try:
+        updated, changed = update_cards(page_html, manifest)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+
+    if updated != page_html:
+        write_text(overview, updated)
+    for name in changed:
+        print(f"  ✅ {name}")
+
+    readme = update_readme(manifest)
+
+    print("\n" + "=" * 60)
+    print("ZUSAMMENFASSUNG:")
+    print(f"   🗂️  Kategorien: {len(manifest.categories)}")
+    print(f"   ✅ Geänderte Karten: {len(changed)}")
+    print(f"   📝 README: {'aktualisiert' if readme else 'unverändert'}")
+    unlisted = manifest.of_kind('unlisted')
+    if unlisted:
+        print(f"   ⚠️  Ohne Kategorie: {', '.join(page['path'] for page in unlisted)}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Lange Artikel in Abschnitten ausliefern
+Schreibt in einem Deploy-Verzeichnis (reachability.py --export) lange
+Artikel und Paper um: die ersten INLINE_SECTIONS Abschnitte bleiben in der
+Seite, alle weiteren werden nach abschnitte/<id>.html ausgelagert. In der
+Seite bleibt pro Abschnitt nur <section id> mit Überschrift stehen, so dass
+Inhaltsverzeichnis und Deep Links (#3-planung) weiter funktionieren.
+
+Ein Skript (templates/chunk_loader.html) lädt die Abschnitte kurz bevor sie
+in den Viewport kommen, beim Klick ins Inhaltsverzeichnis und bei Deep
+Links nach; content-visibility spart das Layout nicht sichtbarer
+Abschnitte. Der Scroll-Spy der Seite wird durch einen IntersectionObserver
+ersetzt.
+
+Die Quellseiten bleiben unverändert - Glossar, Link-Graph und Textanalysen
+brauchen den vollständigen Text.
+
+Verwendung:
+  python3 reachability.py --export
+  python3 chunk_articles.py               # .build/deploy umschreiben
+  python3 chunk_articles.py ../site       # anderes Deploy-Verzeichnis
+"""
+
+import argparse
+import html
+import posixpath
+import re
+from pathlib import Path
+
+from auto_links import content_region
+from html_matcher import find_elements, remove_spans
+from page_blocks import block_spans, end_marker, find_block, set_block, start_marker
+from reachability import DEPLOY_PATH
+from safe_write import write_text
+from site_manifest import load_manifest
+from template_engine import get_template
+
+BLOCK_NAME = 'chunks'
+LOADER_TEMPLATE = 'chunk_loader'
+
+# Seitenarten, die aufgeteilt werden
+CHUNK_KINDS = ('article', 'paper')
+
+# Ab dieser Länge des Inhalts (Zeichen in <article>) wird aufgeteilt
+CHUNK_MIN_LENGTH = 24 * 1024
+
+# Abschnitte, die direkt in der Seite bleiben
+INLINE_SECTIONS = 2
+
+# Unterverzeichnis der ausgelagerten Abschnitte (relativ zur Seite)
+FRAGMENT_DIR = 'abschnitte'
+
+_SECTION_WITH_ID = re.compile(r'<section\b[^>]*\bid="([\w-]+)"', re.I)
+_HEADING = re.compile(r'<h2\b[^>]*>.*?</h2>', re.I | re.S)
+_LEADING_BLANK_LINES = re.compile(r'^(?:[ \t]*\n)+')
+_LEGACY_SPY = "window.addEventListener('scroll', updateActiveToc)"
+
+
+def article_sections(page_html):
+    """(start, end, id) der äußersten Abschnitte mit id im Inhalt, ohne generierte Blöcke"""
+    region = content_region(page_html)
+    if region is None:
+        return []
+    blocks = block_spans(page_html)
+    sections = []
+    for start, end in find_elements(page_html, 'section', _SECTION_WITH_ID):
+        if start < region[0] or end > region[1]:
+            continue
+        if any(b_start <= start < b_end for b_start, b_end in blocks):
+            continue
+        sections.append((start, end, _SECTION_WITH_ID.match(page_html, start).group(1)))
+    return sections
+
+
+def split_section(page_html, start, end, fragment):
+    """(Platzhalter, Fragment): Start-Tag und Überschrift bleiben, der Rest wird ausgelagert"""
+    open_end = page_html.index('>', start) + 1
+    close = page_html.rindex('</section>', start, end)
+    heading = _HEADING.search(page_html, open_end, close)
+    body_start = heading.end() if heading and not page_html[open_end:heading.start()].strip() else open_end
+    start_tag = page_html[start:open_end - 1] + f' data-fragment="{html.escape(fragment)}">'
+    line_start = page_html.rfind('\n', 0, start) + 1
+    indent = page_html[line_start:start] if not page_html[line_start:start].strip() else ''
+    placeholder = (
+        start_tag + page_html[open_end:body_start] + '\n'
+        f'{indent}    <p class="deferred-fallback"><a href="{html.escape(fragment)}">Abschnitt laden …</a></p>\n'
+        f'{indent}</section>'
+    )
+    return placeholder, _LEADING_BLANK_LINES.sub('', page_html[body_start:close]).rstrip() + '\n'
+
+
+def loader_block():
+    script = get_template(LOADER_TEMPLATE).render_text()
+    return f'{start_marker(BLOCK_NAME)}\n{script}\n    {end_marker(BLOCK_NAME)}'
+
+
+def remove_legacy_spy(page_html):
+    """Entfernt den Scroll-Spy, der bei jedem Scroll-Ereignis alle Abschnitte misst"""
+    spans = []
+    for start, end in find_elements(page_html, 'script'):
+        if _LEGACY_SPY in page_html[start:end]:
+            while start > 0 and page_html[start - 1] in ' \t':
+                start -= 1
+            if page_html.startswith('\n', end):
+                end += 1
+            spans.append((start, end))
+    return remove_spans(page_html, spans)
+
+
+def chunk_page(page_html, min_length=CHUNK_MIN_LENGTH, inline=INLINE_SECTIONS):
+    """(neue Seite, {Dateiname: Fragment}) oder (Seite, {}), wenn nichts aufzuteilen ist"""
+    if find_block(page_html, BLOCK_NAME) is not None:
+        return page_html, {}
+    region = content_region(page_html)
+    sections = article_sections(page_html)
+    if region is None or region[1] - region[0] < min_length or len(sections) <= inline:
+        return page_html, {}
+
+    parts = []
+    fragments = {}
+    pos = 0
+    for start, end, section_id in sections[inline:]:
+        name = f'{section_id}.html'
+        placeholder, fragments[name] = split_section(page_html, start, end, posixpath.join(FRAGMENT_DIR, name))
+        parts.append(page_html[pos:start])
+        parts.append(placeholder)
+        pos = end
+    parts.append(page_html[pos:])
+    new_html = remove_legacy_spy(''.join(parts))
+    return set_block(new_html, BLOCK_NAME, loader_block(), anchor='</body>'), fragments
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lange Artikel im Deploy-Verzeichnis in Abschnitte aufteilen")
+    parser.add_argument('directory', nargs='?', default=str(DEPLOY_PATH), metavar='VERZEICHNIS',
+                        help="Deploy-Verzeichnis (Standard: .build/deploy)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("✂️  Lange Artikel aufteilen")
+    print("=" * 60)
+
+    directory = Path(args.directory)
+    if not directory.is_dir():
+        print(f"❌ {directory} fehlt - zuerst: python3 reachability.py --export")
+        return
+
+    chunked = 0
+    fragment_count = 0
+    saved = 0
+    for page in load_manifest().of_kind(*CHUNK_KINDS):
+        path = directory / page['path']
+        if not path.is_file():
+            continue
+        page_html = path.read_text(encoding='utf-8')
+        new_html, fragments = chunk_page(page_html)
+        if not fragments:
+            continue
+        fragment_dir = path.parent / FRAGMENT_DIR
+        fragment_dir.mkdir(exist_ok=True)
+        for name, fragment in fragments.items():
+            write_text(fragment_dir / name, fragment)
+        write_text(path, new_html)
+        chunked += 1
+        fragment_count += len(fragments)
+        saved += len(page_html) - len(new_html)
+        print(f"  ✂️  {page['path']} ({len(fragments)} Abschnitte ausgelagert, {len(new_html) // 1024} KB statt {len(page_html) // 1024} KB)")
+
+    print("\n" + "=" * 60)
+    print("ZUSAMMENFASSUNG:")
+    print(f"   ✂️  Aufgeteilt: {chunked} Seiten")
+    print(f"   📄 Ausgelagerte Abschnitte: {fragment_count}")
+    print(f"   📉 Erste Antwort kleiner um: {saved / 1024:.0f} KB")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
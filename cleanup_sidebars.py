@@ -8,25 +8,32 @@ Bereinigt Artikel:
 import re
 from pathlib import Path
 
+from edit_buffer import EditBuffer
+from html_matcher import Budget, MatcherTimeout, find_elements
+from safe_write import TreeLocked, tree_lock, write_text
+from site_manifest import load_manifest
 
-def remove_second_sidebar(html):
+SIDEBAR_START = re.compile(r'<aside\s+class=["\']sidebar["\']', re.IGNORECASE)
+
+
+def remove_second_sidebar(html, budget=None):
     """Entfernt das 2. <aside class="sidebar"> Element"""
     
-    # Finde alle <aside class="sidebar">...</aside> Blöcke
-    pattern = r'<aside\s+class=["\']sidebar["\'][^>]*>.*?</aside>'
-    matches = list(re.finditer(pattern, html, re.DOTALL | re.IGNORECASE))
+    # Finde alle <aside class="sidebar">...</aside> Blöcke (linear, mit Verschachtelung)
+    matches = find_elements(html, 'aside', SIDEBAR_START, budget)
     
     if len(matches) < 2:
         # Weniger als 2 Sidebars gefunden
         return html, False
     
     # Entferne das 2. Match (Index 1)
-    second_sidebar = matches[1]
+    start, end = matches[1]
     
-    # Schneide das 2. Sidebar-Element heraus
-    cleaned = html[:second_sidebar.start()] + html[second_sidebar.end():]
+    # Schneide das 2. Sidebar-Element heraus (eine Kopie der Seite)
+    buffer = EditBuffer(html)
+    buffer.remove(start, end)
     
-    return cleaned, True
+    return buffer.text(), True
 
 
 def clean_article(filepath):
@@ -38,20 +45,18 @@ def clean_article(filepath):
             html = f.read()
         
         # Entferne 2. Sidebar
-        cleaned, removed = remove_second_sidebar(html)
+        cleaned, removed = remove_second_sidebar(html, Budget())
         
         if removed:
             print(f"   🗑️  2. Sidebar entfernt")
             
             # Backup erstellen
             backup = filepath.with_suffix('.html.backup')
-            with open(backup, 'w', encoding='utf-8') as f:
-                f.write(html)
+            write_text(backup, html)
             print(f"   💾 Backup erstellt")
             
             # Schreibe bereinigte Version
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(cleaned)
+            write_text(filepath, cleaned)
             
             print(f"   ✅ Bereinigt")
             return True
@@ -59,6 +64,9 @@ def clean_article(filepath):
             print(f"   ℹ️  Keine 2. Sidebar gefunden")
             return False
         
+    except MatcherTimeout as e:
+        print(f"   ⏱️  Übersprungen: {e}")
+        return False
     except Exception as e:
         print(f"   ❌ Fehler: {e}")
         return False
@@ -98,6 +106,13 @@ def main():
     print("=" * 70)
     print("🔧 ARTIKEL-BEREINIGUNG")
     print("=" * 70)
+
+    try:
+        tree_lock()
+    except TreeLocked as e:
+        print(f"❌ {e}")
+        return
+
     print()
     print("1. Löscht alle .backup und .backup2 Dateien")
     print("2. Entfernt 2. <aside class='sidebar'> aus jedem Artikel")
@@ -123,7 +138,7 @@ def main():
     print()
     
     # Finde Artikel
-    exclude = {'index.html', 'huefte.html', 'hufte.html'}
+    exclude = load_manifest().skip_names
     files = [f for f in cwd.glob('*.html') 
              if f.name.lower() not in exclude 
              and not f.name.endswith('.backup')
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Statische JSON-API der Inhalte
+Schreibt für jeden Artikel und jedes Paper eine JSON-Datei unter api/, die
+den Pfad der Seite spiegelt (rosa/index.html -> api/rosa/index.json):
+
+    {"version": 1, "path", "slug", "kind", "title", "category", "parent",
+     "summary", "hash", "sections": [{"id", "title", "headings", "text",
+     "links"}], "links": [...]}
+
+dazu einen seitenweisen Index (api/index.json, api/index-2.json, ...).
+App und Foliengenerator lesen so kleine, strukturierte Dateien statt die
+Seiten mit Regexen auszulesen.
+
+Inkrementell: .build/content_api.json merkt sich pro Seite einen Hash über
+den Inhalt (ohne generierte Blöcke, wie text_vectors.content_hash) und die
+Angaben aus dem Manifest (Titel, Kategorie, Parent, Kurzbeschreibung). Nur
+geänderte Seiten werden neu geschrieben - auch wenn sich nur eine Karte in
+der Übersicht ändert; Dateien gelöschter Seiten werden entfernt.
+
+Verwendung:
+  python3 content_api.py          # API aktualisieren
+  python3 content_api.py --all    # alle Dateien neu schreiben
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import posixpath
+import re
+
+from auto_links import content_region
+from chunk_articles import article_sections
+from html_matcher import find_elements
+from link_graph import content_links, resolve_link
+from page_blocks import strip_blocks
+from safe_write import TreeLocked, tree_lock, write_text
+from site_manifest import BASE_PATH, load_manifest
+from text_vectors import content_hash, html_text
+
+API_DIR = BASE_PATH / 'api'
+API_VERSION = 1
+
+STATE_PATH = BASE_PATH / '.build' / 'content_api.json'
+
+# Seitenarten mit eigener JSON-Datei
+API_KINDS = ('article', 'paper')
+
+# Einträge pro Index-Seite
+INDEX_PAGE_SIZE = 25
+
+# Abschnitt für Seiten ohne <section id>
+DEFAULT_SECTION = 'inhalt'
+
+_HEADING = re.compile(r'<h([2-4])\b([^>]*)>(.*?)</h\1>', re.I | re.S)
+_ID = re.compile(r'\bid\s*=\s*(["\'])(.*?)\1', re.I | re.S)
+_LINK = re.compile(r'<a\b([^>]*)>(.*?)</a>', re.I | re.S)
+_HREF = re.compile(r'\bhref\s*=\s*(["\'])(.*?)\1', re.I | re.S)
+_EXTERNAL = re.compile(r'^(?:https?:)?//', re.I)
+
+
+def api_path(rel):
+    """Relativer Pfad der JSON-Datei unter api/ für eine Seite"""
+    return posixpath.splitext(rel)[0] + '.json'
+
+
+def section_links(fragment, rel):
+    """Links eines Abschnitts als {"text", "target"}: Seitenpfad oder externe URL"""
+    links = []
+    for match in _LINK.finditer(fragment):
+        href = _HREF.search(match.group(1))
+        if not href:
+            continue
+        target = resolve_link(href.group(2), rel)
+        if target is None:
+            url = html.unescape(href.group(2).strip())
+            if not _EXTERNAL.match(url):
+                continue
+            target = url
+        links.append({'text': html_text(match.group(2)), 'target': target})
+    return links
+
+
+def parse_section(fragment, rel, section_id):
+    """Abschnitt mit Titel (erstes h2), Unterüberschriften, Text und Links"""
+    title = None
+    body = fragment
+    headings = []
+    for match in _HEADING.finditer(fragment):
+        text = html_text(match.group(3))
+        if match.group(1) == '2' and title is None:
+            title = text
+            body = fragment[:match.start()] + fragment[match.end():]
+            continue
+        heading_id = _ID.search(match.group(2))
+        headings.append({
+            'id': html.unescape(heading_id.group(2)) if heading_id else None,
+            'level': int(match.group(1)),
+            'title': text,
+        })
+    return {
+        'id': section_id,
+        'title': title,
+        'headings': headings,
+        'text': html_text(body),
+        'links': section_links(fragment, rel),
+    }
+
+
+def page_sections(page_html, rel):
+    """Abschnitte im Inhalt; ohne <section id> ist der ganze Inhalt ein Abschnitt"""
+    page_html = strip_blocks(page_html)
+    sections = article_sections(page_html)
+    if sections:
+        return [parse_section(page_html[start:end], rel, section_id) for start, end, section_id in sections]
+    region = content_region(page_html) or (find_elements(page_html, 'body') or [None])[0]
+    if region is None:
+        return []
+    return [parse_section(page_html[region[0]:region[1]], rel, DEFAULT_SECTION)]
+
+
+def category_info(manifest, rel):
+    category = manifest.category(rel)
+    if category is None:
+        return None
+    return {'name': category['name'], 'short': category['short'], 'icon': category['icon']}
+
+
+def page_metadata(page, manifest):
+    """Angaben aus dem Manifest, die ohne Änderung der Seite wechseln können"""
+    parent = manifest.parent(page['path'])
+    return {
+        'path': page['path'],
+        'slug': page['slug'],
+        'kind': page['kind'],
+        'title': page['title'],
+        'category': category_info(manifest, page['path']),
+        'parent': parent['path'] if parent else None,
+        'summary': page['summary'],
+    }
+
+
+def state_key(metadata, digest):
+    """Hash über Inhalt und Manifest-Angaben - Grundlage für den Zustand"""
+    data = json.dumps([metadata, digest], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def build_document(metadata, page_html, digest):
+    return {
+        'version': API_VERSION,
+        **metadata,
+        'hash': digest,
+        'sections': page_sections(page_html, metadata['path']),
+        'links': content_links(page_html, metadata['path']),
+    }
+
+
+def index_pages(manifest, pages, digests, size=INDEX_PAGE_SIZE):
+    """Index-Dateien {Name: Inhalt}, sortiert nach Pfad"""
+    items = [
+        {
+            'path': page['path'],
+            'api': api_path(page['path']),
+            'kind': page['kind'],
+            'title': page['title'],
+            'category': (category_info(manifest, page['path']) or {}).get('short'),
+            'summary': page['summary'],
+            'hash': digests[page['path']],
+        }
+        for page in sorted(pages, key=lambda page: page['path'])
+    ]
+    count = max(1, -(-len(items) // size))
+    names = ['index.json'] + [f'index-{number}.json' for number in range(2, count + 1)]
+    return {
+        name: {
+            'version': API_VERSION,
+            'page': number + 1,
+            'pages': count,
+            'total': len(items),
+            'next': names[number + 1] if number + 1 < count else None,
+            'items': items[number * size:(number + 1) * size],
+        }
+        for number, name in enumerate(names)
+    }
+
+
+def write_json(path, data):
+    """Schreibt nur bei Änderung; True, wenn geschrieben wurde"""
+    text = json.dumps(data, ensure_ascii=False, indent=1) + '\n'
+    try:
+        if path.read_text(encoding='utf-8') == text:
+            return False
+    except FileNotFoundError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_text(path, text)
+    return True
+
+
+def load_state():
+    try:
+        data = json.loads(STATE_PATH.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if data.get('version') != API_VERSION:
+        return {}
+    return data['pages']
+
+
+def store_state(pages):
+    try:
+        STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        write_text(STATE_PATH, json.dumps({'version': API_VERSION, 'pages': pages}, ensure_ascii=False))
+    except OSError:
+        # Ohne Zustand wird beim nächsten Mal alles neu geschrieben
+        pass
+
+
+def remove_stale(keep):
+    """Entfernt JSON-Dateien unter api/, die zu keiner Seite mehr gehören"""
+    removed = []
+    for path in sorted(API_DIR.rglob('*.json'), reverse=True):
+        rel = path.relative_to(API_DIR).as_posix()
+        if rel not in keep:
+            path.unlink()
+            removed.append(rel)
+    for directory in sorted((d for d in API_DIR.rglob('*') if d.is_dir()), reverse=True):
+        if not any(directory.iterdir()):
+            directory.rmdir()
+    return removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON-Dateien der Inhalte schreiben")
+    parser.add_argument('--all', action='store_true', help="alle Dateien neu schreiben")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("🧾 JSON-API")
+    print("=" * 60)
+
+    try:
+        tree_lock()
+    except TreeLocked as e:
+        print(f"❌ {e}")
+        return
+
+    manifest = load_manifest()
+    previous = {} if args.all else load_state()
+    state = {}
+    digests = {}
+    pages = []
+    written = 0
+    for page in manifest.of_kind(*API_KINDS):
+        path = BASE_PATH / page['path']
+        try:
+            page_html = path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"  ⚠️  {page['path']}: {e}")
+            continue
+        pages.append(page)
+        digest = digests[page['path']] = content_hash(page_html)
+        metadata = page_metadata(page, manifest)
+        key = state[page['path']] = state_key(metadata, digest)
+        target = API_DIR / api_path(page['path'])
+        if previous.get(page['path']) == key and target.is_file():
+            continue
+        if write_json(target, build_document(metadata, page_html, digest)):
+            written += 1
+            print(f"  ✅ {api_path(page['path'])}")
+
+    indexes = index_pages(manifest, pages, digests)
+    for name, data in indexes.items():
+        write_json(API_DIR / name, data)
+    removed = remove_stale({api_path(page['path']) for page in pages} | set(indexes))
+    for rel in removed:
+        print(f"  ➖ {rel}")
+    store_state(state)
+
+    print("\n" + "=" * 60)
+    print("ZUSAMMENFASSUNG:")
+    print(f"   📄 Seiten: {len(pages)}")
+    print(f"   ✅ Neu geschrieben: {written}")
+    print(f"   ⏭️  Unverändert: {len(pages) - written}")
+    print(f"   🗂️  Index: {len(indexes)} Seite(n) à {INDEX_PAGE_SIZE}")
+    if removed:
+        print(f"   ➖ Entfernt: {len(removed)}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,326 +8,16 @@ import os
 import re
 from pathlib import Path
 
-# HTML-Template mit Sidebar-Navigation
-ARTICLE_TEMPLATE = '''<!DOCTYPE html>
-<html lang="de">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title} - Orthopedic Knowledge Base</title>
-    <link rel="stylesheet" href="styles.css">
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
+from html_matcher import Budget, MatcherTimeout, remove_elements
+from minify_html import minify_output
+from safe_write import TreeLocked, tree_lock, write_text
+from site_manifest import load_manifest
+from template_engine import get_template
 
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-            line-height: 1.6;
-            color: #333;
-            background: #f5f5f5;
-        }}
+BACK_LINK_START = re.compile(r'<a[^>]*zurück', re.IGNORECASE)
 
-        /* Header */
-        .header {{
-            background: white;
-            border-bottom: 2px solid #e0e0e0;
-            padding: 1rem 2rem;
-            position: sticky;
-            top: 0;
-            z-index: 1000;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-        }}
-
-        .header-content {{
-            max-width: 1400px;
-            margin: 0 auto;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }}
-
-        .logo {{
-            font-size: 1.5rem;
-            font-weight: bold;
-            color: #2563eb;
-            text-decoration: none;
-        }}
-
-        .nav-links {{
-            display: flex;
-            gap: 2rem;
-        }}
-
-        .nav-links a {{
-            color: #666;
-            text-decoration: none;
-            font-weight: 500;
-        }}
-
-        .nav-links a:hover {{
-            color: #2563eb;
-        }}
-
-        /* Breadcrumbs */
-        .breadcrumbs {{
-            background: white;
-            padding: 0.75rem 2rem;
-            border-bottom: 1px solid #e0e0e0;
-            font-size: 0.9rem;
-        }}
-
-        .breadcrumbs-content {{
-            max-width: 1400px;
-            margin: 0 auto;
-            color: #666;
-        }}
-
-        .breadcrumbs a {{
-            color: #2563eb;
-            text-decoration: none;
-        }}
-
-        .breadcrumbs a:hover {{
-            text-decoration: underline;
-        }}
-
-        /* Main Layout */
-        .main-container {{
-            max-width: 1400px;
-            margin: 2rem auto;
-            padding: 0 2rem;
-            display: grid;
-            grid-template-columns: 280px 1fr;
-            gap: 2rem;
-        }}
-
-        /* Sidebar Navigation */
-        .sidebar {{
-            position: sticky;
-            top: 100px;
-            height: fit-content;
-            background: white;
-            border: 1px solid #e0e0e0;
-            border-radius: 8px;
-            padding: 1.5rem;
-        }}
-
-        .sidebar h3 {{
-            font-size: 0.9rem;
-            color: #666;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            margin-bottom: 1rem;
-            font-weight: 600;
-        }}
-
-        .toc-list {{
-            list-style: none;
-        }}
-
-        .toc-item {{
-            margin-bottom: 0.5rem;
-        }}
-
-        .toc-link {{
-            display: block;
-            padding: 0.5rem;
-            color: #333;
-            text-decoration: none;
-            border-radius: 4px;
-            font-size: 0.9rem;
-            transition: all 0.2s;
-        }}
-
-        .toc-link:hover {{
-            background: #f0f9ff;
-            color: #2563eb;
-        }}
-
-        .toc-link.active {{
-            background: #e0f2fe;
-            color: #2563eb;
-            font-weight: 500;
-        }}
-
-        /* Article Content */
-        .article {{
-            background: white;
-            border: 1px solid #e0e0e0;
-            border-radius: 8px;
-            padding: 2rem;
-        }}
-
-        .article h1 {{
-            font-size: 2rem;
-            color: #000;
-            margin-bottom: 1.5rem;
-            font-weight: 600;
-        }}
-
-        .article h2 {{
-            font-size: 1.5rem;
-            color: #000;
-            margin-top: 2rem;
-            margin-bottom: 0.75rem;
-            font-weight: 600;
-        }}
-
-        .article h3 {{
-            font-size: 1.2rem;
-            color: #000;
-            margin-top: 1.5rem;
-            margin-bottom: 0.5rem;
-            font-weight: 600;
-        }}
-
-        .article h4 {{
-            font-size: 1rem;
-            color: #000;
-            margin-top: 1rem;
-            margin-bottom: 0.5rem;
-            font-weight: 600;
-        }}
-
-        .article p {{
-            margin-bottom: 0.75rem;
-            line-height: 1.6;
-        }}
-
-        .article ul,
-        .article ol {{
-            margin-bottom: 0.75rem;
-            padding-left: 1.5rem;
-        }}
-
-        .article li {{
-            margin-bottom: 0.25rem;
-            line-height: 1.6;
-        }}
-
-        .article strong {{
-            font-weight: 600;
-        }}
-
-        .article table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin: 1rem 0;
-            border: 1px solid #ddd;
-        }}
-
-        .article th {{
-            background: #f5f5f5;
-            padding: 0.5rem;
-            text-align: left;
-            border: 1px solid #ddd;
-            font-weight: 600;
-        }}
-
-        .article td {{
-            padding: 0.5rem;
-            border: 1px solid #ddd;
-        }}
-
-        /* Mobile */
-        @media (max-width: 768px) {{
-            .main-container {{
-                grid-template-columns: 1fr;
-            }}
-
-            .sidebar {{
-                position: static;
-                margin-bottom: 1rem;
-            }}
-
-            .article {{
-                padding: 1.5rem;
-            }}
-
-            .article h1 {{
-                font-size: 2rem;
-            }}
-
-            .article h2 {{
-                font-size: 1.5rem;
-            }}
-        }}
-
-        /* Scroll behavior */
-        html {{
-            scroll-behavior: smooth;
-        }}
-
-        /* Section spacing */
-        .article section {{
-            scroll-margin-top: 100px;
-        }}
-    </style>
-</head>
-<body>
-    <!-- Header -->
-    <header class="header">
-        <div class="header-content">
-            <a href="index.html" class="logo">OrthopedicKB</a>
-            <nav class="nav-links">
-                <a href="index.html">Home</a>
-                <a href="huefte.html">Hüfte</a>
-            </nav>
-        </div>
-    </header>
-
-    <!-- Breadcrumbs -->
-    <div class="breadcrumbs">
-        <div class="breadcrumbs-content">
-            <a href="index.html">Home</a> › 
-            <a href="huefte.html">Hüfte</a> › 
-            <span>{breadcrumb}</span>
-        </div>
-    </div>
-
-    <!-- Main Content -->
-    <div class="main-container">
-        <!-- Sidebar Navigation -->
-        <aside class="sidebar">
-            <h3>Inhaltsverzeichnis</h3>
-            <ul class="toc-list">
-{toc_items}
-            </ul>
-        </aside>
-
-        <!-- Article -->
-        <article class="article">
-{content}
-        </article>
-    </div>
-
-    <script>
-        // Active TOC highlighting
-        const sections = document.querySelectorAll('.article h2[id]');
-        const tocLinks = document.querySelectorAll('.toc-link');
-
-        window.addEventListener('scroll', () => {{
-            let current = '';
-            sections.forEach(section => {{
-                const sectionTop = section.offsetTop;
-                if (window.pageYOffset >= sectionTop - 150) {{
-                    current = section.getAttribute('id');
-                }}
-            }});
-
-            tocLinks.forEach(link => {{
-                link.classList.remove('active');
-                if (link.getAttribute('href') === '#' + current) {{
-                    link.classList.add('active');
-                }}
-            }});
-        }});
-    </script>
-</body>
-</html>'''
+# HTML-Template mit Sidebar-Navigation: templates/sidebar_article.html
+TEMPLATE_NAME = 'sidebar_article'
 
 
 def extract_title(html_content):
@@ -401,19 +91,16 @@ def create_toc(headings):
     return '\n'.join(toc_items)
 
 
-def extract_body_content(html_content):
+def extract_body_content(html_content, budget=None):
     """Extrahiert Inhalt aus body"""
     body_match = re.search(r'<body[^>]*>(.*?)</body>', html_content, re.IGNORECASE | re.DOTALL)
     if body_match:
         content = body_match.group(1)
         
         # Entferne störende Elemente
-        content = re.sub(r'<script[^>]*>.*?</script>', '', content, flags=re.DOTALL | re.IGNORECASE)
-        content = re.sub(r'<style[^>]*>.*?</style>', '', content, flags=re.DOTALL | re.IGNORECASE)
-        content = re.sub(r'<nav[^>]*>.*?</nav>', '', content, flags=re.DOTALL | re.IGNORECASE)
-        content = re.sub(r'<header[^>]*>.*?</header>', '', content, flags=re.DOTALL | re.IGNORECASE)
-        content = re.sub(r'<footer[^>]*>.*?</footer>', '', content, flags=re.DOTALL | re.IGNORECASE)
-        content = re.sub(r'<a[^>]*zurück[^>]*>.*?</a>', '', content, flags=re.IGNORECASE)
+        for tag in ('script', 'style', 'nav', 'header', 'footer'):
+            content = remove_elements(content, tag, budget=budget)
+        content = remove_elements(content, 'a', BACK_LINK_START, budget)
         
         return content.strip()
     
@@ -429,8 +116,8 @@ def convert_article(filepath):
             html_content = f.read()
         
         # Extrahiere Informationen
-        title = extract_title(html_content)
-        content = extract_body_content(html_content)
+        title = load_manifest().title(filepath.stem) or extract_title(html_content)
+        content = extract_body_content(html_content, Budget())
         
         # Extrahiere Überschriften
         headings = extract_headings(content)
@@ -445,27 +132,29 @@ def convert_article(filepath):
         breadcrumb = title[:47] + "..." if len(title) > 50 else title
         
         # Erstelle neues HTML
-        new_html = ARTICLE_TEMPLATE.format(
+        new_html = get_template(TEMPLATE_NAME).render_text(
             title=title,
             breadcrumb=breadcrumb,
             toc_items=toc_html,
             content=content
         )
+        new_html = minify_output(new_html)
         
         # Backup
         backup_path = filepath.with_suffix('.html.backup')
         if not backup_path.exists():
-            with open(backup_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            write_text(backup_path, html_content)
             print(f"   💾 Backup erstellt")
         
         # Schreibe neue Datei
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(new_html)
+        write_text(filepath, new_html)
         
         print(f"   ✅ Erfolgreich konvertiert")
         return True
         
+    except MatcherTimeout as e:
+        print(f"   ⏱️  Übersprungen: {e}")
+        return False
     except Exception as e:
         print(f"   ❌ Fehler: {e}")
         return False
@@ -476,6 +165,13 @@ def main():
     print("=" * 70)
     print("🔄 Artikel-Konverter mit Sidebar-Navigation")
     print("=" * 70)
+
+    try:
+        tree_lock()
+    except TreeLocked as e:
+        print(f"❌ {e}")
+        return
+
     print()
     
     current_dir = Path.cwd()
@@ -483,7 +179,7 @@ def main():
     print()
     
     # Finde Artikel
-    exclude_files = {'index.html', 'huefte.html', 'hufte.html'}
+    exclude_files = load_manifest().skip_names
     html_files = [
         f for f in current_dir.glob('*.html') 
         if f.name.lower() not in exclude_files 
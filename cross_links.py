@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Querverweise zwischen Artikeln
+Artikel erwähnen sich oft gegenseitig beim Thema ("Beinlängendifferenz",
+"Hüftdysplasie", "LWS-Fusion"), ohne zu verlinken. Diese Stufe baut aus
+dem Manifest einen Index aller Artikelnamen (plus ALIASES), sucht die
+Erwähnungen in allen Artikeln und Papern in einem Durchlauf pro Seite
+(Aho-Corasick, siehe auto_links.py) und verlinkt das erste Vorkommen pro
+Abschnitt mit dem Artikel.
+
+Die gefundenen Verweise (Seite -> Artikel) stehen in .build/xrefs.json.
+
+Verwendung:
+  python3 cross_links.py          # Links aktualisieren
+  python3 cross_links.py --remove # Links entfernen
+"""
+
+import argparse
+import html
+import json
+import posixpath
+import re
+
+from auto_links import compile_terms, content_region, link_terms, unlink
+from safe_write import TreeLocked, tree_lock, write_text
+from site_manifest import BASE_PATH, load_manifest
+
+XREFS_PATH = BASE_PATH / '.build' / 'xrefs.json'
+XREFS_VERSION = 1
+
+LINK_CLASS = 'xref-link'
+
+# Verlinkte Artikel und Seiten, in denen verlinkt wird
+TARGET_KINDS = ('article',)
+SOURCE_KINDS = ('article', 'paper')
+
+# Zusätzliche Schreibweisen pro Artikel. Mehrdeutige Namen (drei Artikel
+# "Dual Mobility - Teil N") werden nur über diese Tabelle zugeordnet,
+# ebenso Teile zusammengesetzter Namen ("A & B" - "Navigation" allein
+# wäre zu allgemein).
+ALIASES = {
+    'beinlaengendifferenz/index.html': ('Beinlängendifferenzen', 'LLD'),
+    'dualmobilityeins/index.html': ('Dual Mobility', 'Dual-Mobility'),
+    'funktionellesafezoneundkinematischesalignment/index.html': ('funktionelle Safe Zone', 'kinematisches Alignment'),
+    'geriatrischepatient/index.html': ('geriatrische Patient', 'geriatrischen Patienten'),
+    'hueftdysplasie/index.html': ('DDH',),
+    'instabilitaetundluxation/index.html': ('Instabilität und Luxation',),
+    'lwsfusion/index.html': ('LWS-Fusionen', 'lumbale Fusion'),
+    'muskuläresbalancingundabduktorenfunktion/index.html': ('muskuläres Balancing', 'Abduktorenfunktion'),
+    'rheuma/index.html': ('rheumatische Erkrankungen',),
+    'robotikallgemein/index.html': ('Robotik',),
+    'zugangswege/index.html': ('Zugangswege',),
+}
+
+# Kürzere Namen sind als Suchbegriff zu unscharf
+MIN_ALIAS_LENGTH = 3
+
+_PART_SUFFIX = re.compile(r'\s+-\s+Teil\s+\d+$')
+
+
+def name_variants(name):
+    """Kartenname ohne "- Teil N" und ohne " System" """
+    name = _PART_SUFFIX.sub('', name.strip())
+    variants = {name}
+    if name.endswith(' System'):
+        variants.add(name[:-len(' System')])
+    return variants
+
+
+def build_index(pages):
+    """
+    Begriff -> Artikelpfad. Gibt (Index, mehrdeutige Begriffe) zurück;
+    mehrdeutige Namen landen nur über ALIASES im Index.
+    """
+    owners = {}
+    for page in pages:
+        for name in name_variants(page['name'] or ''):
+            owners.setdefault(name.lower(), {}).setdefault(page['path'], name)
+
+    index = {}
+    ambiguous = []
+    for variants in owners.values():
+        if len(variants) > 1:
+            ambiguous.append(sorted(variants.values())[0])
+            continue
+        path, name = next(iter(variants.items()))
+        index[name] = path
+
+    known = {page['path'] for page in pages}
+    for path, aliases in ALIASES.items():
+        if path in known:
+            for alias in aliases:
+                index[alias] = path
+    index = {name: path for name, path in index.items() if len(name) >= MIN_ALIAS_LENGTH}
+    return index, sorted(ambiguous)
+
+
+def link_page(page_html, page, automaton):
+    """Entfernt alte Querverweise und setzt sie neu; gibt (HTML, Zielpfade) zurück"""
+    page_html = unlink(page_html, LINK_CLASS)
+    region = content_region(page_html)
+    if region is None:
+        return page_html, []
+    base = posixpath.dirname(page['path'])
+
+    def render(target, text):
+        if target == page['path']:
+            return None
+        href = html.escape(posixpath.relpath(target, base))
+        return f'<a href="{href}" class="{LINK_CLASS}">{text}</a>'
+
+    return link_terms(page_html, automaton, render, region)
+
+
+def store_xrefs(edges):
+    try:
+        XREFS_PATH.parent.mkdir(parents=True, exist_ok=True)
+        write_text(XREFS_PATH, json.dumps({
+            'version': XREFS_VERSION,
+            'edges': edges,
+        }, ensure_ascii=False, indent=1))
+    except OSError:
+        # Nur Zusatzinformation für spätere Stufen
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Artikelnamen in anderen Seiten verlinken")
+    parser.add_argument('--remove', action='store_true', help="Querverweise entfernen")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("🔀 Querverweise")
+    print("=" * 60)
+
+    try:
+        tree_lock()
+    except TreeLocked as e:
+        print(f"❌ {e}")
+        return
+
+    manifest = load_manifest()
+    index, ambiguous = build_index(manifest.of_kind(*TARGET_KINDS))
+    automaton = compile_terms(index.items())
+    if ambiguous:
+        print(f"  ℹ️  Mehrdeutig, nicht verlinkt: {', '.join(ambiguous)}")
+
+    pages = manifest.of_kind(*SOURCE_KINDS)
+    edges = {}
+    updated = 0
+    for page in pages:
+        path = BASE_PATH / page['path']
+        try:
+            page_html = path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"  ⚠️  {page['path']}: {e}")
+            continue
+        if args.remove:
+            new_html, targets = unlink(page_html, LINK_CLASS), []
+        else:
+            new_html, targets = link_page(page_html, page, automaton)
+        if targets:
+            edges[page['path']] = sorted(set(targets))
+        if new_html == page_html:
+            continue
+        write_text(path, new_html)
+        updated += 1
+        print(f"  ✅ {page['path']} → {len(set(targets))} Artikel")
+
+    store_xrefs(edges)
+    cited = {target for targets in edges.values() for target in targets}
+
+    print("\n" + "=" * 60)
+    print("ZUSAMMENFASSUNG:")
+    print(f"   📖 Begriffe: {len(index)} für {len(set(index.values()))} Artikel")
+    print(f"   📄 Seiten: {len(pages)}")
+    print(f"   🔀 Verweise: {sum(len(targets) for targets in edges.values())} auf {len(cited)} Artikel")
+    print(f"   ✅ Aktualisiert: {updated}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Änderungspuffer (Piece Table)
+Mehrere Umformungen einer Seite sammeln ihre Änderungen als
+(Start, Ende, Ersatz) gegen den unveränderten Originaltext; das neue
+Dokument entsteht erst am Ende mit einem einzigen join. N Änderungen
+kopieren die Seite damit einmal statt N-mal.
+
+    buffer = EditBuffer(html)
+    buffer.remove(start, end)
+    buffer.sub(pattern, '')
+    rules.record(buffer)
+    html = buffer.text()
+
+Alle Spannen beziehen sich auf das Original. Überschneidungen:
+  - liegt eine Änderung ganz in einem entfernten Bereich, ist sie
+    überflüssig und wird verworfen (gilt auch umgekehrt)
+  - jede andere Überschneidung ist ein Konflikt (EditConflict)
+  - mehrere Einfügungen an derselben Stelle bleiben in ihrer Reihenfolge
+"""
+
+import bisect
+
+
+class EditConflict(Exception):
+    """Zwei Änderungen betreffen denselben Text"""
+
+    def __init__(self, edit, other):
+        super().__init__(
+            f"Änderung {edit[0]}:{edit[1]} überschneidet sich mit {other[0]}:{other[1]}"
+        )
+        self.edit = edit
+        self.other = other
+
+
+class EditBuffer:
+    """Originaltext plus sortierte, überschneidungsfreie Änderungen"""
+
+    __slots__ = ('original', '_keys', '_edits')
+
+    def __init__(self, original):
+        self.original = original
+        # Parallel sortiert nach (Start, Ende), gleiche Schlüssel in Aufrufreihenfolge
+        self._keys = []
+        self._edits = []
+
+    def __len__(self):
+        return len(self._edits)
+
+    @property
+    def changed(self):
+        return bool(self._edits)
+
+    def replace(self, start, end, replacement):
+        """Ersetzt original[start:end]; False, wenn die Änderung überflüssig ist"""
+        if not 0 <= start <= end <= len(self.original):
+            raise ValueError(f"Spanne {start}:{end} liegt außerhalb des Textes (Länge {len(self.original)})")
+        edit = (start, end, replacement)
+
+        # Nachbarn, die sich mit [start, end) überschneiden können
+        low = bisect.bisect_left(self._keys, (start, start))
+        while low > 0 and self._edits[low - 1][1] > start:
+            low -= 1
+        high = bisect.bisect_right(self._keys, (end, len(self.original)))
+        covered = []
+        for index in range(low, high):
+            other = self._edits[index]
+            if not _overlaps(edit, other):
+                continue
+            if _removes(other) and other[0] <= start and end <= other[1]:
+                return False
+            if _removes(edit) and start <= other[0] and other[1] <= end:
+                covered.append(index)
+                continue
+            raise EditConflict(edit, other)
+
+        for index in reversed(covered):
+            del self._keys[index]
+            del self._edits[index]
+            high -= 1
+        # Einfügungen vor Ersetzungen an derselben Stelle, gleiche in Aufrufreihenfolge
+        position = bisect.bisect_right(self._keys, (start, end), low, high)
+        self._keys.insert(position, (start, end))
+        self._edits.insert(position, edit)
+        return True
+
+    def remove(self, start, end):
+        return self.replace(start, end, '')
+
+    def insert(self, position, text):
+        return self.replace(position, position, text)
+
+    def sub(self, pattern, replacement, start=0, end=None):
+        """
+        Wie pattern.sub() auf dem Original, aber als Änderungen; replacement
+        darf eine Vorlage (\\1) oder eine Funktion sein. Liefert die Anzahl
+        übernommener Änderungen.
+        """
+        end = len(self.original) if end is None else end
+        count = 0
+        for match in pattern.finditer(self.original, start, end):
+            text = replacement(match) if callable(replacement) else match.expand(replacement)
+            if self.replace(match.start(), match.end(), text):
+                count += 1
+        return count
+
+    def text(self):
+        """Das geänderte Dokument (ein join über Original-Stücke und Ersetzungen)"""
+        if not self._edits:
+            return self.original
+        parts = []
+        pos = 0
+        for start, end, replacement in self._edits:
+            parts.append(self.original[pos:start])
+            parts.append(replacement)
+            pos = end
+        parts.append(self.original[pos:])
+        return ''.join(parts)
+
+
+def _removes(edit):
+    return edit[0] < edit[1] and not edit[2]
+
+
+def _overlaps(edit, other):
+    """Gemeinsamer Text oder eine Einfügung echt innerhalb der anderen Spanne"""
+    (start, end, _), (o_start, o_end, _) = edit, other
+    if start == end:
+        return o_start < start < o_end
+    if o_start == o_end:
+        return start < o_start < end
+    return start < o_end and o_start < end
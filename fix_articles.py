@@ -8,351 +8,14 @@ import os
 import re
 from pathlib import Path
 
-# Funktionierendes HTML-Template
-ARTICLE_TEMPLATE = '''<!DOCTYPE html>
-<html lang="de">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title} - Orthopedic Knowledge Base</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
+from html_matcher import Budget, MatcherTimeout, remove_elements
+from minify_html import minify_output
+from safe_write import TreeLocked, tree_lock, write_text
+from site_manifest import load_manifest
+from template_engine import get_template
 
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', sans-serif;
-            line-height: 1.6;
-            color: #333;
-            background: #f8f9fa;
-        }}
-
-        /* Header */
-        .header {{
-            background: white;
-            border-bottom: 1px solid #dee2e6;
-            padding: 1rem 0;
-            position: sticky;
-            top: 0;
-            z-index: 1000;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.04);
-        }}
-
-        .header-inner {{
-            max-width: 1400px;
-            margin: 0 auto;
-            padding: 0 2rem;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }}
-
-        .logo {{
-            font-size: 1.25rem;
-            font-weight: 700;
-            color: #2563eb;
-            text-decoration: none;
-        }}
-
-        .nav {{
-            display: flex;
-            gap: 1.5rem;
-        }}
-
-        .nav a {{
-            color: #6c757d;
-            text-decoration: none;
-            font-weight: 500;
-            font-size: 0.95rem;
-        }}
-
-        .nav a:hover {{
-            color: #2563eb;
-        }}
-
-        /* Breadcrumbs */
-        .breadcrumbs {{
-            background: white;
-            border-bottom: 1px solid #dee2e6;
-            padding: 0.75rem 0;
-        }}
-
-        .breadcrumbs-inner {{
-            max-width: 1400px;
-            margin: 0 auto;
-            padding: 0 2rem;
-            font-size: 0.875rem;
-            color: #6c757d;
-        }}
-
-        .breadcrumbs a {{
-            color: #2563eb;
-            text-decoration: none;
-        }}
-
-        /* Main Container */
-        .container {{
-            max-width: 1400px;
-            margin: 2rem auto;
-            padding: 0 2rem;
-            display: flex;
-            gap: 2rem;
-            align-items: flex-start;
-        }}
-
-        /* Sidebar */
-        .sidebar {{
-            width: 250px;
-            flex-shrink: 0;
-            position: sticky;
-            top: 80px;
-        }}
-
-        .sidebar-inner {{
-            background: white;
-            border: 1px solid #dee2e6;
-            border-radius: 8px;
-            padding: 1.5rem;
-        }}
-
-        .sidebar h3 {{
-            font-size: 0.75rem;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            color: #6c757d;
-            margin-bottom: 1rem;
-            font-weight: 600;
-        }}
-
-        .toc {{
-            list-style: none;
-        }}
-
-        .toc li {{
-            margin-bottom: 0.5rem;
-        }}
-
-        .toc a {{
-            display: block;
-            padding: 0.4rem 0.6rem;
-            color: #495057;
-            text-decoration: none;
-            border-radius: 4px;
-            font-size: 0.875rem;
-            transition: all 0.15s;
-        }}
-
-        .toc a:hover {{
-            background: #f8f9fa;
-            color: #2563eb;
-        }}
-
-        .toc a.active {{
-            background: #e7f3ff;
-            color: #2563eb;
-            font-weight: 500;
-        }}
-
-        /* Content */
-        .content {{
-            flex: 1;
-            min-width: 0;
-            background: white;
-            border: 1px solid #dee2e6;
-            border-radius: 8px;
-            padding: 2.5rem;
-        }}
-
-        /* Typography */
-        .content h1 {{
-            font-size: 2rem;
-            font-weight: 700;
-            color: #212529;
-            margin-bottom: 1.5rem;
-            line-height: 1.2;
-        }}
-
-        .content h2 {{
-            font-size: 1.5rem;
-            font-weight: 600;
-            color: #212529;
-            margin-top: 2.5rem;
-            margin-bottom: 1rem;
-            padding-top: 1.5rem;
-            border-top: 1px solid #dee2e6;
-        }}
-
-        .content h2:first-of-type {{
-            margin-top: 0;
-            padding-top: 0;
-            border-top: none;
-        }}
-
-        .content h3 {{
-            font-size: 1.25rem;
-            font-weight: 600;
-            color: #212529;
-            margin-top: 1.5rem;
-            margin-bottom: 0.75rem;
-        }}
-
-        .content h4 {{
-            font-size: 1.1rem;
-            font-weight: 600;
-            color: #495057;
-            margin-top: 1.25rem;
-            margin-bottom: 0.5rem;
-        }}
-
-        .content p {{
-            margin-bottom: 1rem;
-            color: #495057;
-        }}
-
-        .content ul,
-        .content ol {{
-            margin-bottom: 1rem;
-            padding-left: 1.5rem;
-        }}
-
-        .content li {{
-            margin-bottom: 0.4rem;
-            color: #495057;
-        }}
-
-        .content strong {{
-            font-weight: 600;
-            color: #212529;
-        }}
-
-        .content em {{
-            font-style: italic;
-        }}
-
-        /* Tables */
-        .content table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin: 1.5rem 0;
-            font-size: 0.9rem;
-        }}
-
-        .content th {{
-            background: #f8f9fa;
-            padding: 0.75rem;
-            text-align: left;
-            font-weight: 600;
-            border: 1px solid #dee2e6;
-        }}
-
-        .content td {{
-            padding: 0.75rem;
-            border: 1px solid #dee2e6;
-        }}
-
-        .content tbody tr:hover {{
-            background: #f8f9fa;
-        }}
-
-        /* Images */
-        .content img {{
-            max-width: 100%;
-            height: auto;
-            border-radius: 4px;
-            margin: 1.5rem 0;
-        }}
-
-        /* Responsive */
-        @media (max-width: 992px) {{
-            .container {{
-                flex-direction: column;
-            }}
-
-            .sidebar {{
-                width: 100%;
-                position: static;
-            }}
-
-            .content {{
-                padding: 1.5rem;
-            }}
-        }}
-
-        /* Smooth scroll */
-        html {{
-            scroll-behavior: smooth;
-        }}
-
-        .content h2[id] {{
-            scroll-margin-top: 100px;
-        }}
-    </style>
-</head>
-<body>
-    <!-- Header -->
-    <header class="header">
-        <div class="header-inner">
-            <a href="index.html" class="logo">OrthopedicKB</a>
-            <nav class="nav">
-                <a href="index.html">Home</a>
-                <a href="huefte.html">Hüfte</a>
-            </nav>
-        </div>
-    </header>
-
-    <!-- Breadcrumbs -->
-    <div class="breadcrumbs">
-        <div class="breadcrumbs-inner">
-            <a href="index.html">Home</a> › 
-            <a href="huefte.html">Hüfte</a> › 
-            {breadcrumb}
-        </div>
-    </div>
-
-    <!-- Main -->
-    <div class="container">
-        <!-- Sidebar -->
-        <aside class="sidebar">
-            <div class="sidebar-inner">
-                <h3>Inhaltsverzeichnis</h3>
-                <ul class="toc">
-{toc}
-                </ul>
-            </div>
-        </aside>
-
-        <!-- Content -->
-        <main class="content">
-{content}
-        </main>
-    </div>
-
-    <script>
-    // Active TOC
-    const links = document.querySelectorAll('.toc a');
-    const sections = document.querySelectorAll('.content h2[id]');
-    
-    window.addEventListener('scroll', () => {{
-        let current = '';
-        sections.forEach(section => {{
-            const top = section.offsetTop;
-            if (window.pageYOffset >= top - 120) {{
-                current = section.id;
-            }}
-        }});
-        
-        links.forEach(link => {{
-            link.classList.remove('active');
-            if (link.getAttribute('href') === '#' + current) {{
-                link.classList.add('active');
-            }}
-        }});
-    }});
-    </script>
-</body>
-</html>'''
+# Funktionierendes HTML-Template: templates/fix_articles.html
+TEMPLATE_NAME = 'fix_articles'
 
 
 def clean_html(text):
@@ -425,17 +88,14 @@ def make_toc(headings):
     return '\n'.join(items)
 
 
-def extract_body(html):
+def extract_body(html, budget=None):
     """Extrahiert Body-Content"""
     match = re.search(r'<body[^>]*>(.*?)</body>', html, re.I | re.S)
     if match:
         content = match.group(1)
         # Entferne Scripts, Styles, Nav, Header, Footer
-        content = re.sub(r'<script[^>]*>.*?</script>', '', content, flags=re.I | re.S)
-        content = re.sub(r'<style[^>]*>.*?</style>', '', content, flags=re.I | re.S)
-        content = re.sub(r'<nav[^>]*>.*?</nav>', '', content, flags=re.I | re.S)
-        content = re.sub(r'<header[^>]*>.*?</header>', '', content, flags=re.I | re.S)
-        content = re.sub(r'<footer[^>]*>.*?</footer>', '', content, flags=re.I | re.S)
+        for tag in ('script', 'style', 'nav', 'header', 'footer'):
+            content = remove_elements(content, tag, budget=budget)
         return content.strip()
     
     return html
@@ -449,8 +109,8 @@ def convert(filepath):
         with open(filepath, 'r', encoding='utf-8') as f:
             html = f.read()
         
-        title = extract_title(html)
-        content = extract_body(html)
+        title = load_manifest().title(filepath.stem) or extract_title(html)
+        content = extract_body(html, Budget())
         headings = extract_h2_headings(content)
         
         print(f"   📋 {len(headings)} Abschnitte")
@@ -460,26 +120,28 @@ def convert(filepath):
         
         breadcrumb = title if len(title) < 50 else title[:47] + '...'
         
-        new_html = ARTICLE_TEMPLATE.format(
+        new_html = get_template(TEMPLATE_NAME).render_text(
             title=title,
             breadcrumb=breadcrumb,
             toc=toc,
             content=content
         )
+        new_html = minify_output(new_html)
         
         # Backup
         backup = filepath.with_suffix('.html.backup')
         if not backup.exists():
-            with open(backup, 'w', encoding='utf-8') as f:
-                f.write(html)
+            write_text(backup, html)
         
         # Schreibe
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(new_html)
+        write_text(filepath, new_html)
         
         print(f"   ✅ Fertig")
         return True
         
+    except MatcherTimeout as e:
+        print(f"   ⏱️  Übersprungen: {e}")
+        return False
     except Exception as e:
         print(f"   ❌ Fehler: {e}")
         return False
@@ -489,6 +151,13 @@ def main():
     print("=" * 70)
     print("🔧 ARTIKEL-REPARATUR (Fixed Version)")
     print("=" * 70)
+
+    try:
+        tree_lock()
+    except TreeLocked as e:
+        print(f"❌ {e}")
+        return
+
     print()
     
     cwd = Path.cwd()
@@ -496,7 +165,7 @@ def main():
     print()
     
     # Finde Artikel
-    exclude = {'index.html', 'huefte.html', 'hufte.html'}
+    exclude = load_manifest().skip_names
     files = [f for f in cwd.glob('*.html') 
              if f.name.lower() not in exclude and not f.name.endswith('.backup')]
     
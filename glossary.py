@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Glossar-Links
+Verlinkt Fachbegriffe (PI, PT, SS, Dual Mobility, Safe Zone, ...) in allen
+Artikeln und Papern mit der Stelle, an der sie erklärt werden. Die
+Begriffe stehen in glossary.json:
+
+    {"term": "Pelvic Tilt", "aliases": ["PT"],
+     "target": "allgemeineinfos/index.html#spinopelvine-parameter",
+     "definition": "..."}
+
+Alle Begriffe und Synonyme werden zu einem Aho-Corasick-Automaten
+zusammengefasst; jede Seite wird einmal gelesen (siehe auto_links.py).
+Verlinkt wird das erste Vorkommen pro Abschnitt, nie in Überschriften,
+Links oder Attributen und nie auf der Zielseite selbst.
+
+Verwendung:
+  python3 glossary.py          # Links aktualisieren
+  python3 glossary.py --remove # Links entfernen
+"""
+
+import argparse
+import html
+import json
+import posixpath
+
+from auto_links import compile_terms, content_region, link_terms, unlink
+from safe_write import TreeLocked, tree_lock, write_text
+from site_manifest import BASE_PATH, load_manifest
+
+GLOSSARY_PATH = BASE_PATH / 'glossary.json'
+GLOSSARY_VERSION = 1
+
+LINK_CLASS = 'glossary-link'
+
+# Seitenarten, in denen verlinkt wird
+GLOSSARY_KINDS = ('article', 'paper')
+
+
+class GlossaryError(Exception):
+    """Glossar kann nicht gelesen werden"""
+
+
+def load_glossary(path=GLOSSARY_PATH):
+    """Liest die Glossar-Einträge und prüft die Pflichtfelder"""
+    try:
+        data = json.loads(path.read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        return []
+    except ValueError as e:
+        raise GlossaryError(f"{path.name}: kein gültiges JSON ({e})") from None
+    if data.get('version') != GLOSSARY_VERSION:
+        raise GlossaryError(f"{path.name}: unbekannte Version {data.get('version')!r}")
+    for n, entry in enumerate(data['terms'], 1):
+        missing = [field for field in ('term', 'target') if not entry.get(field)]
+        if missing:
+            raise GlossaryError(f"{path.name}: Eintrag {n} ohne {', '.join(missing)}")
+    return data['terms']
+
+
+def glossary_terms(entries):
+    """(Begriff, Eintragsnummer) für alle Begriffe und Synonyme"""
+    return [
+        (pattern, n)
+        for n, entry in enumerate(entries)
+        for pattern in [entry['term'], *entry.get('aliases', ())]
+    ]
+
+
+def target_path(entry):
+    return entry['target'].split('#', 1)[0]
+
+
+def check_targets(entries):
+    """Einträge, deren Zielseite oder Anker fehlt"""
+    broken = []
+    for entry in entries:
+        path = BASE_PATH / target_path(entry)
+        anchor = entry['target'].partition('#')[2]
+        if not path.is_file():
+            broken.append((entry, "Seite fehlt"))
+        elif anchor and f'id="{anchor}"' not in path.read_text(encoding='utf-8'):
+            broken.append((entry, f"Anker #{anchor} fehlt"))
+    return broken
+
+
+def link_page(page_html, page, entries, automaton):
+    """Entfernt alte Glossar-Links und setzt sie neu; gibt (HTML, Schlüssel) zurück"""
+    page_html = unlink(page_html, LINK_CLASS)
+    region = content_region(page_html)
+    if region is None:
+        return page_html, []
+    base = posixpath.dirname(page['path'])
+
+    def render(key, text):
+        entry = entries[key]
+        if target_path(entry) == page['path']:
+            return None
+        path, _, anchor = entry['target'].partition('#')
+        href = posixpath.relpath(path, base) + (f'#{anchor}' if anchor else '')
+        title = entry.get('definition') or entry['term']
+        return (
+            f'<a href="{html.escape(href)}" class="{LINK_CLASS}" '
+            f'title="{html.escape(title)}">{text}</a>'
+        )
+
+    return link_terms(page_html, automaton, render, region)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fachbegriffe mit dem Glossar verlinken")
+    parser.add_argument('--remove', action='store_true', help="Glossar-Links entfernen")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("📖 Glossar-Links")
+    print("=" * 60)
+
+    try:
+        tree_lock()
+    except TreeLocked as e:
+        print(f"❌ {e}")
+        return
+
+    try:
+        entries = load_glossary()
+    except GlossaryError as e:
+        print(f"❌ {e}")
+        return
+
+    broken = check_targets(entries)
+    for entry, reason in broken:
+        print(f"  ⚠️  {entry['term']}: {reason} ({entry['target']})")
+    broken_terms = {entry['term'] for entry, _ in broken}
+    entries = [entry for entry in entries if entry['term'] not in broken_terms]
+    automaton = compile_terms(glossary_terms(entries))
+
+    manifest = load_manifest()
+    pages = manifest.of_kind(*GLOSSARY_KINDS)
+    updated = 0
+    links = 0
+    usage = {}
+    for page in pages:
+        path = BASE_PATH / page['path']
+        try:
+            page_html = path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"  ⚠️  {page['path']}: {e}")
+            continue
+        if args.remove:
+            new_html, linked = unlink(page_html, LINK_CLASS), []
+        else:
+            new_html, linked = link_page(page_html, page, entries, automaton)
+        links += len(linked)
+        for key in linked:
+            usage[key] = usage.get(key, 0) + 1
+        if new_html == page_html:
+            continue
+        write_text(path, new_html)
+        updated += 1
+        print(f"  ✅ {page['path']} ({len(linked)} Links)")
+
+    unused = [entry['term'] for n, entry in enumerate(entries) if n not in usage]
+    if unused and not args.remove:
+        print(f"\n📭 Nirgends gefunden: {', '.join(unused)}")
+
+    print("\n" + "=" * 60)
+    print("ZUSAMMENFASSUNG:")
+    print(f"   📖 Begriffe: {len(entries)} ({len(broken)} mit fehlendem Ziel)")
+    print(f"   📄 Seiten: {len(pages)}")
+    print(f"   🔗 Links: {links}")
+    print(f"   ✅ Aktualisiert: {updated}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Austauschbare HTML-Parser
+Eine gemeinsame, kleine Schnittstelle über mehrere Parser, damit jede
+Aufgabe den schnellsten Parser nutzen kann, der für sie richtig arbeitet
+(Messung: parser_benchmark.py).
+
+    root = parse(html_content, 'regex', strainer=BODY_STRAINER)
+    content = root.find('main')
+    for element in content.find_all(('script', 'style')):
+        element.decompose()
+    content.html(), content.text()
+
+Backends:
+  regex       Spannen aus html_matcher direkt auf dem Quelltext (immer da,
+              Ausgabe bleibt Zeichen für Zeichen wie im Original)
+  stdlib      html.parser.HTMLParser mit einem schlanken Baum
+  bs4         BeautifulSoup mit 'html.parser' (falls installiert)
+  lxml        lxml.html (falls installiert)
+  selectolax  selectolax (falls installiert)
+
+Strainer: mit strainer=('article', 'main', 'body') wird vor dem Parsen nur
+das erste vorhandene dieser Elemente (in dieser Reihenfolge) ausgeschnitten;
+<head>, Navigation außerhalb usw. werden gar nicht erst geparst.
+"""
+
+import html
+import re
+from html.parser import HTMLParser
+
+from html_matcher import VOID_TAGS, element_end, find_elements, iter_tags
+
+try:
+    import bs4
+except ImportError:
+    bs4 = None
+
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+try:
+    import selectolax.parser
+except ImportError:
+    selectolax = None
+
+BODY_STRAINER = ('article', 'main', 'body')
+
+# Elemente, deren Text nicht sichtbar ist
+HIDDEN_TAGS = ('script', 'style')
+
+_TAGS = re.compile(r'<[^>]+>')
+_SPACES = re.compile(r'\s+')
+
+
+class ParserUnavailable(Exception):
+    """Das gewählte Backend ist nicht installiert oder unbekannt"""
+
+
+def collapse(text):
+    return _SPACES.sub(' ', text).strip()
+
+
+def strain(source, tags):
+    """Erstes vorhandenes Element aus tags (in dieser Reihenfolge), sonst die ganze Quelle"""
+    for tag in tags:
+        spans = find_elements(source, tag)
+        if spans:
+            return source[spans[0][0]:spans[0][1]]
+    return source
+
+
+# ----------------------------------------------------------------------------
+# regex: Spannen im Quelltext, entfernte Elemente als ausgeschnittene Spannen
+# ----------------------------------------------------------------------------
+
+class _RegexDocument:
+    __slots__ = ('source', 'removed')
+
+    def __init__(self, source):
+        self.source = source
+        self.removed = []
+
+    def is_removed(self, pos):
+        return any(start <= pos < end for start, end in self.removed)
+
+    def cut(self, start, end):
+        """Quelltext der Spanne ohne entfernte Elemente"""
+        parts = []
+        pos = start
+        for r_start, r_end in sorted(self.removed):
+            if r_end <= pos or r_start >= end:
+                continue
+            parts.append(self.source[pos:r_start])
+            pos = max(pos, r_end)
+        parts.append(self.source[pos:end])
+        return ''.join(parts)
+
+
+class RegexElement:
+    __slots__ = ('document', 'start', 'end', 'name')
+
+    def __init__(self, document, start, end, name=None):
+        self.document = document
+        self.start = start
+        self.end = end
+        self.name = name
+
+    def _descendants(self, names):
+        document = self.document
+        source = document.source
+        # Beim Wurzelelement zählt auch ein Tag an Position 0
+        skip = self.start if self.name is not None else -1
+        for start, end, name, is_end in iter_tags(source, start=self.start):
+            if start >= self.end:
+                return
+            if is_end or start == skip or name not in names or document.is_removed(start):
+                continue
+            if name in VOID_TAGS or source[end - 2] == '/':
+                yield RegexElement(document, start, end, name)
+            else:
+                yield RegexElement(document, start, min(element_end(source, start) or self.end, self.end), name)
+
+    def find(self, name):
+        return next(self._descendants((name,)), None)
+
+    def find_all(self, names):
+        return list(self._descendants(set(names)))
+
+    def decompose(self):
+        self.document.removed.append((self.start, self.end))
+
+    def html(self):
+        return self.document.cut(self.start, self.end)
+
+    def text(self):
+        fragment = self.html()
+        for tag in HIDDEN_TAGS:
+            fragment = ''.join(
+                fragment[start:end] for start, end in _gaps(find_elements(fragment, tag), len(fragment))
+            )
+        return collapse(html.unescape(_TAGS.sub(' ', fragment)))
+
+
+def _gaps(spans, length):
+    pos = 0
+    for start, end in spans:
+        yield pos, start
+        pos = end
+    yield pos, length
+
+
+def _parse_regex(source):
+    return RegexElement(_RegexDocument(source), 0, len(source))
+
+
+# ----------------------------------------------------------------------------
+# stdlib: html.parser baut einen Baum aus Knoten; Text bleibt roh (Entities
+# werden erst in text() aufgelöst), Start-Tags werden unverändert übernommen
+# ----------------------------------------------------------------------------
+
+class _Markup(str):
+    """Kommentar, Doctype oder Processing Instruction - kein sichtbarer Text"""
+
+    __slots__ = ()
+
+
+class StdlibElement:
+    __slots__ = ('name', 'start_tag', 'children', 'parent', 'closed')
+
+    def __init__(self, name, start_tag='', parent=None):
+        self.name = name
+        self.start_tag = start_tag
+        self.children = []
+        self.parent = parent
+        self.closed = False
+
+    def _iter(self):
+        for child in self.children:
+            if isinstance(child, StdlibElement):
+                yield child
+                yield from child._iter()
+
+    def find(self, name):
+        return next((element for element in self._iter() if element.name == name), None)
+
+    def find_all(self, names):
+        names = set(names)
+        return [element for element in self._iter() if element.name in names]
+
+    def decompose(self):
+        if self.parent is not None:
+            self.parent.children.remove(self)
+            self.parent = None
+
+    def html(self):
+        inner = ''.join(child.html() if isinstance(child, StdlibElement) else child for child in self.children)
+        if self.name is None:
+            return inner
+        end_tag = f'</{self.name}>' if self.closed else ''
+        return self.start_tag + inner + end_tag
+
+    def _strings(self):
+        for child in self.children:
+            if isinstance(child, StdlibElement):
+                if child.name not in HIDDEN_TAGS:
+                    yield from child._strings()
+            elif not isinstance(child, _Markup):
+                yield child
+
+    def text(self):
+        return collapse(html.unescape(' '.join(self._strings())))
+
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.root = StdlibElement(None)
+        self.current = self.root
+
+    def _append_text(self, text):
+        children = self.current.children
+        if children and type(children[-1]) is str:
+            children[-1] += text
+        else:
+            children.append(text)
+
+    def handle_starttag(self, tag, attrs):
+        element = StdlibElement(tag, self.get_starttag_text(), self.current)
+        self.current.children.append(element)
+        if tag not in VOID_TAGS:
+            self.current = element
+
+    def handle_startendtag(self, tag, attrs):
+        self.current.children.append(StdlibElement(tag, self.get_starttag_text(), self.current))
+
+    def handle_endtag(self, tag):
+        element = self.current
+        while element is not None and element.name != tag:
+            element = element.parent
+        if element is None:
+            # End-Tag ohne offenes Element - wie im Browser ignorieren
+            return
+        element.closed = True
+        self.current = element.parent
+
+    def handle_data(self, data):
+        self._append_text(data)
+
+    def handle_entityref(self, name):
+        self._append_text(f'&{name};')
+
+    def handle_charref(self, name):
+        self._append_text(f'&#{name};')
+
+    def handle_comment(self, data):
+        self.current.children.append(_Markup(f'<!--{data}-->'))
+
+    def handle_decl(self, decl):
+        self.current.children.append(_Markup(f'<!{decl}>'))
+
+    def handle_pi(self, data):
+        self.current.children.append(_Markup(f'<?{data}>'))
+
+    def unknown_decl(self, data):
+        self.current.children.append(_Markup(f'<![{data}]>'))
+
+
+def _parse_stdlib(source):
+    builder = _TreeBuilder()
+    builder.feed(source)
+    builder.close()
+    return builder.root
+
+
+# ----------------------------------------------------------------------------
+# Optionale Backends
+# ----------------------------------------------------------------------------
+
+class Bs4Element:
+    __slots__ = ('node',)
+
+    def __init__(self, node):
+        self.node = node
+
+    def find(self, name):
+        node = self.node.find(name)
+        return Bs4Element(node) if node is not None else None
+
+    def find_all(self, names):
+        return [Bs4Element(node) for node in self.node.find_all(list(names))]
+
+    def decompose(self):
+        self.node.decompose()
+
+    def html(self):
+        return str(self.node)
+
+    def text(self):
+        # Seit bs4 4.10 liefert get_text() keinen Inhalt von <script>/<style>
+        return collapse(self.node.get_text(' '))
+
+
+def _parse_bs4(source):
+    return Bs4Element(bs4.BeautifulSoup(source, 'html.parser'))
+
+
+class LxmlElement:
+    __slots__ = ('node', 'is_root')
+
+    def __init__(self, node, is_root=False):
+        self.node = node
+        self.is_root = is_root
+
+    def _iter(self, names):
+        nodes = self.node.iter(*names) if self.is_root else self.node.iterdescendants(*names)
+        return (node for node in nodes if isinstance(node.tag, str))
+
+    def find(self, name):
+        node = next(self._iter((name,)), None)
+        return LxmlElement(node) if node is not None else None
+
+    def find_all(self, names):
+        return [LxmlElement(node) for node in self._iter(tuple(names))]
+
+    def decompose(self):
+        # drop_tree() behält den Text nach dem Element (wie decompose() in bs4)
+        self.node.drop_tree()
+
+    def html(self):
+        return lxml.html.tostring(self.node, encoding='unicode', with_tail=False)
+
+    def text(self):
+        parts = []
+        for node in self.node.iter():
+            if isinstance(node.tag, str) and node.tag not in HIDDEN_TAGS and node.text:
+                parts.append(node.text)
+            if node is not self.node and node.tail:
+                parts.append(node.tail)
+        return collapse(' '.join(parts))
+
+
+def _parse_lxml(source):
+    return LxmlElement(lxml.html.fromstring(source), is_root=True)
+
+
+class SelectolaxElement:
+    __slots__ = ('node',)
+
+    def __init__(self, node):
+        self.node = node
+
+    def find(self, name):
+        node = self.node.css_first(name)
+        return SelectolaxElement(node) if node is not None else None
+
+    def find_all(self, names):
+        return [SelectolaxElement(node) for node in self.node.css(', '.join(names))]
+
+    def decompose(self):
+        self.node.decompose()
+
+    def html(self):
+        return self.node.html
+
+    def text(self):
+        return collapse(self.node.text(separator=' '))
+
+
+def _parse_selectolax(source):
+    return SelectolaxElement(selectolax.parser.HTMLParser(source))
+
+
+# Name -> Parser; None, wenn das Paket fehlt
+BACKENDS = {
+    'regex': _parse_regex,
+    'stdlib': _parse_stdlib,
+    'bs4': _parse_bs4 if bs4 is not None else None,
+    'lxml': _parse_lxml if lxml is not None else None,
+    'selectolax': _parse_selectolax if selectolax is not None else None,
+}
+
+
+def available_backends():
+    return [name for name, parser in BACKENDS.items() if parser is not None]
+
+
+def parse(source, backend='regex', strainer=None):
+    """Wurzel-Element des Dokuments (bzw. des ausgeschnittenen Elements)"""
+    parser = BACKENDS.get(backend)
+    if parser is None:
+        if backend in BACKENDS:
+            raise ParserUnavailable(f"Parser '{backend}' ist nicht installiert")
+        raise ParserUnavailable(f"Unbekannter Parser '{backend}' (verfügbar: {', '.join(available_backends())})")
+    if strainer:
+        source = strain(source, strainer)
+    return parser(source)
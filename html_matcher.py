@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Linearer HTML-Element-Matcher
+Findet und entfernt Elemente in einem einzigen Durchlauf über das Dokument.
+Verschachtelte Elemente gleichen Namens werden korrekt gezählt, nicht
+geschlossene Elemente bleiben unangetastet (statt den Rest zu verschlucken).
+"""
+
+import re
+import time
+
+# Standard-Zeitbudget pro Datei in Sekunden
+TIME_BUDGET = 5.0
+
+# Elemente, deren Inhalt kein HTML ist
+RAW_TEXT_TAGS = {'script', 'style'}
+
+# Elemente ohne End-Tag
+VOID_TAGS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'source', 'track', 'wbr'
+}
+
+_TAG_NAME = re.compile(r'<(/?)([a-zA-Z][a-zA-Z0-9-]*)')
+_RAW_TEXT_END = {tag: re.compile(r'</' + tag, re.IGNORECASE) for tag in RAW_TEXT_TAGS}
+
+
+class MatcherTimeout(Exception):
+    """Eine Datei hat ihr Zeitbudget überschritten"""
+
+    def __init__(self, seconds, position):
+        super().__init__(f"Zeitbudget von {seconds:g}s bei Zeichen {position} überschritten")
+        self.seconds = seconds
+        self.position = position
+
+
+class Budget:
+    """Zeitbudget für die Verarbeitung einer Datei"""
+
+    def __init__(self, seconds=TIME_BUDGET):
+        self.seconds = seconds
+        self.deadline = time.monotonic() + seconds if seconds else None
+
+    def check(self, position=0):
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise MatcherTimeout(self.seconds, position)
+
+
+def iter_tags(html, budget=None, start=0):
+    """
+    Liefert alle Tags als (start, end, name, is_end_tag).
+    Jedes Zeichen wird höchstens einmal gelesen; Kommentare und der Inhalt
+    von <script>/<style> werden übersprungen.
+    """
+    pos = start
+    count = 0
+
+    while True:
+        lt = html.find('<', pos)
+        if lt < 0:
+            return
+
+        count += 1
+        if budget is not None and count % 256 == 0:
+            budget.check(lt)
+
+        # Kommentare überspringen
+        if html.startswith('<!--', lt):
+            close = html.find('-->', lt + 4)
+            if close < 0:
+                return
+            pos = close + 3
+            continue
+
+        # Erst den Tag-Namen prüfen: ein einzelnes '<' im Text darf nicht
+        # bis zum nächsten '>' vorauslesen
+        match = _TAG_NAME.match(html, lt)
+        if not match:
+            pos = lt + 1
+            continue
+
+        gt = html.find('>', match.end())
+        if gt < 0:
+            # Kein weiteres Tag mehr möglich
+            return
+
+        is_end = bool(match.group(1))
+        name = match.group(2).lower()
+        end = gt + 1
+        yield lt, end, name, is_end
+
+        if not is_end and name in RAW_TEXT_TAGS and html[gt - 1] != '/':
+            close = _RAW_TEXT_END[name].search(html, end)
+            if not close:
+                return
+            pos = close.start()
+        else:
+            pos = end
+
+
+def find_elements(html, tag, start_tag=None, budget=None):
+    """
+    Findet alle äußersten <tag>-Elemente als (start, end)-Spannen.
+
+    start_tag: optionale Regex, die ab '<' auf das Start-Tag passen muss
+    (z.B. eine bestimmte Klasse). Nicht geschlossene Elemente werden
+    nicht zurückgegeben.
+    """
+    tag = tag.lower()
+    spans = []
+    # Startpositionen offener <tag>-Elemente
+    stack = []
+    # Stack-Tiefe und Start des aktuell passenden äußersten Elements
+    outer = None
+
+    for start, end, name, is_end in iter_tags(html, budget):
+        if name != tag:
+            continue
+
+        if not is_end:
+            matched = start_tag is None or bool(start_tag.match(html, start, end))
+            if tag in VOID_TAGS or html[end - 2] == '/':
+                if matched and outer is None:
+                    spans.append((start, end))
+                continue
+            if matched and outer is None:
+                outer = (len(stack), start)
+            stack.append(start)
+        elif stack:
+            stack.pop()
+            if outer is not None and len(stack) == outer[0]:
+                spans.append((outer[1], end))
+                outer = None
+
+    return spans
+
+
+def element_end(html, start, budget=None):
+    """
+    Liefert das Ende des Elements, das bei start beginnt (inkl. End-Tag),
+    oder None, wenn es nicht geschlossen wird.
+    """
+    match = _TAG_NAME.match(html, start)
+    if not match or match.group(1):
+        return None
+    tag = match.group(2).lower()
+
+    depth = 0
+    for _, end, name, is_end in iter_tags(html, budget, start):
+        if name != tag:
+            continue
+        if not is_end:
+            if tag in VOID_TAGS or html[end - 2] == '/':
+                if depth == 0:
+                    return end
+                continue
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return end
+    return None
+
+
+def remove_spans(html, spans):
+    """Schneidet sortierte, nicht überlappende Spannen in einem Schritt heraus"""
+    if not spans:
+        return html
+    parts = []
+    pos = 0
+    for start, end in spans:
+        parts.append(html[pos:start])
+        pos = end
+    parts.append(html[pos:])
+    return ''.join(parts)
+
+
+def remove_elements(html, tag, start_tag=None, budget=None):
+    """Entfernt alle äußersten <tag>-Elemente, deren Start-Tag passt"""
+    return remove_spans(html, find_elements(html, tag, start_tag, budget))
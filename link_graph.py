@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Link-Graph der Seiten
+Gemeinsame Grundlage für Build-Stufen, die wissen müssen, welche Seite
+auf welche verweist (Backlinks, Erreichbarkeit, Prefetch).
+
+content_links() zählt Links im Inhalt (<article>, sonst <main>), nicht in
+Navigation und Sidebar; page_references() liefert alle lokalen Ziele einer
+Seite samt Stylesheets, Skripten und Bildern. Blöcke, die selbst aus dem Graphen entstehen
+(verwandte Artikel, Backlinks), und Glossar-Links bleiben außen vor, damit
+der Graph nicht auf sich selbst zurückwirkt.
+
+Inkrementell: .build/links.json merkt sich pro Seite Größe und
+Änderungszeit und die ausgehenden Links; nur geänderte Seiten werden neu
+gelesen.
+"""
+
+import html
+import json
+import posixpath
+import re
+from urllib.parse import unquote
+
+from auto_links import content_region
+from page_blocks import strip_blocks
+from safe_write import write_text
+from site_manifest import BASE_PATH
+
+LINK_CACHE_PATH = BASE_PATH / '.build' / 'links.json'
+LINK_CACHE_VERSION = 1
+
+# Generierte Blöcke, die aus dem Graphen berechnet werden
+IGNORED_BLOCKS = ('related', 'backlinks')
+
+# Automatisch gesetzte Links, die kein Verweis im eigentlichen Sinn sind
+IGNORED_LINK_CLASSES = ('glossary-link',)
+
+_ANCHOR_TAG = re.compile(r'<a\b[^>]*>', re.I)
+_HREF = re.compile(r'\bhref\s*=\s*(["\'])(.*?)\1', re.I | re.S)
+_CLASS = re.compile(r'\bclass\s*=\s*(["\'])(.*?)\1', re.I | re.S)
+_SCHEME = re.compile(r'^[a-zA-Z][a-zA-Z0-9+.-]*:')
+_REFERENCE = re.compile(r'\b(?:href|src)\s*=\s*(["\'])(.*?)\1', re.I | re.S)
+_SRCSET = re.compile(r'\bsrcset\s*=\s*(["\'])(.*?)\1', re.I | re.S)
+_CSS_URL = re.compile(r'url\(\s*(["\']?)([^"\')]+)\1\s*\)|@import\s+(["\'])(.*?)\3', re.I)
+
+
+def page_stat(path):
+    stat = path.stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def resolve_link(href, rel, directory=BASE_PATH):
+    """
+    Pfad des Linkziels relativ zu directory oder None (extern, nur Anker,
+    außerhalb der Seite). Verzeichnisse werden zu .../index.html.
+    """
+    href = html.unescape(href.strip()).split('#', 1)[0].split('?', 1)[0]
+    if not href or _SCHEME.match(href) or href.startswith('//'):
+        return None
+    if href.startswith('/'):
+        path = href.lstrip('/')
+    else:
+        path = posixpath.join(posixpath.dirname(rel), href)
+    path = posixpath.normpath(unquote(path))
+    if path == '..' or path.startswith('../'):
+        return None
+    if path == '.' or href.endswith('/') or (directory / path).is_dir():
+        path = posixpath.normpath(posixpath.join(path, 'index.html'))
+    return path
+
+
+def content_links(page_html, rel, directory=BASE_PATH):
+    """Sortierte Ziele aller Links im Inhalt einer Seite (ohne sich selbst)"""
+    page_html = strip_blocks(page_html, IGNORED_BLOCKS)
+    region = content_region(page_html)
+    if region is None:
+        return []
+    targets = set()
+    for tag in _ANCHOR_TAG.finditer(page_html, *region):
+        css = _CLASS.search(tag.group(0))
+        if css and set(css.group(2).split()) & set(IGNORED_LINK_CLASSES):
+            continue
+        href = _HREF.search(tag.group(0))
+        target = resolve_link(href.group(2), rel, directory) if href else None
+        if target is not None and target != rel:
+            targets.add(target)
+    return sorted(targets)
+
+
+def page_references(page_html, rel, directory=BASE_PATH):
+    """Alle lokalen Ziele einer Seite: Links, Stylesheets, Skripte, Bilder"""
+    hrefs = [match.group(2) for match in _REFERENCE.finditer(page_html)]
+    for match in _SRCSET.finditer(page_html):
+        hrefs.extend(candidate.split()[0] for candidate in match.group(2).split(',') if candidate.strip())
+    return _resolve_all(hrefs, rel, directory)
+
+
+def css_references(css, rel, directory=BASE_PATH):
+    """Lokale Ziele in einem Stylesheet (url(...), @import)"""
+    hrefs = [match.group(2) or match.group(4) for match in _CSS_URL.finditer(css)]
+    return _resolve_all(hrefs, rel, directory)
+
+
+def _resolve_all(hrefs, rel, directory):
+    targets = {resolve_link(href, rel, directory) for href in hrefs}
+    targets.discard(None)
+    targets.discard(rel)
+    return sorted(targets)
+
+
+def load_link_cache():
+    try:
+        data = json.loads(LINK_CACHE_PATH.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if data.get('version') != LINK_CACHE_VERSION:
+        return {}
+    return data['pages']
+
+
+def store_link_cache(entries, directory=BASE_PATH):
+    """Ergänzt den Cache um entries; Einträge gelöschter Seiten entfallen"""
+    pages = {rel: entry for rel, entry in load_link_cache().items() if (directory / rel).is_file()}
+    pages.update(entries)
+    try:
+        LINK_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        write_text(LINK_CACHE_PATH, json.dumps({'version': LINK_CACHE_VERSION, 'pages': pages}, ensure_ascii=False))
+    except OSError:
+        # Cache ist optional
+        pass
+
+
+def collect_links(paths, cache, directory=BASE_PATH):
+    """
+    Ausgehende Links pro Seite als Cache-Einträge {'stat', 'links'} und
+    Anzahl neu gelesener Seiten. Seiten mit unveränderter Größe und
+    Änderungszeit werden nicht gelesen.
+    """
+    entries = {}
+    scanned = 0
+    for rel in paths:
+        path = directory / rel
+        try:
+            stat = page_stat(path)
+            cached = cache.get(rel)
+            if cached is not None and cached['stat'] == stat:
+                entries[rel] = cached
+                continue
+            page_html = path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"  ⚠️  {rel}: {e}")
+            continue
+        entries[rel] = {'stat': stat, 'links': content_links(page_html, rel, directory)}
+        scanned += 1
+    return entries, scanned
+
+
+def invert(graph):
+    """{Quelle: [Ziele]} -> {Ziel: [Quellen]}, Quellen sortiert"""
+    inbound = {}
+    for source, targets in graph.items():
+        for target in targets:
+            inbound.setdefault(target, []).append(source)
+    return {target: sorted(sources) for target, sources in inbound.items()}
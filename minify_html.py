@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+HTML-Minifizierung für generierte Seiten
+Entfernt Kommentare, Einrückungen und Leerzeilen aus HTML, Inline-CSS und Inline-JS.
+Inhalt von <pre> und <textarea> bleibt unverändert.
+
+Dev-Modus (keine Minifizierung):
+  JAC_DEV=1 python3 ultra_minimal.py
+"""
+
+import os
+import re
+from pathlib import Path
+
+from safe_write import TreeLocked, tree_lock, write_text
+from site_manifest import EXCLUDE_DIRS
+
+BASE_PATH = Path(__file__).parent
+
+# Dev-Modus: Ausgabe bleibt lesbar
+DEV_MODE = os.environ.get('JAC_DEV', '') not in ('', '0')
+
+# Elemente, deren Inhalt nicht angefasst wird
+PRESERVE_TAGS = {'pre', 'textarea'}
+
+# Elemente mit eigenem Minifier
+RAW_TAGS = {'script', 'style'} | PRESERVE_TAGS
+
+# Kommentare, die erhalten bleiben (Conditional Comments, Partial- und
+# Block-Marker aus site_partials.py und page_blocks.py)
+KEEP_COMMENTS = ('<!--[if', '<!-- partial:', '<!-- /partial:', '<!-- generated:', '<!-- /generated:')
+
+_TAG_NAME = re.compile(r'<(/?)([a-zA-Z][a-zA-Z0-9-]*)')
+# Ende eines Tags: '>' in Attributwerten ("...", '...' nach '=') zählt nicht
+_TAG_END = re.compile(r'[^>=]*(?:=\s*(?:"[^"]*"|\'[^\']*\')?[^>=]*)*>')
+_CLOSE_TAG = {tag: re.compile(r'</' + tag + r'\s*>', re.IGNORECASE) for tag in RAW_TAGS}
+_WHITESPACE = re.compile(r'\s+')
+_TAG_WHITESPACE = re.compile(r'("[^"]*"|\'[^\']*\')|\s+')
+_SCRIPT_TYPE = re.compile(r'\stype\s*=\s*["\']?([^"\'\s>]+)', re.IGNORECASE)
+
+_CSS_TOKEN = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|(/\*.*?\*/)', re.DOTALL)
+_CSS_PUNCT = re.compile(r'\s*([{};,>])\s*')
+_CSS_COLON = re.compile(r':\s+')
+
+_JS_TYPES = {'text/javascript', 'application/javascript', 'module'}
+
+
+def _collapse(text):
+    """Fasst Whitespace-Läufe zu einem Zeichen zusammen (Zeilenumbruch bleibt erkennbar)"""
+    return _WHITESPACE.sub(lambda m: '\n' if '\n' in m.group(0) else ' ', text)
+
+
+def minify_css(css):
+    """Minifiziert CSS (Strings bleiben unverändert)"""
+    parts = []
+    # Code zwischen zwei Strings (Kommentare fallen weg)
+    code = []
+    pos = 0
+    for match in _CSS_TOKEN.finditer(css):
+        code.append(css[pos:match.start()])
+        if match.group(1):
+            parts.append(_minify_css_code(''.join(code)))
+            parts.append(match.group(1))
+            code = []
+        pos = match.end()
+    code.append(css[pos:])
+    parts.append(_minify_css_code(''.join(code)))
+    return ''.join(parts).strip()
+
+
+def _minify_css_code(code):
+    code = _WHITESPACE.sub(' ', code)
+    code = _CSS_PUNCT.sub(r'\1', code)
+    return _CSS_COLON.sub(':', code).replace(';}', '}')
+
+
+def minify_js(js):
+    """
+    Minifiziert JavaScript konservativ: Einrückung, Leerzeilen und
+    ganzzeilige //-Kommentare werden entfernt, Zeilenumbrüche bleiben
+    (keine Probleme mit automatischer Semikolon-Einfügung).
+    """
+    # Template-Literale können mehrzeiligen Text enthalten - nicht anfassen
+    if '`' in js:
+        return js
+
+    lines = []
+    continued = False
+    for line in js.split('\n'):
+        if continued:
+            # Fortsetzung eines Strings mit "\" am Zeilenende
+            lines.append(line)
+        else:
+            line = line.strip()
+            if line and not line.startswith('//'):
+                lines.append(line)
+        continued = line.endswith('\\')
+    return '\n'.join(lines)
+
+
+def _minify_raw(name, start_tag, body):
+    if name == 'style':
+        return minify_css(body)
+    if name == 'script':
+        match = _SCRIPT_TYPE.search(start_tag)
+        if match is None or match.group(1).lower() in _JS_TYPES:
+            return minify_js(body)
+    return body
+
+
+def minify_html(html):
+    """Minifiziert ein HTML-Dokument in einem Durchlauf"""
+    out = []
+    pos = 0
+
+    while True:
+        lt = html.find('<', pos)
+        if lt < 0:
+            out.append(_collapse(html[pos:]))
+            break
+        out.append(_collapse(html[pos:lt]))
+
+        # Kommentare entfernen (Conditional Comments und Partial-Marker behalten)
+        if html.startswith('<!--', lt):
+            close = html.find('-->', lt + 4)
+            if close < 0:
+                out.append(html[lt:])
+                break
+            if html.startswith(KEEP_COMMENTS, lt):
+                out.append(html[lt:close + 3])
+            pos = close + 3
+            continue
+
+        # Ein einzelnes '<' im Text ist kein Tag
+        match = _TAG_NAME.match(html, lt)
+        if not match and not html.startswith(('<!', '<?'), lt):
+            out.append('<')
+            pos = lt + 1
+            continue
+
+        if html.find('>', lt + 1) < 0:
+            out.append(html[lt:])
+            break
+        gt = _TAG_END.match(html, match.end() if match else lt + 2).end() - 1
+
+        start_tag = _TAG_WHITESPACE.sub(lambda m: m.group(1) or ' ', html[lt:gt + 1])
+        if start_tag.endswith(' >'):
+            start_tag = start_tag[:-2] + '>'
+        out.append(start_tag)
+        pos = gt + 1
+
+        if not match or match.group(1):
+            continue
+        name = match.group(2).lower()
+        if name not in RAW_TAGS or html[gt - 1] == '/':
+            continue
+
+        close = _CLOSE_TAG[name].search(html, pos)
+        if not close:
+            out.append(html[pos:])
+            break
+        body = html[pos:close.start()]
+        out.append(body if name in PRESERVE_TAGS else _minify_raw(name, start_tag, body))
+        out.append(close.group(0))
+        pos = close.end()
+
+    return ''.join(out).strip() + '\n'
+
+
+def minify_output(html):
+    """Ausgabe-Stufe für die Konverter: im Dev-Modus unverändert"""
+    if DEV_MODE:
+        return html
+    return minify_html(html)
+
+
+def find_pages(directory):
+    """Findet alle HTML-Seiten rekursiv (ohne Templates und Backups)"""
+    pages = []
+    for f in directory.rglob('*.html'):
+        parts = f.relative_to(directory).parts
+        if parts[0] in EXCLUDE_DIRS or any(part.startswith('.') for part in parts):
+            continue
+        if f.is_file():
+            pages.append(f)
+    return sorted(pages)
+
+
+def main():
+    print("=" * 60)
+    print("🗜️  HTML-Minifizierung")
+    print("=" * 60)
+
+    try:
+        tree_lock()
+    except TreeLocked as e:
+        print(f"❌ {e}")
+        return
+
+    if DEV_MODE:
+        print("ℹ️  Dev-Modus aktiv (JAC_DEV) - keine Minifizierung")
+        return
+
+    pages = find_pages(BASE_PATH)
+    print(f"\n📁 Verzeichnis: {BASE_PATH}")
+    print(f"📋 {len(pages)} Seiten gefunden\n")
+
+    resp = input("Alle Seiten minifizieren? (j/n): ")
+    if resp.lower() not in ['j', 'ja', 'y', 'yes']:
+        print("❌ Abgebrochen")
+        return
+
+    before = after = 0
+    for page in pages:
+        try:
+            content = page.read_text(encoding='utf-8')
+            minified = minify_html(content)
+            before += len(content.encode('utf-8'))
+            after += len(minified.encode('utf-8'))
+            if minified != content:
+                write_text(page, minified)
+        except Exception as e:
+            print(f"  ❌ {page.relative_to(BASE_PATH)}: {e}")
+
+    saved = before - after
+    print("\n" + "=" * 60)
+    print(f"   📦 Vorher: {before / 1024:.0f} KB")
+    print(f"   📦 Nachher: {after / 1024:.0f} KB")
+    if before:
+        print(f"   ✅ Gespart: {saved / 1024:.0f} KB ({saved / before:.0%})")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
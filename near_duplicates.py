@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Fast-Dubletten finden (MinHash + LSH)
+Zerlegt den Text jeder Seite und jedes Abschnitts in Wort-Shingles,
+bildet daraus MinHash-Signaturen und sucht Kandidaten über LSH-Buckets -
+ohne jede Seite mit jeder zu vergleichen.
+
+Gemeldet werden Seiten (z.B. hip-spine/inddex.html neben index.html) und
+Abschnitte, die auf verschiedenen Seiten fast gleich vorkommen. Das
+Ergebnis steht zusätzlich in .build/duplicates.json, damit Build und
+Deploy redundante Seiten auslassen können.
+
+Verwendung:
+  python3 near_duplicates.py                  # Bericht
+  python3 near_duplicates.py --threshold 0.6  # Ähnlichkeitsschwelle
+"""
+
+import argparse
+import hashlib
+import json
+import re
+
+from html_matcher import find_elements
+from page_blocks import strip_blocks
+from safe_write import write_text
+from site_manifest import BASE_PATH, find_pages
+from text_vectors import html_text, page_text
+
+CACHE_PATH = BASE_PATH / '.build' / 'duplicates.json'
+CACHE_VERSION = 1
+
+# Wörter pro Shingle
+SHINGLE_SIZE = 5
+
+# Signaturlänge = BANDS * ROWS (LSH-Schwelle ca. (1/BANDS) ** (1/ROWS) = 0.42)
+BANDS = 32
+ROWS = 4
+NUM_BINS = BANDS * ROWS
+
+# Geschätzte Jaccard-Ähnlichkeit, ab der gemeldet wird
+THRESHOLD = 0.7
+
+# Seiten und Abschnitte mit weniger Shingles sind zu kurz für einen
+# Vergleich (Platzhalter wie "Inhalt wird noch hinzugefügt")
+MIN_SHINGLES = 30
+
+_WORD = re.compile(r'\w+')
+_SECTION_ID = re.compile(r'<section[^>]*\bid="([^"]*)"')
+
+# Abstand für aufgefüllte leere Bins (größer als jeder Hash-Wert)
+_OFFSET = 1 << 64
+
+
+def shingle_hashes(text):
+    """64-Bit-Hashes aller Wort-Shingles"""
+    words = _WORD.findall(text.lower())
+    if len(words) < SHINGLE_SIZE:
+        words = words and [' '.join(words)]
+        size = 1
+    else:
+        size = SHINGLE_SIZE
+    return {
+        int.from_bytes(hashlib.blake2b(' '.join(words[i:i + size]).encode('utf-8'), digest_size=8).digest(), 'big')
+        for i in range(len(words) - size + 1)
+    }
+
+
+def minhash(hashes):
+    """
+    MinHash-Signatur mit einer einzigen Permutation (One-Permutation-Hashing):
+    Jeder Hash fällt in einen von NUM_BINS Bins, pro Bin zählt das Minimum.
+    Leere Bins übernehmen den nächsten belegten Bin rechts davon (plus
+    Abstand), damit LSH auch kurze Texte sinnvoll vergleicht. Linear in der
+    Anzahl Shingles statt NUM_BINS Hash-Funktionen pro Shingle.
+    hashes darf nicht leer sein.
+    """
+    bins = [None] * NUM_BINS
+    for value in hashes:
+        index, rest = value % NUM_BINS, value // NUM_BINS
+        if bins[index] is None or rest < bins[index]:
+            bins[index] = rest
+
+    signature = []
+    for i in range(NUM_BINS):
+        distance = 0
+        while bins[(i + distance) % NUM_BINS] is None:
+            distance += 1
+        signature.append(bins[(i + distance) % NUM_BINS] + distance * _OFFSET)
+    return signature
+
+
+def similarity(a, b):
+    """Geschätzte Jaccard-Ähnlichkeit zweier Signaturen"""
+    return sum(1 for x, y in zip(a, b) if x == y) / NUM_BINS
+
+
+def candidate_pairs(signatures):
+    """Paare, die in mindestens einem LSH-Band denselben Bucket teilen"""
+    pairs = set()
+    for band in range(BANDS):
+        buckets = {}
+        lo = band * ROWS
+        for key, signature in signatures.items():
+            buckets.setdefault(tuple(signature[lo:lo + ROWS]), []).append(key)
+        for keys in buckets.values():
+            for i, a in enumerate(keys):
+                for b in keys[i + 1:]:
+                    pairs.add((a, b) if a < b else (b, a))
+    return pairs
+
+
+def page_sections(page_html):
+    """(ID, Text) aller äußersten <section>-Elemente"""
+    content = strip_blocks(page_html)
+    sections = []
+    for n, (start, end) in enumerate(find_elements(content, 'section'), 1):
+        section_id = _SECTION_ID.match(content, start)
+        sections.append((section_id.group(1) if section_id else str(n), html_text(content[start:end])))
+    return sections
+
+
+def signatures_for(page_html):
+    """Signatur der Seite (None, wenn zu kurz) und ihrer Abschnitte"""
+    sections = {}
+    for section_id, text in page_sections(page_html):
+        hashes = shingle_hashes(text)
+        if len(hashes) >= MIN_SHINGLES:
+            sections[section_id] = minhash(hashes)
+    hashes = shingle_hashes(page_text(page_html))
+    return {
+        'page': minhash(hashes) if len(hashes) >= MIN_SHINGLES else None,
+        'sections': sections,
+    }
+
+
+def load_cache():
+    try:
+        data = json.loads(CACHE_PATH.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if data.get('version') != CACHE_VERSION:
+        return {}
+    return data['pages']
+
+
+def store_cache(pages, duplicates):
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        write_text(CACHE_PATH, json.dumps({
+            'version': CACHE_VERSION,
+            'duplicates': duplicates,
+            'pages': pages,
+        }, ensure_ascii=False))
+    except OSError:
+        # Cache ist optional
+        pass
+
+
+def collect_signatures(directory, cache):
+    """Signaturen aller Seiten; unveränderte Seiten kommen aus dem Cache"""
+    entries = {}
+    scanned = 0
+    for path in find_pages(directory):
+        rel = path.relative_to(directory).as_posix()
+        try:
+            page_html = path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"  ⚠️  {rel}: {e}")
+            continue
+        digest = hashlib.sha256(strip_blocks(page_html).encode('utf-8')).hexdigest()[:16]
+        cached = cache.get(rel)
+        if cached is not None and cached['hash'] == digest:
+            entries[rel] = cached
+            continue
+        entries[rel] = dict(signatures_for(page_html), hash=digest)
+        scanned += 1
+    return entries, scanned
+
+
+def _ranking(pair):
+    return -pair[2], pair[0], pair[1]
+
+
+def find_duplicates(entries, threshold=THRESHOLD):
+    """
+    Fast-Dubletten als Listen von (a, b, Ähnlichkeit), absteigend.
+    Abschnitte werden als 'pfad#id' gemeldet, nur zwischen verschiedenen
+    Seiten, die nicht schon als Ganzes doppelt sind.
+    """
+    pages = {rel: entry['page'] for rel, entry in entries.items() if entry['page'] is not None}
+    page_pairs = []
+    for a, b in candidate_pairs(pages):
+        score = similarity(pages[a], pages[b])
+        if score >= threshold:
+            page_pairs.append((a, b, score))
+    duplicate_pages = {(a, b) for a, b, _ in page_pairs}
+
+    sections = {
+        f'{rel}#{section_id}': signature
+        for rel, entry in entries.items()
+        for section_id, signature in entry['sections'].items()
+    }
+    section_pairs = []
+    for a, b in candidate_pairs(sections):
+        page_a, page_b = a.split('#', 1)[0], b.split('#', 1)[0]
+        if page_a == page_b or (min(page_a, page_b), max(page_a, page_b)) in duplicate_pages:
+            continue
+        score = similarity(sections[a], sections[b])
+        if score >= threshold:
+            section_pairs.append((a, b, score))
+
+    return sorted(page_pairs, key=_ranking), sorted(section_pairs, key=_ranking)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fast-doppelte Seiten und Abschnitte finden")
+    parser.add_argument('--threshold', type=float, default=THRESHOLD, help="Ähnlichkeitsschwelle (0-1)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("🧬 Fast-Dubletten")
+    print("=" * 60)
+
+    entries, scanned = collect_signatures(BASE_PATH, load_cache())
+    page_pairs, section_pairs = find_duplicates(entries, args.threshold)
+    placeholders = sorted(rel for rel, entry in entries.items() if entry['page'] is None)
+
+    if page_pairs:
+        print("\n📄 Seiten:")
+        for a, b, score in page_pairs:
+            print(f"  {score:4.0%}  {a}  ↔  {b}")
+    if section_pairs:
+        print("\n📑 Abschnitte:")
+        for a, b, score in section_pairs:
+            print(f"  {score:4.0%}  {a}  ↔  {b}")
+    if placeholders:
+        print("\n📭 Zu wenig Text für einen Vergleich:")
+        for rel in placeholders:
+            print(f"  {rel}")
+
+    store_cache(entries, {
+        'pages': [list(pair) for pair in page_pairs],
+        'sections': [list(pair) for pair in section_pairs],
+        'placeholders': placeholders,
+    })
+
+    print("\n" + "=" * 60)
+    print("ZUSAMMENFASSUNG:")
+    print(f"   📄 Seiten: {len(entries)} ({scanned} neu eingelesen)")
+    print(f"   🧬 Doppelte Seiten: {len(page_pairs)}")
+    print(f"   📑 Doppelte Abschnitte: {len(section_pairs)}")
+    print(f"   📭 Zu wenig Text: {len(placeholders)}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
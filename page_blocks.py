@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Generierte Blöcke in Seiten
+Build-Stufen (Paper-Listen, verwandte Artikel, ...) schreiben ihre Ausgabe
+in markierte Bereiche:
+
+    <!-- generated:related -->...<!-- /generated:related -->
+
+Beim nächsten Lauf wird nur der Bereich ersetzt. Textanalysen entfernen
+die Bereiche vorher, damit generierter Text nicht zurückfließt.
+"""
+
+import re
+
+# Block samt Einrückung und Zeilenende (so wie set_block ihn einfügt)
+_BLOCK = re.compile(r'[ \t]*<!-- generated:([\w-]+) -->.*?<!-- /generated:\1 -->[ \t]*\n?', re.S)
+
+
+def start_marker(name):
+    return f'<!-- generated:{name} -->'
+
+
+def end_marker(name):
+    return f'<!-- /generated:{name} -->'
+
+
+def wrap(name, content):
+    """Fasst Inhalt in die Marker ein"""
+    return f'{start_marker(name)}\n{content}\n{end_marker(name)}'
+
+
+def find_block(html, name):
+    """(start, end) des Blocks inklusive Marker oder None"""
+    start = html.find(start_marker(name))
+    if start < 0:
+        return None
+    end = html.find(end_marker(name), start)
+    if end < 0:
+        return None
+    return start, end + len(end_marker(name))
+
+
+def block_spans(html):
+    """(start, end) aller Blöcke inklusive Marker"""
+    return [(m.start(), m.end()) for m in _BLOCK.finditer(html)]
+
+
+def strip_blocks(html, names=None):
+    """Entfernt alle generierten Blöcke (oder nur die mit den Namen names)"""
+    if names is None:
+        return _BLOCK.sub('', html)
+    return _BLOCK.sub(lambda m: '' if m.group(1) in names else m.group(0), html)
+
+
+def set_block(html, name, block, anchor='</article>'):
+    """
+    Ersetzt den Block oder fügt ihn vor dem letzten anchor ein (eine Ebene
+    tiefer eingerückt). block enthält die Marker (siehe wrap). Ohne Block
+    und ohne anchor bleibt die Seite unverändert.
+    """
+    span = find_block(html, name)
+    if span is not None:
+        return html[:span[0]] + block + html[span[1]:]
+    if anchor is None:
+        return html
+    close = html.rfind(anchor)
+    if close < 0:
+        return html
+    line_start = html.rfind('\n', 0, close) + 1
+    indent = html[line_start:close] if not html[line_start:close].strip() else ''
+    return html[:close] + '    ' + block + '\n' + indent + html[close:]
+
+
+def remove_block(html, name):
+    """Entfernt den Block samt Einrückung und Zeilenende"""
+    span = find_block(html, name)
+    if span is None:
+        return html
+    start, end = span
+    while start > 0 and html[start - 1] in ' \t':
+        start -= 1
+    while end < len(html) and html[end] in ' \t':
+        end += 1
+    if html.startswith('\n', end):
+        end += 1
+    return html[:start] + html[end:]
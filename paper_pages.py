@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+"""
+Paper-Seiten aus strukturierten Datensätzen
+Jedes Paper ist ein JSON-Datensatz unter papers/<artikel>/<slug>.json
+(Titel, Autoren, Jahr, Journal, Kernaussagen, übergeordneter Artikel).
+Daraus werden die Seiten <artikel>/<slug>/index.html über das
+Artikel-Template erzeugt, dazu die Paper-Liste im übergeordneten Artikel.
+Die Zitierweise unter "Bibliografische Daten" kommt aus dem Eintrag der
+Seite im Literaturverzeichnis (bibliography.py).
+
+Gebaut wird parallel und inkrementell: .build/papers.json merkt sich pro
+Datensatz einen Hash; nur geänderte Datensätze werden neu gerendert.
+Seiten gelöschter Datensätze werden entfernt.
+
+Verwendung:
+  python3 paper_pages.py                            # geänderte Paper bauen
+  python3 paper_pages.py --all                      # alle Paper neu bauen
+  python3 paper_pages.py --import beinlaengendifferenz   # Paper-Fragmente übernehmen
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from bibliography import Bibliography, BibliographyError, load_bibliography, render_reference
+from minify_html import minify_output
+from page_blocks import end_marker, set_block, start_marker
+from safe_write import TreeLocked, tree_lock, write_text
+from site_manifest import load_manifest
+from template_engine import TEMPLATE_DIR, get_template
+
+BASE_PATH = Path(__file__).parent
+PAPER_DIR = BASE_PATH / 'papers'
+RECORD_PATH = BASE_PATH / '.build' / 'papers.json'
+
+# Paper-Template (templates/paper.html, Header/Footer aus den Site-Partials)
+TEMPLATE_NAME = 'paper'
+
+# Ab dieser Anzahl wird auf mehrere Prozesse verteilt
+PARALLEL_MIN = 16
+
+# Pflichtfelder eines Datensatzes
+REQUIRED_FIELDS = ('parent', 'slug', 'title')
+
+# Bibliografische Felder: (Schlüssel, Bezeichnung)
+BIB_FIELDS = (
+    ('authors', 'Autor(en)'),
+    ('title', 'Titel'),
+    ('journal', 'Journal'),
+    ('year', 'Jahr'),
+    ('study_type', 'Studientyp'),
+)
+
+# Bezeichnung der Zitierweise aus dem Literaturverzeichnis
+REFERENCE_LABEL = 'Zitierweise'
+
+# Abschnitt, dessen Liste als Kernaussagen gilt
+FINDINGS_PREFIX = 'Wichtigste Erkenntnisse'
+
+# Generierter Block der Paper-Liste im übergeordneten Artikel
+LIST_BLOCK = 'papers'
+
+_BIB_ITEM = re.compile(r'<li><strong>([^<]+?):</strong>(.*?)</li>', re.S)
+_H3 = re.compile(r'<h3[^>]*>(.*?)</h3>', re.S)
+_SUBSECTION = re.compile(r'<h4[^>]*>(.*?)</h4>\s*<ul>(.*?)</ul>', re.S)
+_PARAGRAPH = re.compile(r'<p[^>]*>(.*?)</p>', re.S)
+_LIST_ITEM = re.compile(r'<li>(.*?)</li>', re.S)
+_MARKDOWN_BOLD = re.compile(r'\*\*(.+?)\*\*')
+_WHITESPACE = re.compile(r'\s+')
+_TAGS = re.compile(r'<[^>]+>')
+
+
+class PaperError(Exception):
+    """Ungültiger Paper-Datensatz"""
+
+
+def make_id(text):
+    """Erstellt eine ID aus einem Text."""
+    text = text.lower()
+    text = text.replace('ä', 'ae').replace('ö', 'oe').replace('ü', 'ue').replace('ß', 'ss')
+    text = re.sub(r'[^a-z0-9]+', '-', text)
+    text = text.strip('-')
+    return text[:50] if text else 'section'
+
+
+def _inline(text):
+    """Fließtext aus einem Fragment: Whitespace zusammenfassen, **fett** umwandeln"""
+    text = _WHITESPACE.sub(' ', text).strip()
+    return _MARKDOWN_BOLD.sub(r'<strong>\1</strong>', text)
+
+
+def _plain(text):
+    return html.unescape(_TAGS.sub('', _inline(text)))
+
+
+# ============================================================================
+# DATENSÄTZE
+# ============================================================================
+
+def load_record(path):
+    """Liest und prüft einen Datensatz"""
+    try:
+        record = json.loads(path.read_text(encoding='utf-8'))
+    except ValueError as e:
+        raise PaperError(f"{path.name}: kein gültiges JSON ({e})") from None
+    missing = [field for field in REQUIRED_FIELDS if not record.get(field)]
+    if missing:
+        raise PaperError(f"{path.name}: Pflichtfelder fehlen: {', '.join(missing)}")
+    record.setdefault('summary', [])
+    record.setdefault('findings', [])
+    record.setdefault('sections', [])
+    return record
+
+
+def find_records(directory=PAPER_DIR):
+    return sorted(directory.glob('*/*.json'))
+
+
+def output_path(record):
+    return BASE_PATH / record['parent'] / record['slug'] / 'index.html'
+
+
+def remove_page(key):
+    """Entfernt die Seite <artikel>/<slug>/index.html (und den leeren Ordner)"""
+    target = BASE_PATH / key / 'index.html'
+    if not target.exists():
+        return False
+    target.unlink()
+    try:
+        target.parent.rmdir()
+    except OSError:
+        # Ordner enthält noch andere Dateien
+        pass
+    return True
+
+
+# ============================================================================
+# RENDERN
+# ============================================================================
+
+def _list(items):
+    lines = ''.join(f'                    <li>{item}</li>\n' for item in items)
+    return f'                <ul>\n{lines}                </ul>\n'
+
+
+def paper_sections(record, reference=None):
+    """Abschnitte der Paper-Seite als (Titel, HTML); reference ist die gerenderte Zitierweise"""
+    bib = []
+    for key, label in BIB_FIELDS:
+        if record.get(key):
+            bib.append(f'<strong>{label}:</strong> {html.escape(str(record[key]), quote=False)}')
+    if reference:
+        bib.append(f'<strong>{REFERENCE_LABEL}:</strong> {reference}')
+
+    sections = [('Bibliografische Daten', _list(bib))]
+    if record['summary']:
+        body = ''.join(f'                <p>{paragraph}</p>\n' for paragraph in record['summary'])
+        sections.append(('Zusammenfassung', body))
+    if record['findings']:
+        sections.append((FINDINGS_PREFIX, _list(record['findings'])))
+    for section in record['sections']:
+        sections.append((section['title'], _list(section['items'])))
+    return sections
+
+
+def subtitle(record):
+    source = ' '.join(str(record[key]) for key in ('journal', 'year') if record.get(key))
+    return ' · '.join(part for part in (record.get('authors', ''), source) if part)
+
+
+def render_paper(record, category, reference=None):
+    """Rendert eine Paper-Seite über das Artikel-Template"""
+    toc_item = get_template('partials/toc_item')
+    section_template = get_template('partials/section')
+
+    toc_items = []
+    article_sections = []
+    for i, (title, body) in enumerate(paper_sections(record, reference)):
+        section_id = make_id(title)
+        active = ' class="toc-link active"' if i == 0 else ' class="toc-link"'
+        toc_items.append(toc_item.render(id=section_id, active=active, title=html.escape(title, quote=False)))
+        article_sections.append(section_template.render(id=section_id, title=html.escape(title, quote=False), body=body))
+
+    title = html.escape(record['title'], quote=False)
+    breadcrumb_title = record['title'][:45] + '...' if len(record['title']) > 45 else record['title']
+    result = get_template(TEMPLATE_NAME).render_text(
+        title=title,
+        breadcrumb_title=html.escape(breadcrumb_title, quote=False),
+        category=category,
+        subtitle=html.escape(subtitle(record), quote=False),
+        toc_items=b'\n'.join(toc_items),
+        article_sections=b'\n\n'.join(article_sections)
+    )
+    return minify_output(result)
+
+
+def build_job(job):
+    """Rendert und schreibt eine Seite (läuft ggf. in einem eigenen Prozess)"""
+    record, category, reference, target = job
+    page = render_paper(record, category, reference)
+    target = Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    write_text(target, page)
+    return str(target)
+
+
+def render_paper_list(papers):
+    """Paper-Liste für den übergeordneten Artikel"""
+    items = []
+    for record in papers:
+        link = html.escape(f"{record['slug']}/index.html")
+        source = html.escape(subtitle(record), quote=False)
+        title = html.escape(record['title'], quote=False)
+        items.append(f'<a href="{link}">{title}</a>' + (f'<br><small>{source}</small>' if source else ''))
+    return (
+        f'{start_marker(LIST_BLOCK)}\n'
+        f'            <section id="paper">\n'
+        f'                <h2>Paper-Zusammenfassungen ({len(papers)})</h2>\n'
+        f'{_list(items)}'
+        f'            </section>\n'
+        f'            {end_marker(LIST_BLOCK)}'
+    )
+
+
+def update_paper_list(page_html, papers):
+    """Ersetzt die markierte Paper-Liste oder fügt sie vor </article> ein"""
+    return set_block(page_html, LIST_BLOCK, render_paper_list(papers))
+
+
+# ============================================================================
+# BUILD
+# ============================================================================
+
+def _renderer_key():
+    """Hash über Template und Partials - ändert sich das Layout, wird alles neu gebaut"""
+    template = get_template(TEMPLATE_NAME)
+    digest = hashlib.sha256((TEMPLATE_DIR / f'{TEMPLATE_NAME}.html').read_bytes())
+    for name in ('partials/toc_item', 'partials/section'):
+        digest.update((TEMPLATE_DIR / f'{name}.html').read_bytes())
+    for partial_hash in sorted(template.deps.values()):
+        digest.update(partial_hash.encode())
+    digest.update(b'dev' if minify_output('<a>\n</a>') == '<a>\n</a>' else b'min')
+    return digest.hexdigest()
+
+
+def _job_hash(record, category, reference, renderer):
+    data = json.dumps([record, category, reference, renderer], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def load_build_record():
+    try:
+        return json.loads(RECORD_PATH.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_build_record(record):
+    RECORD_PATH.parent.mkdir(parents=True, exist_ok=True)
+    write_text(RECORD_PATH, json.dumps(record, indent=1, sort_keys=True))
+
+
+def run_jobs(jobs, workers=None):
+    """Baut die Seiten - ab PARALLEL_MIN Seiten auf mehrere Prozesse verteilt"""
+    if len(jobs) < PARALLEL_MIN:
+        return [build_job(job) for job in jobs]
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(build_job, jobs, chunksize=chunksize))
+
+
+def build(rebuild=False, workers=None):
+    """
+    Baut geänderte Paper-Seiten und die Paper-Listen ihrer Artikel und
+    entfernt Seiten gelöschter Datensätze.
+    Gibt (gebaute Seiten, Datensätze, geänderte Artikel, entfernte Seiten) zurück.
+    """
+    manifest = load_manifest()
+    renderer = _renderer_key()
+    stored = load_build_record()
+    previous = {} if rebuild else stored
+    try:
+        bibliography = load_bibliography()
+    except BibliographyError as e:
+        print(f"  ⚠️  {e} - Paper ohne Zitierweise")
+        bibliography = Bibliography()
+
+    records = []
+    for path in find_records():
+        try:
+            records.append(load_record(path))
+        except PaperError as e:
+            print(f"  ❌ {e}")
+
+    jobs = []
+    hashes = {}
+    for key, value in stored.items():
+        # Fehlerhafte Datensätze behalten ihre Seite, bis sie gelöscht werden
+        if (PAPER_DIR / f'{key}.json').exists():
+            hashes[key] = value
+    for record in records:
+        key = f"{record['parent']}/{record['slug']}"
+        category = manifest.category_label(record['parent'])[0]
+        entry = bibliography.for_page(f'{key}/index.html')
+        reference = render_reference(entry) if entry else None
+        hashes[key] = _job_hash(record, category, reference, renderer)
+        target = output_path(record)
+        if previous.get(key) != hashes[key] or not target.exists():
+            jobs.append((record, category, reference, str(target)))
+
+    for target in run_jobs(jobs, workers):
+        print(f"  ✅ {Path(target).relative_to(BASE_PATH).as_posix()}")
+
+    # Seiten, deren Datensatz gelöscht wurde
+    removed = []
+    for key in sorted(set(stored) - set(hashes)):
+        if remove_page(key):
+            print(f"  🗑️  {key}/index.html")
+            removed.append(key)
+
+    # Paper-Listen der übergeordneten Artikel (nur geänderte Listen werden geschrieben)
+    by_parent = {}
+    for record in records:
+        by_parent.setdefault(record['parent'], []).append(record)
+
+    changed_parents = []
+    for parent, papers in sorted(by_parent.items()):
+        page = manifest.page(parent)
+        if page is None:
+            print(f"  ⚠️  Artikel '{parent}' nicht gefunden - keine Paper-Liste")
+            continue
+        path = BASE_PATH / page['path']
+        page_html = path.read_text(encoding='utf-8')
+        papers.sort(key=lambda record: (str(record.get('year', '')), record['title']), reverse=True)
+        updated = update_paper_list(page_html, papers)
+        if updated != page_html:
+            write_text(path, updated)
+            changed_parents.append(parent)
+
+    save_build_record(hashes)
+    return len(jobs), len(records), changed_parents, removed
+
+
+# ============================================================================
+# IMPORT
+# ============================================================================
+
+def parse_fragment(fragment):
+    """
+    Liest ein Paper-Fragment (Bibliografische Daten, Zusammenfassung,
+    h4-Abschnitte mit Listen) in einen Datensatz. None, wenn die
+    bibliografischen Daten fehlen.
+    """
+    fields = {_plain(label): _plain(value) for label, value in _BIB_ITEM.findall(fragment)}
+    labels = {label: key for key, label in BIB_FIELDS}
+    record = {labels[label]: value for label, value in fields.items() if label in labels}
+    if not record.get('title'):
+        return None
+    if str(record.get('year', '')).isdigit():
+        record['year'] = int(record['year'])
+
+    # Zusammenfassung: Absätze nach der ersten Überschrift nach den Stammdaten
+    summary = []
+    heading = None
+    for match in _H3.finditer(fragment):
+        if 'Bibliografische' not in match.group(1):
+            heading = match
+            break
+    if heading:
+        rest = fragment[heading.end():]
+        first_h4 = rest.find('<h4')
+        rest = rest if first_h4 < 0 else rest[:first_h4]
+        summary = [_inline(p) for p in _PARAGRAPH.findall(rest)]
+    record['summary'] = summary
+
+    record['findings'] = []
+    record['sections'] = []
+    for title, items in _SUBSECTION.findall(fragment):
+        title = _plain(title)
+        items = [_inline(item) for item in _LIST_ITEM.findall(items)]
+        if title.startswith(FINDINGS_PREFIX) and not record['findings']:
+            record['findings'] = items
+        else:
+            record['sections'].append({'title': title, 'items': items})
+    return record
+
+
+def import_fragments(parent):
+    """
+    Übernimmt die Paper-Fragmente unter <artikel>/<paperX>/ als Datensätze.
+    Das Fragment wird entfernt - die Seite wird aus dem Datensatz neu erzeugt.
+    """
+    imported = 0
+    for path in sorted((BASE_PATH / parent).glob('*/*.html')):
+        if path.name == 'index.html':
+            continue
+        slug = path.parent.name
+        record = parse_fragment(path.read_text(encoding='utf-8'))
+        if record is None:
+            print(f"  ⏭️  {path.relative_to(BASE_PATH)}: keine bibliografischen Daten")
+            continue
+        record = {'parent': parent, 'slug': slug, **record}
+        target = PAPER_DIR / parent / f'{slug}.json'
+        target.parent.mkdir(parents=True, exist_ok=True)
+        write_text(target, json.dumps(record, ensure_ascii=False, indent=2) + '\n')
+        path.unlink()
+        print(f"  📥 {path.relative_to(BASE_PATH)} → {target.relative_to(BASE_PATH)}")
+        imported += 1
+    return imported
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Paper-Seiten aus Datensätzen erzeugen")
+    parser.add_argument('--all', action='store_true', help="alle Paper neu bauen")
+    parser.add_argument('--import', dest='import_parent', metavar='ARTIKEL',
+                        help="Paper-Fragmente eines Artikels als Datensätze übernehmen")
+    parser.add_argument('--workers', type=int, help="Anzahl Prozesse (Standard: alle Kerne)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("📄 Paper-Seiten")
+    print("=" * 60)
+
+    try:
+        tree_lock()
+    except TreeLocked as e:
+        print(f"❌ {e}")
+        return
+
+    if args.import_parent:
+        print(f"\n📥 Import aus {args.import_parent}/\n")
+        imported = import_fragments(args.import_parent)
+        print(f"\n   {imported} Datensätze angelegt\n")
+
+    built, total, parents, removed = build(rebuild=args.all, workers=args.workers)
+
+    print("\n" + "=" * 60)
+    print("ZUSAMMENFASSUNG:")
+    print(f"   📄 Datensätze: {total}")
+    print(f"   ✅ Gebaut: {built}")
+    print(f"   🗑️  Entfernt: {len(removed)}")
+    print(f"   📋 Paper-Listen aktualisiert: {', '.join(parents) or 'keine'}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Vergleich der HTML-Parser (html_backends.py)
+Führt jede Aufgabe aus convert_articles.py mit jedem installierten Parser
+über alle Artikel und Paper aus und meldet pro Parser:
+
+  - Durchsatz (Seiten/s und MB/s, bestes von --repeat Läufen)
+  - Übereinstimmung mit dem Referenz-Parser (bs4, sonst stdlib):
+      identisch    gleiche Zeichenkette
+      gleichwertig gleiche Tags, Attribute und Texte in gleicher
+                   Reihenfolge (Serialisierung darf abweichen)
+  - Fehler
+
+Am Ende steht pro Aufgabe der schnellste Parser, dessen Ergebnisse alle
+gleichwertig sind - der Kandidat für JOB_BACKENDS in convert_articles.py.
+
+Verwendung:
+  python3 parser_benchmark.py
+  python3 parser_benchmark.py --repeat 5
+  python3 parser_benchmark.py --job content
+"""
+
+import argparse
+import html
+import time
+from html.parser import HTMLParser
+
+from convert_articles import extract_content, extract_title
+from html_backends import available_backends, collapse
+from site_manifest import BASE_PATH, load_manifest
+
+BENCHMARK_KINDS = ('article', 'paper')
+
+# Aufgabe -> Funktion(html, backend)
+JOBS = {
+    'title': extract_title,
+    'content': extract_content,
+}
+
+# Referenz für die Übereinstimmung, der erste installierte
+REFERENCE_BACKENDS = ('bs4', 'stdlib')
+
+
+class _Canonical(HTMLParser):
+    """
+    Tokenfolge ohne Serialisierungsdetails: Start-Tags mit sortierten
+    Attributen und Text. Ein einzelnes '<' im Text liefert html.parser als
+    eigenes Datenstück - Text wird daher bis zum nächsten Tag gesammelt,
+    damit 'a < b' und 'a &lt; b' gleich aussehen.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.tokens = []
+        self.text = []
+
+    def flush(self):
+        text = collapse(''.join(self.text))
+        if text:
+            self.tokens.append(text)
+        self.text = []
+
+    def handle_starttag(self, tag, attrs):
+        self.flush()
+        # bs4 schreibt <meta charset> in Kleinbuchstaben (Zeichensatznamen sind case-insensitiv)
+        attrs = [(name, value.lower() if name == 'charset' and value else value) for name, value in attrs]
+        attrs = ' '.join(f'{name}="{html.escape(value or "")}"' for name, value in sorted(attrs))
+        self.tokens.append(f'<{tag} {attrs}>' if attrs else f'<{tag}>')
+
+    def handle_endtag(self, tag):
+        # End-Tags ergänzt oder lässt jeder Parser anders weg
+        self.flush()
+
+    def handle_data(self, data):
+        self.text.append(data)
+
+
+def canonical(output):
+    if not isinstance(output, str) or '<' not in output:
+        return output
+    parser = _Canonical()
+    parser.feed(output)
+    parser.close()
+    parser.flush()
+    return parser.tokens
+
+
+def run_job(job, backend, pages, repeat):
+    """(beste Laufzeit, {Pfad: Ergebnis}, {Pfad: Fehler})"""
+    function = JOBS[job]
+    best = None
+    results = {}
+    errors = {}
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for rel, source in pages:
+            try:
+                results[rel] = function(source, backend)
+            except Exception as e:
+                errors[rel] = f"{type(e).__name__}: {e}"
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, results, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML-Parser vergleichen")
+    parser.add_argument('--repeat', type=int, default=3, help="Läufe pro Parser (bester zählt)")
+    parser.add_argument('--job', choices=sorted(JOBS), action='append', help="nur diese Aufgabe(n)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("⏱️  Parser-Vergleich")
+    print("=" * 60)
+
+    pages = []
+    for page in load_manifest().of_kind(*BENCHMARK_KINDS):
+        try:
+            pages.append((page['path'], (BASE_PATH / page['path']).read_text(encoding='utf-8')))
+        except (OSError, UnicodeDecodeError):
+            continue
+    megabytes = sum(len(source.encode('utf-8')) for _, source in pages) / 1e6
+
+    backends = available_backends()
+    reference = next(name for name in REFERENCE_BACKENDS if name in backends)
+    print(f"\n📄 {len(pages)} Seiten, {megabytes:.1f} MB")
+    print(f"🧩 Parser: {', '.join(backends)} (Referenz: {reference})")
+    missing = [name for name in ('bs4', 'lxml', 'selectolax') if name not in backends]
+    if missing:
+        print(f"   nicht installiert: {', '.join(missing)}")
+
+    recommendations = {}
+    for job in args.job or JOBS:
+        print(f"\n🔧 Aufgabe: {job}")
+        runs = {backend: run_job(job, backend, pages, args.repeat) for backend in backends}
+        expected = runs[reference][1]
+        expected_canonical = {rel: canonical(output) for rel, output in expected.items()}
+
+        candidates = []
+        for backend, (elapsed, results, errors) in runs.items():
+            identical = sum(1 for rel, output in results.items() if expected.get(rel) == output)
+            equivalent = sum(
+                1 for rel, output in results.items()
+                if rel in expected_canonical and canonical(output) == expected_canonical[rel]
+            )
+            correct = not errors and equivalent == len(pages)
+            if correct:
+                candidates.append((elapsed, backend))
+            mark = "✅" if correct else "⚠️ "
+            print(
+                f"   {mark} {backend:<11} {len(pages) / elapsed:8.0f} Seiten/s  {megabytes / elapsed:6.1f} MB/s"
+                f"  identisch {identical}/{len(pages)}  gleichwertig {equivalent}/{len(pages)}"
+                + (f"  Fehler {len(errors)}" if errors else "")
+            )
+            for rel, error in list(errors.items())[:3]:
+                print(f"      ❌ {rel}: {error}")
+            different = [rel for rel in results if rel in expected_canonical and canonical(results[rel]) != expected_canonical[rel]]
+            for rel in different[:3]:
+                print(f"      ≠ {rel}")
+        if candidates:
+            recommendations[job] = min(candidates)[1]
+
+    print("\n" + "=" * 60)
+    print("ZUSAMMENFASSUNG:")
+    for job in args.job or JOBS:
+        print(f"   🏁 {job}: {recommendations.get(job, 'kein Parser gleichwertig zur Referenz')}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Prefetch-Hinweise
+Schreibt in jeden Artikel und jedes Paper die wahrscheinlich nächsten
+Seiten als <link rel="prefetch"> in den <head>:
+
+    <!-- generated:prefetch -->...<!-- /generated:prefetch -->
+
+Kandidaten und Gewichte (siehe PREFETCH_WEIGHTS):
+  - Links im Inhalt (Link-Graph aus link_graph.py)
+  - Paper eines Artikels bzw. der Artikel eines Papers
+  - Nachbarn in der Kategorie (vorheriger/nächster Artikel der Karte)
+
+Die besten PREFETCH_COUNT Seiten werden genommen, solange ihre Größe
+zusammen PREFETCH_BUDGET nicht übersteigt. Der Browser lädt sie im
+Leerlauf; mit sw.js landen sie zugleich im Offline-Cache.
+
+Verwendung:
+  python3 prefetch_hints.py          # Hinweise aktualisieren
+  python3 prefetch_hints.py --remove # Hinweise entfernen
+"""
+
+import argparse
+import html
+import posixpath
+
+from link_graph import collect_links, load_link_cache, page_stat, store_link_cache
+from page_blocks import end_marker, remove_block, set_block, start_marker
+from safe_write import TreeLocked, tree_lock, write_text
+from site_manifest import BASE_PATH, load_manifest
+
+BLOCK_NAME = 'prefetch'
+
+# Seitenarten, die Hinweise bekommen und vorgeladen werden
+PREFETCH_KINDS = ('article', 'paper')
+
+# Seiten pro Hinweis-Block und Obergrenze ihrer Größe zusammen
+PREFETCH_COUNT = 4
+PREFETCH_BUDGET = 100 * 1024
+
+# Gewicht je Beziehung - mehrere Beziehungen addieren sich
+PREFETCH_WEIGHTS = {
+    'link': 3,
+    'child': 2,
+    'parent': 2,
+    'next': 2,
+    'previous': 1,
+}
+
+
+def category_neighbours(manifest):
+    """{Artikel: (vorheriger, nächster)} in Karten-Reihenfolge der Kategorie"""
+    neighbours = {}
+    for category in manifest.categories:
+        paths = [article['path'] for article in category['articles']]
+        for i, rel in enumerate(paths):
+            neighbours[rel] = (paths[i - 1] if i > 0 else None, paths[i + 1] if i + 1 < len(paths) else None)
+    return neighbours
+
+
+def score_candidates(page, manifest, links, neighbours):
+    """{Ziel: Punkte} für eine Seite"""
+    scores = {}
+
+    def add(target, relation):
+        if target and target != page['path']:
+            scores[target] = scores.get(target, 0) + PREFETCH_WEIGHTS[relation]
+
+    for target in links.get(page['path'], {}).get('links', []):
+        add(target, 'link')
+    for child in manifest.children(page['path']):
+        add(child['path'], 'child')
+    parent = manifest.parent(page['path'])
+    if parent is not None:
+        add(parent['path'], 'parent')
+    previous, following = neighbours.get(page['path'], (None, None))
+    add(previous, 'previous')
+    add(following, 'next')
+    return scores
+
+
+def choose_targets(scores, sizes, count=PREFETCH_COUNT, budget=PREFETCH_BUDGET):
+    """Beste Ziele nach Punkten, höchstens count Seiten und budget Bytes"""
+    chosen = []
+    for target in sorted(scores, key=lambda rel: (-scores[rel], sizes[rel], rel)):
+        if len(chosen) == count:
+            break
+        if sizes[target] <= budget:
+            chosen.append(target)
+            budget -= sizes[target]
+    return chosen
+
+
+def render_hints(page, targets):
+    """Block mit relativen Prefetch-Links (Einrückung wie im <head>)"""
+    base = posixpath.dirname(page['path'])
+    hints = ''.join(
+        f'    <link rel="prefetch" href="{html.escape(posixpath.relpath(target, base))}">\n'
+        for target in targets
+    )
+    return f'{start_marker(BLOCK_NAME)}\n{hints}    {end_marker(BLOCK_NAME)}'
+
+
+def update_page(page_html, page, targets):
+    if not targets:
+        return remove_block(page_html, BLOCK_NAME)
+    return set_block(page_html, BLOCK_NAME, render_hints(page, targets), anchor='</head>')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prefetch-Hinweise in die Seiten schreiben")
+    parser.add_argument('--remove', action='store_true', help="Hinweise entfernen")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("⚡ Prefetch-Hinweise")
+    print("=" * 60)
+
+    try:
+        tree_lock()
+    except TreeLocked as e:
+        print(f"❌ {e}")
+        return
+
+    manifest = load_manifest()
+    pages = [page for page in manifest.of_kind(*PREFETCH_KINDS) if (BASE_PATH / page['path']).is_file()]
+    sizes = {page['path']: page_stat(BASE_PATH / page['path'])[0] for page in pages}
+    links, scanned = collect_links(list(sizes), load_link_cache())
+    neighbours = category_neighbours(manifest)
+
+    updated = 0
+    hints = 0
+    for page in pages:
+        if args.remove:
+            targets = []
+        else:
+            scores = score_candidates(page, manifest, links, neighbours)
+            targets = choose_targets({rel: score for rel, score in scores.items() if rel in sizes}, sizes)
+        hints += len(targets)
+
+        path = BASE_PATH / page['path']
+        page_html = path.read_text(encoding='utf-8')
+        new_html = update_page(page_html, page, targets)
+        if new_html == page_html:
+            continue
+        write_text(path, new_html)
+        if page['path'] in links:
+            # Der Block zählt nicht zum Link-Graphen - Einträge bleiben gültig
+            links[page['path']]['stat'] = page_stat(path)
+        updated += 1
+        print(f"  ✅ {page['path']} ({len(targets)} Seiten)")
+
+    store_link_cache(links)
+
+    print("\n" + "=" * 60)
+    print("ZUSAMMENFASSUNG:")
+    print(f"   📄 Seiten: {len(pages)} ({scanned} Links neu eingelesen)")
+    print(f"   ⚡ Prefetch-Hinweise: {hints} (max. {PREFETCH_COUNT} bzw. {PREFETCH_BUDGET // 1024} KB pro Seite)")
+    print(f"   ✅ Aktualisiert: {updated}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
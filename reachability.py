@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Nicht erreichbare Seiten und Dateien
+Folgt von index.html aus allen lokalen Links, Stylesheets, Skripten und
+Bildern (auch url(...) in CSS) und meldet alles, was so nie erreicht wird:
+Tippfehler-Kopien wie hip-spine/inddex.html, Artikel-Vorlagen, alte
+Paper-Seiten, .DS_Store, *.backup_jac, Entwürfe und Build-Skripte.
+
+Artikel und Paper aus dem Manifest, auf die nichts verweist, werden als
+verwaist gemeldet - sie sollten verlinkt werden und bleiben im Export,
+außer mit --strict.
+
+Das Ergebnis steht in .build/reachability.json. Mit --export wird ein
+Deploy-Verzeichnis geschrieben, das nur die erreichbaren Dateien enthält.
+
+Verwendung:
+  python3 reachability.py                     # Bericht
+  python3 reachability.py --export            # nach .build/deploy exportieren
+  python3 reachability.py --export ../site    # in ein eigenes Verzeichnis
+  python3 reachability.py --export --strict   # auch verwaiste Artikel weglassen
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import posixpath
+import shutil
+from pathlib import Path
+
+from link_graph import css_references, page_references
+from safe_write import write_text
+from site_manifest import BASE_PATH, load_manifest
+
+REPORT_PATH = BASE_PATH / '.build' / 'reachability.json'
+DEPLOY_PATH = BASE_PATH / '.build' / 'deploy'
+
+# Einstiegspunkte (Startseite, Fehlerseite)
+ROOTS = ('index.html', '404/index.html', '404.html')
+
+# Dateien, die der Server ohne Link braucht
+KEEP_FILES = (
+    'CNAME', 'robots.txt', 'sitemap.xml', 'favicon.ico', 'apple-touch-icon.png',
+    'sw.js', 'precache-manifest.json',
+)
+
+# Verzeichnisse, deren Dateien ohne Link ausgeliefert werden (JSON-API)
+KEEP_DIRS = ('api',)
+
+# Verzeichnisse, die nie zur Seite gehören
+SKIP_DIRS = {'.git', '.build', '__pycache__'}
+
+# Seitenarten, die auch ohne Link Inhalt sind (verwaist statt überflüssig)
+ORPHAN_KINDS = ('article', 'paper')
+
+# Abfall, der nie ausgeliefert werden sollte
+JUNK_PATTERNS = ('.DS_Store', '*.backup_jac', '*.backup', '*~', '*.tmp')
+
+_FOLLOW_SUFFIXES = {'.html': page_references, '.css': css_references}
+
+
+def site_files(directory=BASE_PATH):
+    """Alle Dateien relativ zu directory, ohne SKIP_DIRS"""
+    files = []
+    for root, dirs, names in os.walk(directory):
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS)
+        rel_root = Path(root).relative_to(directory)
+        files.extend((rel_root / name).as_posix() for name in sorted(names))
+    return files
+
+
+def reachable_files(directory=BASE_PATH, roots=ROOTS):
+    """
+    Erreichbare Dateien und Verweise auf fehlende Dateien ({Ziel: [Quellen]}).
+    Jede Seite und jedes Stylesheet wird höchstens einmal gelesen.
+    """
+    seen = {root for root in roots if (directory / root).is_file()}
+    seen.update(name for name in KEEP_FILES if (directory / name).is_file())
+    for name in KEEP_DIRS:
+        if (directory / name).is_dir():
+            seen.update(f'{name}/{rel}' for rel in site_files(directory / name))
+    missing = {}
+    queue = sorted(seen)
+    while queue:
+        rel = queue.pop()
+        follow = _FOLLOW_SUFFIXES.get(posixpath.splitext(rel)[1].lower())
+        if follow is None:
+            continue
+        try:
+            text = (directory / rel).read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"  ⚠️  {rel}: {e}")
+            continue
+        for target in follow(text, rel, directory):
+            if target in seen:
+                continue
+            if (directory / target).is_file():
+                seen.add(target)
+                queue.append(target)
+            else:
+                missing.setdefault(target, []).append(rel)
+    return seen, missing
+
+
+def is_junk(rel):
+    name = rel.rsplit('/', 1)[-1]
+    return any(fnmatch.fnmatchcase(name, pattern) for pattern in JUNK_PATTERNS)
+
+
+def classify(files, reachable, manifest):
+    """Nicht erreichbare Dateien als (verwaiste Inhalte, Seiten, Abfall, sonstige Dateien)"""
+    orphans, pages, junk, other = [], [], [], []
+    for rel in files:
+        if rel in reachable:
+            continue
+        page = manifest.page(rel) if rel.endswith('.html') else None
+        if is_junk(rel):
+            junk.append(rel)
+        elif page is not None and page['path'] == rel and page['kind'] in ORPHAN_KINDS:
+            orphans.append(rel)
+        elif posixpath.splitext(rel)[1].lower() == '.html':
+            pages.append(rel)
+        else:
+            other.append(rel)
+    return orphans, pages, junk, other
+
+
+def export(files, target, directory=BASE_PATH):
+    """Kopiert files nach target. Ein vorhandenes Ziel muss leer sein (außer unter .build)."""
+    target = Path(target).resolve()
+    build_dir = (directory / '.build').resolve()
+    if target.exists():
+        if build_dir in target.parents:
+            shutil.rmtree(target)
+        elif any(target.iterdir()):
+            raise FileExistsError(f"{target} ist nicht leer")
+    for rel in sorted(files):
+        destination = target / rel
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(directory / rel, destination)
+    return target
+
+
+def store_report(report):
+    try:
+        REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
+        write_text(REPORT_PATH, json.dumps(report, ensure_ascii=False, indent=1))
+    except OSError:
+        # Bericht ist optional
+        pass
+
+
+def _size(files, directory=BASE_PATH):
+    return sum((directory / rel).stat().st_size for rel in files)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Nicht erreichbare Seiten und Dateien finden")
+    parser.add_argument('--export', nargs='?', const=str(DEPLOY_PATH), metavar='VERZEICHNIS',
+                        help="nur erreichbare Dateien in ein Deploy-Verzeichnis kopieren")
+    parser.add_argument('--strict', action='store_true', help="verwaiste Artikel und Paper nicht exportieren")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("🕸️  Erreichbarkeit ab index.html")
+    print("=" * 60)
+
+    files = site_files()
+    reachable, missing = reachable_files()
+    orphans, pages, junk, other = classify(files, reachable, load_manifest())
+
+    groups = (
+        ("🧩 Verwaiste Artikel und Paper (bitte verlinken)", orphans),
+        ("📄 Überflüssige Seiten", pages),
+        ("🗑️  Abfall", junk),
+        ("📦 Sonstige Dateien", other),
+    )
+    for title, group in groups:
+        if group:
+            print(f"\n{title} ({len(group)}):")
+            for rel in group:
+                print(f"  {rel}")
+    if missing:
+        # Meist dieselben kaputten Navigationslinks auf vielen Seiten
+        by_name = {}
+        for target, sources in missing.items():
+            by_name.setdefault(posixpath.basename(target), []).extend(sources)
+        print(f"\n🔗 Verweise auf fehlende Dateien ({len(missing)}):")
+        for name, sources in sorted(by_name.items(), key=lambda item: (-len(item[1]), item[0])):
+            print(f"  {name}  ← {len(sources)} Seite(n), z.B. {min(sources)}")
+
+    store_report({
+        'reachable': sorted(reachable),
+        'unreachable': {'orphans': orphans, 'pages': pages, 'junk': junk, 'other': other},
+        'missing': dict(sorted(missing.items())),
+    })
+
+    exported = None
+    if args.export:
+        try:
+            exported = export(reachable if args.strict else reachable | set(orphans), args.export)
+        except OSError as e:
+            print(f"\n❌ Export fehlgeschlagen: {e}")
+
+    unreachable = orphans + pages + junk + other
+    print("\n" + "=" * 60)
+    print("ZUSAMMENFASSUNG:")
+    print(f"   📁 Dateien: {len(files)}")
+    print(f"   ✅ Erreichbar: {len(reachable)} ({_size(reachable) / 1024:.0f} KB)")
+    print(f"   🕸️  Nicht erreichbar: {len(unreachable)} ({_size(unreachable) / 1024:.0f} KB)")
+    print(f"      🧩 Verwaist: {len(orphans)}  📄 Seiten: {len(pages)}  🗑️  Abfall: {len(junk)}  📦 Sonstige: {len(other)}")
+    print(f"   🔗 Fehlende Ziele: {len(missing)}")
+    if exported is not None:
+        print(f"   📦 Exportiert nach: {exported}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Verwandte Artikel
+Vergleicht den Fließtext aller Artikel und Paper (TF-IDF, Kosinus) und
+schreibt in jede Seite einen Block "Verwandte Artikel" vor </article>:
+
+    <!-- generated:related -->...<!-- /generated:related -->
+
+Inkrementell: .build/terms.json merkt sich pro Seite einen Hash des
+Inhalts und die Termhäufigkeiten. Nur geänderte Seiten werden neu
+eingelesen; geschrieben werden nur Seiten, deren Block sich ändert.
+
+Verwendung:
+  python3 related_articles.py          # Blöcke aktualisieren
+  python3 related_articles.py --all    # alle Seiten neu einlesen
+  python3 related_articles.py --remove # Blöcke entfernen
+"""
+
+import argparse
+import html
+import posixpath
+
+from page_blocks import remove_block, set_block
+from safe_write import TreeLocked, tree_lock, write_text
+from site_manifest import BASE_PATH, load_manifest
+from text_vectors import collect_terms, load_term_cache, store_term_cache, tfidf_rows, top_similar
+
+BLOCK_NAME = 'related'
+
+# Seitenarten, die verglichen werden und einen Block bekommen
+RELATED_KINDS = ('article', 'paper')
+
+# Anzahl Links pro Seite und minimale Kosinus-Ähnlichkeit
+RELATED_COUNT = 5
+MIN_SCORE = 0.05
+
+# Obergrenze des Vokabulars (Breite der Matrix) und Terme pro Seite
+MAX_FEATURES = 4096
+MAX_TERMS = 64
+
+
+def render_related(page, related):
+    """Block mit relativen Links auf die verwandten Seiten"""
+    base = posixpath.dirname(page['path'])
+    items = ''.join(
+        f'                    <li><a href="{html.escape(posixpath.relpath(other["path"], base))}">'
+        f'{html.escape(other["name"] or other["title"], quote=False)}</a></li>\n'
+        for other in related
+    )
+    return (
+        f'<!-- generated:{BLOCK_NAME} -->\n'
+        f'            <section id="verwandte-artikel" class="related-articles">\n'
+        f'                <h2>Verwandte Artikel</h2>\n'
+        f'                <ul>\n{items}                </ul>\n'
+        f'            </section>\n'
+        f'            <!-- /generated:{BLOCK_NAME} -->'
+    )
+
+
+def update_page(page_html, page, related):
+    if not related:
+        return remove_block(page_html, BLOCK_NAME)
+    return set_block(page_html, BLOCK_NAME, render_related(page, related))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Verwandte Artikel in die Seiten schreiben")
+    parser.add_argument('--all', action='store_true', help="alle Seiten neu einlesen")
+    parser.add_argument('--remove', action='store_true', help="Blöcke entfernen")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("🔗 Verwandte Artikel")
+    print("=" * 60)
+
+    try:
+        tree_lock()
+    except TreeLocked as e:
+        print(f"❌ {e}")
+        return
+
+    manifest = load_manifest()
+    pages = manifest.of_kind(*RELATED_KINDS)
+    cache = {} if args.all else load_term_cache()
+    texts, entries, scanned = collect_terms([page['path'] for page in pages], cache)
+    pages = [page for page in pages if page['path'] in texts]
+
+    if args.remove:
+        neighbours = [[] for _ in pages]
+    else:
+        documents = [entries[page['path']]['terms'] for page in pages]
+        vocabulary, rows = tfidf_rows(documents, max_features=MAX_FEATURES, max_terms=MAX_TERMS)
+        neighbours = top_similar(rows, len(vocabulary), RELATED_COUNT, MIN_SCORE)
+
+    updated = 0
+    for page, similar in zip(pages, neighbours):
+        page_html = texts[page['path']]
+        new_html = update_page(page_html, page, [pages[j] for j, _ in similar])
+        if new_html == page_html:
+            continue
+        write_text(BASE_PATH / page['path'], new_html)
+        # Der Block zählt nicht zum Inhalt - der Hash bleibt gültig
+        updated += 1
+        print(f"  ✅ {page['path']}")
+
+    store_term_cache(entries)
+
+    print("\n" + "=" * 60)
+    print("ZUSAMMENFASSUNG:")
+    print(f"   📄 Seiten: {len(pages)}")
+    print(f"   🔍 Neu eingelesen: {scanned}")
+    print(f"   ✅ Aktualisiert: {updated}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
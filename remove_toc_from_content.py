@@ -7,8 +7,19 @@ Behält die Sidebar-Navigation bei
 import re
 from pathlib import Path
 
+from edit_buffer import EditBuffer
+from html_matcher import Budget, MatcherTimeout, element_end, find_elements
+from rewrite_rules import get_rules
+from safe_write import TreeLocked, tree_lock, write_text
+from site_manifest import load_manifest
 
-def remove_toc_from_content(html):
+TOC_SECTION_START = re.compile(r'<section[^>]*class=["\'][^"\']*toc[^"\']*["\']', re.IGNORECASE)
+TOC_DIV_START = re.compile(r'<div[^>]*class=["\'][^"\']*table-of-contents[^"\']*["\']', re.IGNORECASE)
+TOC_HEADING_LIST = re.compile(r'<h[2-4][^>]*>\s*Inhaltsverzeichnis\s*</h[2-4]>\s*(?=<ul>)', re.IGNORECASE)
+TOC_RULES = get_rules('remove_toc')
+
+
+def remove_toc_from_content(html, budget=None):
     """
     Entfernt Inhaltsverzeichnis-Boxen aus dem Artikel-Content
     Patterns die erkannt werden:
@@ -17,48 +28,31 @@ def remove_toc_from_content(html):
     - Etc.
     """
     
-    # Pattern 1: Div mit "INHALTSVERZEICHNIS" Text
-    html = re.sub(
-        r'<div[^>]*>\s*INHALTSVERZEICHNIS\s*</div>',
-        '',
-        html,
-        flags=re.IGNORECASE
-    )
+    # Alle Muster arbeiten auf dem Original und tragen ihre Änderungen in
+    # einen gemeinsamen Puffer ein - die Seite wird nur einmal neu kopiert.
+    # Was in einem schon entfernten Bereich liegt, fällt dabei weg.
+    buffer = EditBuffer(html)
     
     # Pattern 2: Sections mit TOC/Inhaltsverzeichnis
-    html = re.sub(
-        r'<section[^>]*class=["\'][^"\']*toc[^"\']*["\'][^>]*>.*?</section>',
-        '',
-        html,
-        flags=re.IGNORECASE | re.DOTALL
-    )
+    for start, end in find_elements(html, 'section', TOC_SECTION_START, budget):
+        buffer.remove(start, end)
     
-    # Pattern 3: Divs mit TOC-Klassen im Content
-    html = re.sub(
-        r'<div[^>]*class=["\'][^"\']*table-of-contents[^"\']*["\'][^>]*>.*?</div>',
-        '',
-        html,
-        flags=re.IGNORECASE | re.DOTALL
-    )
+    # Pattern 3: Divs mit TOC-Klassen im Content (inkl. verschachtelter Divs)
+    for start, end in find_elements(html, 'div', TOC_DIV_START, budget):
+        buffer.remove(start, end)
     
     # Pattern 4: Heading + Liste die wie TOC aussieht
     # z.B. <h2>Inhaltsverzeichnis</h2><ul>...</ul>
-    html = re.sub(
-        r'<h[2-4][^>]*>\s*Inhaltsverzeichnis\s*</h[2-4]>\s*<ul>.*?</ul>',
-        '',
-        html,
-        flags=re.IGNORECASE | re.DOTALL
-    )
+    for match in TOC_HEADING_LIST.finditer(html):
+        end = element_end(html, match.end(), budget)
+        if end is not None:
+            buffer.remove(match.start(), end)
     
-    # Pattern 5: Standalone "INHALTSVERZEICHNIS" Header
-    html = re.sub(
-        r'<h[2-4][^>]*>\s*INHALTSVERZEICHNIS\s*</h[2-4]>',
-        '',
-        html,
-        flags=re.IGNORECASE
-    )
+    # Pattern 1 und 5: Div bzw. Standalone-Header mit "INHALTSVERZEICHNIS"
+    # (rules/remove_toc.json; Header vor einer Liste hat Pattern 4 schon entfernt)
+    TOC_RULES.record(buffer)
     
-    return html
+    return buffer.text()
 
 
 def clean_article(filepath):
@@ -72,7 +66,7 @@ def clean_article(filepath):
         original_length = len(html)
         
         # Entferne TOC aus Content
-        cleaned = remove_toc_from_content(html)
+        cleaned = remove_toc_from_content(html, Budget())
         
         # Bereinige mehrfache Leerzeilen
         cleaned = re.sub(r'\n\s*\n\s*\n+', '\n\n', cleaned)
@@ -84,13 +78,11 @@ def clean_article(filepath):
             # Backup (falls nicht existiert)
             backup = filepath.with_suffix('.html.backup2')
             if not backup.exists():
-                with open(backup, 'w', encoding='utf-8') as f:
-                    f.write(html)
+                write_text(backup, html)
                 print(f"   💾 Backup: {backup.name}")
             
             # Schreibe bereinigte Version
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(cleaned)
+            write_text(filepath, cleaned)
             
             print(f"   ✅ Bereinigt")
             return True
@@ -98,6 +90,9 @@ def clean_article(filepath):
             print(f"   ℹ️  Kein TOC gefunden")
             return False
         
+    except MatcherTimeout as e:
+        print(f"   ⏱️  Übersprungen: {e}")
+        return False
     except Exception as e:
         print(f"   ❌ Fehler: {e}")
         return False
@@ -107,6 +102,13 @@ def main():
     print("=" * 70)
     print("🗑️  INHALTSVERZEICHNIS-ENTFERNER")
     print("=" * 70)
+
+    try:
+        tree_lock()
+    except TreeLocked as e:
+        print(f"❌ {e}")
+        return
+
     print()
     print("Entfernt 'INHALTSVERZEICHNIS' Boxen AUS dem Artikel-Content")
     print("Die Sidebar-Navigation bleibt erhalten!")
@@ -117,7 +119,7 @@ def main():
     print()
     
     # Finde Artikel
-    exclude = {'index.html', 'huefte.html', 'hufte.html'}
+    exclude = load_manifest().skip_names
     files = [f for f in cwd.glob('*.html') 
              if f.name.lower() not in exclude 
              and not f.name.endswith('.backup')
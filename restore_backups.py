@@ -6,12 +6,20 @@ Stellt alle .html.backup Dateien wieder her
 
 from pathlib import Path
 import shutil
+from safe_write import TreeLocked, tree_lock, write_bytes
 
 def restore_backups():
     """Stellt alle Backups wieder her"""
     print("=" * 70)
     print("🔄 Backup-Restore Tool")
     print("=" * 70)
+
+    try:
+        tree_lock()
+    except TreeLocked as e:
+        print(f"❌ {e}")
+        return
+
     print()
     
     current_dir = Path.cwd()
@@ -59,8 +67,9 @@ def restore_backups():
             # Original-Dateiname (ohne .backup)
             original_file = backup.parent / backup.stem
             
-            # Kopiere Backup zur Original-Datei
-            shutil.copy2(backup, original_file)
+            # Backup atomar zurückschreiben, Zeitstempel wie bisher übernehmen
+            write_bytes(original_file, backup.read_bytes())
+            shutil.copystat(backup, original_file)
             
             print(f"✅ Wiederhergestellt: {original_file.name}")
             success_count += 1
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Deklarative Ersetzungsregeln
+Regeln stehen in rules/<name>.json statt als re.sub-Ketten in den Skripten:
+
+    {"rules": [
+        {"name": "titel", "literal": "OrthopedicKB",
+         "replace": "Joint Alignment Compendium"},
+        {"name": "alter-footer",
+         "pattern": "<footer class=\"main-footer\"[^>]*>.*?</footer>",
+         "replace": "", "flags": "s", "requires": ["main-footer"]}
+    ]}
+
+  pattern   regulärer Ausdruck (oder "literal": fester Text)
+  replace   Ersetzung wie bei re.sub (\\1, \\g<1>); bei literal fester Text
+  flags     "i", "m", "s", "x" - gelten nur für diese Regel
+  requires  Regel greift nur, wenn einer dieser Texte im Dokument steht
+            (bei literal automatisch der Text selbst, ohne requires immer)
+  unless    Regel greift nicht, wenn einer dieser Texte im Dokument steht
+
+Alle aktiven Regeln werden zu einer einzigen Alternation verbunden und in
+einem Durchlauf angewendet; welche Regel getroffen hat, verrät die äußere
+Gruppe. Enthält ein Dokument keinen der geforderten Texte, findet gar kein
+Regex-Durchlauf statt. Überschneiden sich Treffer, gewinnt der früheste,
+bei gleichem Start die Regel, die in der Datei zuerst steht. Anders als bei
+einer re.sub-Kette sieht keine Regel das Ergebnis einer anderen.
+
+    rules = get_rules('update_to_jac')
+    content = rules.apply(content)
+"""
+
+import json
+import re
+from pathlib import Path
+
+RULES_DIR = Path(__file__).parent / 'rules'
+
+RULE_FLAGS = 'imsx'
+
+# Rückverweise im Muster (\1, (?P=name)) und Gruppen in der Ersetzung
+_PATTERN_BACKREF = re.compile(r'\\(?:[1-9]|\\)|\(\?P=')
+_TEMPLATE_GROUP = re.compile(r'\\(?:([1-9][0-9]?)|g<(\d+)>|g<(\w+)>|\\)')
+
+# Bereits geladene Regelsätze dieses Laufs
+_loaded = {}
+
+
+class RuleError(Exception):
+    """Fehlerhafte Regeldatei oder Regel"""
+
+
+def _check_pattern(name, pattern):
+    for match in _PATTERN_BACKREF.finditer(pattern):
+        if match.group() != '\\\\':
+            raise RuleError(f"{name}: Rückverweise im Muster sind in der kombinierten Alternation nicht möglich")
+    try:
+        compiled = re.compile(pattern)
+    except re.error as e:
+        raise RuleError(f"{name}: ungültiges Muster: {e}") from None
+    if compiled.groupindex:
+        raise RuleError(f"{name}: benannte Gruppen sind nicht erlaubt - \\1, \\2 ... verwenden")
+    return compiled.groups
+
+
+def _shift_template(name, template, offset, groups):
+    """Ersetzung mit Gruppennummern der kombinierten Alternation (\\1 -> \\g<offset+1>)"""
+    def shift(match):
+        if match.group() == '\\\\':
+            return match.group()
+        if match.group(3):
+            raise RuleError(f"{name}: benannte Gruppe '{match.group(3)}' in der Ersetzung")
+        number = int(match.group(1) or match.group(2))
+        if number > groups:
+            raise RuleError(f"{name}: Gruppe {number} gibt es im Muster nicht")
+        return f'\\g<{offset + number}>'
+    return _TEMPLATE_GROUP.sub(shift, template)
+
+
+class Rule:
+    """Eine Regel: Muster ohne äußere Gruppe, Ersetzung und Vorfilter"""
+
+    __slots__ = ('name', 'pattern', 'flags', 'groups', 'replace', 'literal', 'requires', 'unless')
+
+    def __init__(self, data, index):
+        self.name = data.get('name') or f'Regel {index + 1}'
+        if ('pattern' in data) == ('literal' in data):
+            raise RuleError(f"{self.name}: genau eines von 'pattern' und 'literal' angeben")
+        if 'replace' not in data:
+            raise RuleError(f"{self.name}: 'replace' fehlt")
+        self.flags = data.get('flags', '')
+        if set(self.flags) - set(RULE_FLAGS):
+            raise RuleError(f"{self.name}: unbekannte Flags '{self.flags}' (erlaubt: {RULE_FLAGS})")
+        self.literal = 'literal' in data
+        if self.literal:
+            if not data['literal']:
+                raise RuleError(f"{self.name}: leerer Text")
+            self.pattern = re.escape(data['literal'])
+            self.groups = 0
+            default_requires = [data['literal']]
+        else:
+            self.pattern = data['pattern']
+            self.groups = _check_pattern(self.name, self.pattern)
+            default_requires = []
+        self.replace = data['replace']
+        self.requires = tuple(data.get('requires', default_requires))
+        self.unless = tuple(data.get('unless', ()))
+
+    def source(self):
+        """Muster mit lokalen Flags, z.B. (?s:...)"""
+        return f'(?{self.flags}:{self.pattern})' if self.flags else f'(?:{self.pattern})'
+
+    def active(self, text, folded):
+        """Vorfilter: geforderte Texte vorhanden, ausschließende nicht"""
+        if any(literal in text for literal in self.unless):
+            return False
+        if not self.requires:
+            return True
+        if 'i' in self.flags:
+            return any(literal.lower() in folded() for literal in self.requires)
+        return any(literal in text for literal in self.requires)
+
+
+class RuleSet:
+    """Regeln einer Datei; kombinierte Regexe werden je Regelauswahl einmal gebaut"""
+
+    __slots__ = ('name', 'rules', '_compiled')
+
+    def __init__(self, name, rules):
+        self.name = name
+        self.rules = rules
+        self._compiled = {}
+
+    def _combined(self, selection):
+        """(Regex, {Gruppe: Ersetzung}) für die aktiven Regeln"""
+        cached = self._compiled.get(selection)
+        if cached is not None:
+            return cached
+        parts = []
+        dispatch = {}
+        group = 1
+        for index in selection:
+            rule = self.rules[index]
+            parts.append(f'({rule.source()})')
+            if rule.literal:
+                dispatch[group] = (rule.replace, False)
+            else:
+                dispatch[group] = (_shift_template(rule.name, rule.replace, group, rule.groups), True)
+            group += 1 + rule.groups
+        cached = self._compiled[selection] = (re.compile('|'.join(parts)), dispatch)
+        return cached
+
+    def selection(self, text):
+        """Indizes der Regeln, deren Vorfilter auf text passt"""
+        lowered = []
+
+        def folded():
+            if not lowered:
+                lowered.append(text.lower())
+            return lowered[0]
+
+        return tuple(index for index, rule in enumerate(self.rules) if rule.active(text, folded))
+
+    def apply(self, text):
+        """Wendet alle aktiven Regeln in einem Durchlauf an"""
+        selection = self.selection(text)
+        if not selection:
+            return text
+        regex, dispatch = self._combined(selection)
+        return regex.sub(_replacer(dispatch), text)
+
+    def record(self, buffer):
+        """
+        Trägt die Treffer aller aktiven Regeln als Änderungen in einen
+        EditBuffer ein (gegen dessen Original); Anzahl der Änderungen
+        """
+        selection = self.selection(buffer.original)
+        if not selection:
+            return 0
+        regex, dispatch = self._combined(selection)
+        return buffer.sub(regex, _replacer(dispatch))
+
+
+def _replacer(dispatch):
+    """Ersetzungsfunktion: die äußere Gruppe des Treffers wählt die Regel"""
+    def replace(match):
+        template, expand = dispatch[match.lastindex]
+        return match.expand(template) if expand else template
+    return replace
+
+
+def compile_rules(data, name='<string>'):
+    """RuleSet aus dem Inhalt einer Regeldatei"""
+    rules = data.get('rules') if isinstance(data, dict) else None
+    if not isinstance(rules, list):
+        raise RuleError(f"{name}: Schlüssel 'rules' mit einer Liste fehlt")
+    return RuleSet(name, [Rule(rule, index) for index, rule in enumerate(rules)])
+
+
+def get_rules(name):
+    """Regelsatz aus rules/<name>.json (pro Lauf nur einmal geladen)"""
+    ruleset = _loaded.get(name)
+    if ruleset is None:
+        path = RULES_DIR / f'{name}.json'
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            raise RuleError(f"Regeldatei nicht gefunden: {path}") from None
+        except ValueError as e:
+            raise RuleError(f"{path}: kein gültiges JSON: {e}") from None
+        ruleset = _loaded[name] = compile_rules(data, name)
+    return ruleset
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Atomares Schreiben und Sperre für den Seitenbaum
+Alle Skripte schreiben über write_text()/write_bytes(): der Inhalt geht
+erst in eine temporäre Datei im selben Verzeichnis (.name.xxxx.tmp) und
+ersetzt dann per rename die Zieldatei. Ein Dev-Server oder Host, der
+währenddessen liest, sieht immer die alte oder die neue Seite, nie eine
+halbe.
+
+Das erste Schreiben in den Baum (außerhalb von .build) sperrt ihn für den
+Rest des Prozesses (.build/tree.lock). Ein zweites Skript, das gleichzeitig
+schreiben will, bricht sofort mit TreeLocked ab. Kindprozesse (parallele
+Worker) erben die Sperre über JAC_TREE_LOCK.
+
+Dauerhaftigkeit bei Stromausfall (fsync) ist optional:
+  JAC_FSYNC=1 python3 backlinks.py      # jede Datei und ihr Verzeichnis
+  with sync_batch(): ...                # einmal am Ende für alle Dateien
+"""
+
+import atexit
+import os
+import stat
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:
+    # Ohne fcntl (Windows) dient eine exklusiv angelegte Datei als Sperre
+    fcntl = None
+
+BASE_PATH = Path(__file__).parent
+BUILD_DIR = BASE_PATH / '.build'
+LOCK_PATH = BUILD_DIR / 'tree.lock'
+
+# Sperre des Elternprozesses (für Worker)
+LOCK_ENV = 'JAC_TREE_LOCK'
+
+# Jede Datei sofort auf die Platte bringen
+FSYNC = os.environ.get('JAC_FSYNC', '') not in ('', '0')
+
+# Rechte neuer Dateien wie bei open(..., 'w')
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_NEW_FILE_MODE = 0o666 & ~_UMASK
+
+# Offene Sperrdatei dieses Prozesses
+_lock_file = None
+
+# Während sync_batch(): geschriebene Dateien, die am Ende synchronisiert werden
+_batch = None
+
+
+class TreeLocked(Exception):
+    """Ein anderer Prozess schreibt gerade in den Seitenbaum"""
+
+
+def _lock_token():
+    return f'{os.getpid()}'
+
+
+def _holder():
+    try:
+        return LOCK_PATH.read_text(encoding='utf-8').strip() or '?'
+    except OSError:
+        return '?'
+
+
+def tree_lock():
+    """
+    Sperrt den Baum bis zum Ende des Prozesses. Mehrfache Aufrufe sind
+    harmlos; hält der Elternprozess die Sperre, gilt sie auch hier.
+    """
+    global _lock_file
+    if _lock_file is not None:
+        return
+    BUILD_DIR.mkdir(parents=True, exist_ok=True)
+    inherited = os.environ.get(LOCK_ENV)
+
+    if fcntl is not None:
+        handle = open(LOCK_PATH, 'a+', encoding='utf-8')
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            if inherited and inherited == _holder():
+                _lock_file = 'inherited'
+                return
+            raise TreeLocked(f"Seitenbaum gesperrt von Prozess {_holder()} ({LOCK_PATH})") from None
+        handle.seek(0)
+        handle.truncate()
+        handle.write(_lock_token())
+        handle.flush()
+        # Bleibt offen - das Betriebssystem gibt die Sperre beim Prozessende frei
+        _lock_file = handle
+    else:
+        if inherited and inherited == _holder():
+            _lock_file = 'inherited'
+            return
+        try:
+            fd = os.open(LOCK_PATH, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            raise TreeLocked(
+                f"Seitenbaum gesperrt von Prozess {_holder()} - "
+                f"nach einem Absturz {LOCK_PATH} von Hand löschen"
+            ) from None
+        os.write(fd, _lock_token().encode('utf-8'))
+        os.close(fd)
+        atexit.register(lambda: LOCK_PATH.unlink(missing_ok=True))
+        _lock_file = 'exclusive'
+    os.environ[LOCK_ENV] = _lock_token()
+
+
+def _in_build_dir(path):
+    try:
+        path.resolve().relative_to(BUILD_DIR.resolve())
+    except ValueError:
+        return False
+    return True
+
+
+def _fsync_directory(directory):
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        # Verzeichnisse lassen sich nicht überall öffnen (Windows)
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_bytes(path, data):
+    """Ersetzt path atomar durch data (Rechte einer vorhandenen Datei bleiben)"""
+    path = Path(path)
+    if not _in_build_dir(path):
+        tree_lock()
+    try:
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = _NEW_FILE_MODE
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as handle:
+            handle.write(data)
+            if FSYNC and _batch is None:
+                handle.flush()
+                os.fsync(handle.fileno())
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    if _batch is not None:
+        _batch.add(path)
+    elif FSYNC:
+        _fsync_directory(path.parent)
+
+
+def write_text(path, text, encoding='utf-8'):
+    """Ersetzt path atomar durch text"""
+    write_bytes(path, text.encode(encoding))
+
+
+@contextmanager
+def sync_batch():
+    """
+    Schreibt ohne fsync pro Datei und synchronisiert am Ende alle Dateien
+    und ihre Verzeichnisse auf einmal. Atomar für Leser bleibt jede Datei;
+    nur bei einem Stromausfall vor dem Ende kann der neue Inhalt fehlen.
+    """
+    global _batch
+    if _batch is not None:
+        yield
+        return
+    _batch = set()
+    try:
+        yield
+    finally:
+        written, _batch = _batch, None
+        for path in sorted(written):
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        for directory in sorted({path.parent for path in written}):
+            _fsync_directory(directory)
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Service Worker für Offline-Lesen
+Erzeugt sw.js (aus templates/sw.js) und precache-manifest.json und
+registriert den Service Worker in allen erreichbaren Seiten:
+
+    <!-- generated:sw-register -->...<!-- /generated:sw-register -->
+
+Strategien:
+  - Shell (index.html), CSS, Bilder und Google-Fonts-Stylesheets werden
+    beim Installieren geladen
+  - Artikel und Paper werden beim ersten Besuch gespeichert
+  - die Übersichtsseite kommt sofort aus dem Cache und wird im Hintergrund
+    aktualisiert (stale-while-revalidate), ebenso ausgelagerte Abschnitte
+    langer Artikel (chunk_articles.py)
+
+Jede Datei steht mit einem Hash ihres Inhalts im Manifest. Ein Deploy
+lädt nur Dateien neu bzw. verwirft nur Seiten, deren Hash sich geändert
+hat. Der Service Worker wird mit dem Manifest neu erzeugt - ohne
+Änderung bleibt sw.js byte-gleich und Browser installieren nichts neu.
+
+Verwendung:
+  python3 service_worker.py
+"""
+
+import hashlib
+import html
+import json
+import posixpath
+import re
+
+from chunk_articles import FRAGMENT_DIR
+from page_blocks import end_marker, set_block, start_marker
+from reachability import ORPHAN_KINDS, reachable_files
+from safe_write import TreeLocked, tree_lock, write_text
+from site_manifest import BASE_PATH, OVERVIEW_PAGE, load_manifest
+from template_engine import get_template
+
+SW_PATH = BASE_PATH / 'sw.js'
+PRECACHE_PATH = BASE_PATH / 'precache-manifest.json'
+SW_TEMPLATE = 'sw.js'
+
+REGISTER_BLOCK = 'sw-register'
+
+# Seiten, die beim Installieren geladen werden
+SHELL_PAGES = ('index.html',)
+
+# Seiten mit stale-while-revalidate
+REVALIDATE_PAGES = (OVERVIEW_PAGE,)
+
+# Dateiarten, die zur Shell gehören
+SHELL_SUFFIXES = {'.css', '.js', '.png', '.jpg', '.svg', '.webp', '.ico', '.woff', '.woff2'}
+
+# Länge der Inhalts-Hashes im Manifest
+REVISION_LENGTH = 12
+
+_FONT_STYLESHEET = re.compile(r'<link\b[^>]*\bhref="(https://fonts\.googleapis\.com/[^"]+)"', re.I)
+
+
+def revision(data):
+    return hashlib.sha256(data).hexdigest()[:REVISION_LENGTH]
+
+
+def register_script(page_path):
+    """Registrierung mit relativem Pfad - der Scope ist das Verzeichnis von sw.js"""
+    sw_url = posixpath.relpath(SW_PATH.name, posixpath.dirname(page_path) or '.')
+    return (
+        f'{start_marker(REGISTER_BLOCK)}\n'
+        f"    <script>if ('serviceWorker' in navigator) {{ navigator.serviceWorker.register('{sw_url}'); }}</script>\n"
+        f'    {end_marker(REGISTER_BLOCK)}'
+    )
+
+
+def site_pages(manifest):
+    """Erreichbare Dateien plus verwaiste Artikel und Paper (wie im Export)"""
+    files, _ = reachable_files()
+    files |= {page['path'] for page in manifest.of_kind(*ORPHAN_KINDS)}
+    files -= {SW_PATH.name, PRECACHE_PATH.name}
+    return sorted(rel for rel in files if (BASE_PATH / rel).is_file())
+
+
+def build_precache(files, fonts):
+    """Manifest {eager, lazy, swr} mit [Pfad, Hash]-Einträgen"""
+    eager, lazy = [], []
+    for rel in files:
+        entry = [rel, revision((BASE_PATH / rel).read_bytes())]
+        suffix = posixpath.splitext(rel)[1].lower()
+        if rel in SHELL_PAGES or rel in REVALIDATE_PAGES or suffix in SHELL_SUFFIXES:
+            eager.append(entry)
+        elif suffix == '.html':
+            lazy.append(entry)
+    # Externe Stylesheets haben keinen bekannten Inhalt - die URL ist die Version
+    eager.extend([url, revision(url.encode('utf-8'))] for url in sorted(fonts))
+    return {
+        'eager': eager,
+        'lazy': lazy,
+        'swr': [rel for rel in REVALIDATE_PAGES if rel in files],
+    }
+
+
+def render_service_worker(precache):
+    template = get_template(SW_TEMPLATE, suffix='')
+    data = json.dumps(precache, ensure_ascii=False, separators=(',', ':'))
+    return template.render_text(version=revision(data.encode('utf-8')), precache=data, fragment_dir=FRAGMENT_DIR)
+
+
+def write_if_changed(path, text):
+    try:
+        if path.read_text(encoding='utf-8') == text:
+            return False
+    except FileNotFoundError:
+        pass
+    write_text(path, text)
+    return True
+
+
+def _revisions(precache):
+    return {path: rev for group in ('eager', 'lazy') for path, rev in precache.get(group, [])}
+
+
+def load_precache():
+    try:
+        return json.loads(PRECACHE_PATH.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+
+def main():
+    print("=" * 60)
+    print("📴 Service Worker")
+    print("=" * 60)
+
+    try:
+        tree_lock()
+    except TreeLocked as e:
+        print(f"❌ {e}")
+        return
+
+    manifest = load_manifest()
+    files = site_pages(manifest)
+
+    registered = 0
+    fonts = set()
+    for rel in files:
+        if not rel.endswith('.html'):
+            continue
+        path = BASE_PATH / rel
+        page_html = path.read_text(encoding='utf-8')
+        if rel in SHELL_PAGES:
+            fonts.update(html.unescape(url) for url in _FONT_STYLESHEET.findall(page_html))
+        new_html = set_block(page_html, REGISTER_BLOCK, register_script(rel), anchor='</body>')
+        if new_html != page_html:
+            write_text(path, new_html)
+            registered += 1
+
+    precache = build_precache(files, fonts)
+    previous = _revisions(load_precache())
+    current = _revisions(precache)
+    changed = sorted(path for path, rev in current.items() if previous.get(path) != rev)
+    removed = sorted(set(previous) - set(current))
+
+    manifest_text = json.dumps(precache, ensure_ascii=False, indent=1) + '\n'
+    write_if_changed(PRECACHE_PATH, manifest_text)
+    sw_changed = write_if_changed(SW_PATH, render_service_worker(precache))
+
+    if previous:
+        for rel in changed:
+            print(f"  🔄 {rel}")
+        for rel in removed:
+            print(f"  ➖ {rel}")
+
+    print("\n" + "=" * 60)
+    print("ZUSAMMENFASSUNG:")
+    print(f"   📦 Beim Installieren: {len(precache['eager'])} Dateien")
+    print(f"   📄 Beim Besuch: {len(precache['lazy'])} Seiten")
+    print(f"   🔁 Stale-while-revalidate: {', '.join(precache['swr']) or '-'}")
+    print(f"   ✍️  Registrierung ergänzt: {registered} Seiten")
+    if previous:
+        print(f"   🔄 Geändert seit letztem Lauf: {len(changed)} (entfernt: {len(removed)})")
+    print(f"   {'✅ sw.js neu geschrieben' if sw_changed else '⏭️  sw.js unverändert'}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
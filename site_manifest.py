@@ -0,0 +1,500 @@
+#!/usr/bin/env python3
+"""
+Site-Manifest
+Eine zentrale Beschreibung der Website: Seiten, Kategorien, Titel,
+Artikel/Paper-Beziehungen und ausgeschlossene Vorlagen.
+
+Die Kategorie-Struktur wird aus den Kategorie-Karten in huefte/index.html
+gelesen - die Seite ist die einzige Quelle. Das Manifest wird einmal pro Lauf
+aufgebaut und unter .build/manifest.json zwischengespeichert; der Cache gilt,
+solange huefte/index.html und die Seitenliste (Pfad, Größe, Änderungszeit)
+unverändert sind. Sonst werden nur geänderte Seiten neu gelesen.
+
+Verwendung:
+  python3 site_manifest.py            # Manifest anzeigen
+  python3 site_manifest.py --rebuild  # Cache ignorieren
+"""
+
+import argparse
+import difflib
+import hashlib
+import html
+import json
+import posixpath
+import re
+from pathlib import Path
+
+from html_matcher import find_elements
+from safe_write import write_text
+
+BASE_PATH = Path(__file__).parent
+CACHE_PATH = BASE_PATH / '.build' / 'manifest.json'
+
+# Bei Formatänderungen erhöhen, damit alte Cache-Dateien ignoriert werden
+MANIFEST_VERSION = 3
+
+# Kategorie-Übersicht, aus der die Struktur gelesen wird
+OVERVIEW_PAGE = 'huefte/index.html'
+
+# Seiten, die keine Artikel sind (Verzeichnisname -> Art)
+SPECIAL_PAGES = {
+    'impressum': 'static',
+    'datenschutz': 'static',
+    'disclaimer': 'static',
+    'ueber': 'static',
+    '404': 'static',
+    'hip-spine': 'tool',
+    'knee-alignment': 'tool',
+}
+
+# Artikel-Vorlagen (Verzeichnis-Präfix)
+TEMPLATE_PREFIX = 'artikel-vorlage'
+
+# Verzeichnisse, die keine Seiten enthalten
+EXCLUDE_DIRS = {'templates', 'partials'}
+
+# Alte Schreibweisen, die von den Skripten ebenfalls übersprungen werden
+LEGACY_SKIP_NAMES = {'hufte.html'}
+
+# Seitenarten, die von den Konvertern nicht angefasst werden
+SKIP_KINDS = {'home', 'overview', 'static', 'tool', 'template'}
+
+# Mindestlänge des gemeinsamen Anfangs bei der Paper-Zuordnung
+MIN_PREFIX = 5
+
+# Platzhalter-Titel, die übersprungen werden
+GENERIC_TITLES = {'', 'Artikel', 'ARTIKELTITEL'}
+
+# Maximale Länge der Kurzbeschreibung (erster Absatz)
+SUMMARY_LENGTH = 140
+
+# Platzhalter-Absätze, die nicht als Kurzbeschreibung taugen
+PLACEHOLDER_PARAGRAPHS = {'Inhalt wird noch hinzugefügt.'}
+
+# Fallback für Seiten ohne Kategorie
+DEFAULT_CATEGORY = ('📄 Artikel', 'Allgemein')
+
+CARD_START = re.compile(r'<div[^>]*class="category-card"')
+_CARD_ICON = re.compile(r'class="category-icon">(.*?)</span>', re.S)
+_CARD_NAME = re.compile(r'<h2[^>]*>(.*?)</h2>', re.S)
+_CARD_DESCRIPTION = re.compile(r'class="category-description">(.*?)</p>', re.S)
+_CARD_LINK = re.compile(
+    r'<a href="([^"]+)" class="article-link"><span class="article-name">(.*?)'
+    r'(?:<small class="article-summary">.*?</small>)?</span>', re.S
+)
+_TITLE = re.compile(r'<title[^>]*>(.*?)</title>', re.I | re.S)
+_H1 = re.compile(r'<h1[^>]*>(.*?)</h1>', re.I | re.S)
+_BIB_TITLE = re.compile(r'<strong>Titel:</strong>(.*?)</li>', re.S)
+_PARAGRAPH = re.compile(r'<p>(.*?)</p>', re.I | re.S)
+_DECLARED_CATEGORY = re.compile(r'class="article-category">(.*?)</span>', re.S)
+_SPACES = re.compile(r'\s+')
+_TITLE_SUFFIX = re.compile(r'\s*[-|—]\s*(Joint Alignment Compendium|Orthopedic Knowledge Base).*$', re.I)
+_TAGS = re.compile(r'<[^>]+>')
+
+# Vom Manifest gebaut (einmal pro Lauf)
+_manifest = None
+
+
+def normalize_key(slug):
+    """Schlüssel für Lookups: klein, Umlaute ausgeschrieben"""
+    slug = slug.lower()
+    return slug.replace('ä', 'ae').replace('ö', 'oe').replace('ü', 'ue').replace('ß', 'ss')
+
+
+def page_slug(rel):
+    """Slug einer Seite: Verzeichnisname bei index.html, sonst Dateiname"""
+    parts = rel.split('/')
+    if parts[-1] == 'index.html':
+        return parts[-2] if len(parts) > 1 else 'index'
+    return parts[-1][:-len('.html')]
+
+
+def clean_text(text):
+    return _SPACES.sub(' ', html.unescape(_TAGS.sub('', text))).strip()
+
+
+def clean_title(text):
+    """<title>-Inhalt ohne Site-Namen"""
+    return _TITLE_SUFFIX.sub('', clean_text(text))
+
+
+def extract_page_title(text):
+    """
+    Titel einer Seite: erster sinnvoller <title>, sonst <h1>, sonst der
+    Titel aus den bibliografischen Daten (Paper-Fragmente ohne <head>)
+    """
+    for match in _TITLE.finditer(text):
+        title = clean_title(match.group(1))
+        if title not in GENERIC_TITLES:
+            return title
+    for pattern in (_H1, _BIB_TITLE):
+        match = pattern.search(text)
+        if match:
+            return clean_text(match.group(1))
+    return ''
+
+
+def extract_summary(text, length=SUMMARY_LENGTH):
+    """
+    Kurzbeschreibung aus dem ersten Absatz ohne Klasse (Untertitel usw.
+    zählen nicht); ist er ein Platzhalter, bleibt sie leer
+    """
+    match = _PARAGRAPH.search(text)
+    if not match:
+        return ''
+    summary = clean_text(match.group(1))
+    if summary in PLACEHOLDER_PARAGRAPHS:
+        return ''
+    if len(summary) <= length:
+        return summary
+    return summary[:length].rsplit(' ', 1)[0].rstrip(',;:.-–') + ' …'
+
+
+def scan_page(text):
+    """Liest die Angaben einer Seite, die nicht von der Übersicht abhängen"""
+    declared = _DECLARED_CATEGORY.search(text)
+    return {
+        'title': extract_page_title(text),
+        'summary': extract_summary(text),
+        'declared': clean_text(declared.group(1)) if declared else None,
+    }
+
+
+def find_pages(directory):
+    """Findet alle HTML-Seiten (ohne Templates, Fragmente und Backups)"""
+    pages = []
+    for f in directory.rglob('*.html'):
+        parts = f.relative_to(directory).parts
+        if parts[0] in EXCLUDE_DIRS or any(p.startswith('.') for p in parts):
+            continue
+        if f.is_file():
+            pages.append(f)
+    return sorted(pages)
+
+
+def parse_categories(overview_html, overview_path=OVERVIEW_PAGE):
+    """Liest die Kategorie-Karten der Übersichtsseite"""
+    base = posixpath.dirname(overview_path)
+    categories = []
+    for start, end in find_elements(overview_html, 'div', CARD_START):
+        card = overview_html[start:end]
+        icon = _CARD_ICON.search(card)
+        name = _CARD_NAME.search(card)
+        if not name:
+            continue
+        name = clean_text(name.group(1))
+        description = _CARD_DESCRIPTION.search(card)
+        articles = []
+        for href, label in _CARD_LINK.findall(card):
+            path = posixpath.normpath(posixpath.join(base, href))
+            articles.append({'path': path, 'name': clean_text(label)})
+        categories.append({
+            'name': name,
+            'short': name.split(' & ')[0],
+            'icon': clean_text(icon.group(1)) if icon else '',
+            'description': clean_text(description.group(1)) if description else '',
+            'articles': articles,
+        })
+    return categories
+
+
+def paper_parent(slug, articles):
+    """
+    Ordnet ein Paper seinem Artikel zu: 'adipositaspaper' -> 'adipositas',
+    'intraoperativenavigationpaper3' -> 'intraoperativestrategienundnavigation'.
+    articles: normalisierte Artikel-Slugs in Karten-Reihenfolge.
+    """
+    key = normalize_key(slug)
+    stem = key.split('paper', 1)[0] or key.replace('paper', '', 1)
+    stem = stem.rstrip('0123456789 ')
+    if stem in articles:
+        return stem
+
+    # Längster gemeinsamer Anfang (bei Gleichstand der erste Artikel)
+    best, best_length = None, MIN_PREFIX
+    for article in articles:
+        length = len(posixpath.commonprefix([stem, article]))
+        if length > best_length:
+            best, best_length = article, length
+    if best:
+        return best
+
+    # Tippfehler im Verzeichnisnamen ('ethnische' vs. 'enthnische')
+    match = difflib.get_close_matches(stem, articles, n=1, cutoff=0.6)
+    return match[0] if match else None
+
+
+def page_stats(directory, pages):
+    """Pfad -> [Größe, Änderungszeit] für alle Seiten"""
+    stats = {}
+    for page in pages:
+        stat = page.stat()
+        stats[page.relative_to(directory).as_posix()] = [stat.st_size, stat.st_mtime_ns]
+    return stats
+
+
+def _signature(directory, stats):
+    """Hash über Übersichtsseite und Seitenliste - Grundlage für den Cache"""
+    digest = hashlib.sha256(str(MANIFEST_VERSION).encode())
+    overview = directory / OVERVIEW_PAGE
+    if overview.exists():
+        digest.update(overview.read_bytes())
+    for rel, (size, mtime) in stats.items():
+        digest.update(f'{rel}\0{size}\0{mtime}\n'.encode())
+    return digest.hexdigest()
+
+
+def match_category(label, categories):
+    """Index der Kategorie zu einem Label wie '⚕️ Therapie' oder None"""
+    if not label:
+        return None
+    name = label.split(' ', 1)[-1].lower()
+    for index, category in enumerate(categories):
+        if name in (category['name'].lower(), category['short'].lower()):
+            return index
+    return None
+
+
+def build_manifest_data(directory, pages, stats=None, previous=None):
+    """
+    Baut das Manifest als JSON-fähiges dict.
+    previous: älteres Manifest - Seiten mit gleicher Größe und Änderungszeit
+    werden daraus übernommen statt neu gelesen.
+    """
+    if stats is None:
+        stats = page_stats(directory, pages)
+    reusable = {}
+    if previous:
+        reusable = {entry['path']: entry for entry in previous['pages'] if entry.get('stat')}
+
+    overview = directory / OVERVIEW_PAGE
+    categories = parse_categories(overview.read_text(encoding='utf-8')) if overview.exists() else []
+
+    # Artikel aus den Karten: Pfad -> (Kategorie-Index, Kartenname)
+    listed = {}
+    for index, category in enumerate(categories):
+        for article in category['articles']:
+            listed.setdefault(article['path'], (index, article['name']))
+    article_keys = [normalize_key(page_slug(path)) for path in listed]
+
+    entries = []
+    for page in pages:
+        rel = page.relative_to(directory).as_posix()
+        slug = page_slug(rel)
+        top = rel.split('/')[0] if '/' in rel else 'index'
+        old = reusable.get(rel)
+        if old is not None and old['stat'] == stats[rel]:
+            scanned = {key: old[key] for key in ('title', 'summary', 'declared')}
+        else:
+            scanned = scan_page(page.read_text(encoding='utf-8', errors='replace'))
+
+        entry = {
+            'path': rel,
+            'slug': slug,
+            'kind': 'unlisted',
+            'category': None,
+            'name': None,
+            'parent': None,
+            'stat': stats[rel],
+        }
+        entry.update(scanned)
+
+        if rel == 'index.html':
+            entry['kind'] = 'home'
+        elif rel == OVERVIEW_PAGE:
+            entry['kind'] = 'overview'
+        elif top.startswith(TEMPLATE_PREFIX):
+            entry['kind'] = 'template'
+        elif top in SPECIAL_PAGES:
+            entry['kind'] = SPECIAL_PAGES[top]
+        elif rel in listed:
+            entry['kind'] = 'article'
+            entry['category'], entry['name'] = listed[rel]
+        elif rel.count('/') > 1 and normalize_key(top) in article_keys:
+            # Paper in einem Unterordner des Artikels (klassifikation/papereins/...)
+            entry['kind'] = 'paper'
+            entry['parent'] = normalize_key(top)
+        elif 'paper' in normalize_key(slug):
+            parent = paper_parent(slug, article_keys)
+            if parent:
+                entry['kind'] = 'paper'
+                entry['parent'] = parent
+
+        if entry['kind'] == 'unlisted':
+            # Neuer Artikel: Kategorie aus dem Hero-Bereich der Seite übernehmen
+            index = match_category(entry['declared'], categories)
+            if index is not None:
+                entry['kind'] = 'article'
+                entry['category'], entry['name'] = index, entry['title']
+                categories[index]['articles'].append({'path': rel, 'name': entry['title']})
+        entries.append(entry)
+
+    return {'categories': categories, 'pages': entries}
+
+
+class SiteManifest:
+    """
+    Manifest mit O(1)-Lookups nach Pfad und Slug. Slugs, die mehrere
+    Seiten tragen (z.B. papereins in zwei Artikeln), sind mehrdeutig und
+    nur über den Pfad zu finden.
+    """
+
+    __slots__ = ('categories', 'pages', 'skip_names', 'ambiguous', '_by_path', '_by_key', '_children')
+
+    def __init__(self, data):
+        self.categories = data['categories']
+        self.pages = data['pages']
+        self._by_path = {page['path']: page for page in self.pages}
+        self._by_key = {}
+        self._children = {}
+        # Mehrdeutiger Slug -> Pfade der Seiten, die ihn tragen
+        self.ambiguous = {}
+        for page in self.pages:
+            key = normalize_key(page['slug'])
+            other = self._by_key.setdefault(key, page)
+            if other is not page:
+                self.ambiguous.setdefault(key, [other['path']]).append(page['path'])
+            if page['parent']:
+                self._children.setdefault(page['parent'], []).append(page)
+
+        # Dateinamen, die von den Konvertern übersprungen werden
+        self.skip_names = {
+            page['slug'].lower() + '.html' for page in self.pages if page['kind'] in SKIP_KINDS
+        } | LEGACY_SKIP_NAMES
+
+    def page(self, key):
+        """
+        Seite nach Pfad ('adipositas/index.html'), Slug oder Dateiname.
+        None auch bei mehrdeutigem Slug - dann den Pfad angeben.
+        """
+        page = self._by_path.get(key)
+        if page is None:
+            if key.endswith('.html'):
+                key = key[:-len('.html')]
+            key = normalize_key(key)
+            if key not in self.ambiguous:
+                page = self._by_key.get(key)
+        return page
+
+    def title(self, key):
+        page = self.page(key)
+        return page['title'] if page else None
+
+    def category(self, key):
+        """Kategorie eines Artikels oder Papers (Paper erben die ihres Artikels)"""
+        page = self.page(key)
+        if page is not None and page['parent']:
+            page = self.page(page['parent'])
+        if page is None or page['category'] is None:
+            return None
+        return self.categories[page['category']]
+
+    def category_label(self, key):
+        """(Label mit Icon, Kurzname) wie im Hero-Bereich, sonst DEFAULT_CATEGORY"""
+        category = self.category(key)
+        if category is None:
+            return DEFAULT_CATEGORY
+        return f"{category['icon']} {category['name']}", category['short']
+
+    def parent(self, key):
+        page = self.page(key)
+        return self.page(page['parent']) if page and page['parent'] else None
+
+    def children(self, key):
+        page = self.page(key)
+        if page is None:
+            return []
+        return self._children.get(normalize_key(page['slug']), [])
+
+    def of_kind(self, *kinds):
+        return [page for page in self.pages if page['kind'] in kinds]
+
+    def articles(self):
+        """Artikel in Karten-Reihenfolge"""
+        return [self._by_path[a['path']] for c in self.categories for a in c['articles'] if a['path'] in self._by_path]
+
+
+def _load_cached():
+    try:
+        data = json.loads(CACHE_PATH.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    if data.get('version') != MANIFEST_VERSION:
+        return None
+    return data
+
+
+def _store_cached(data):
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        write_text(CACHE_PATH, json.dumps(data, ensure_ascii=False, indent=1))
+    except OSError:
+        # Cache ist optional
+        pass
+
+
+def build_manifest(directory=BASE_PATH, use_cache=True):
+    """Baut das Manifest (oder lädt es aus dem Cache)"""
+    pages = find_pages(directory)
+    stats = page_stats(directory, pages)
+    signature = _signature(directory, stats)
+
+    cached = _load_cached() if use_cache and directory == BASE_PATH else None
+    if cached is not None and cached['signature'] == signature:
+        data = cached
+    else:
+        data = build_manifest_data(directory, pages, stats, previous=cached)
+        data['version'] = MANIFEST_VERSION
+        data['signature'] = signature
+        if directory == BASE_PATH:
+            _store_cached(data)
+    return SiteManifest(data)
+
+
+def load_manifest():
+    """Manifest dieses Laufs (wird nur einmal gebaut)"""
+    global _manifest
+    if _manifest is None:
+        _manifest = build_manifest()
+    return _manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Site-Manifest anzeigen")
+    parser.add_argument('--rebuild', action='store_true', help="Cache ignorieren")
+    args = parser.parse_args()
+
+    manifest = build_manifest(use_cache=not args.rebuild)
+
+    print("=" * 60)
+    print("🗺️  Site-Manifest")
+    print("=" * 60)
+
+    for category in manifest.categories:
+        print(f"\n{category['icon']} {category['name']} ({len(category['articles'])} Artikel)")
+        for article in category['articles']:
+            page = manifest.page(article['path'])
+            papers = manifest.children(article['path']) if page else []
+            status = '' if page else '  ❌ fehlt'
+            print(f"   - {article['name']}{status}")
+            for paper in papers:
+                print(f"      📄 {paper['title'][:60]}")
+
+    kinds = {}
+    for page in manifest.pages:
+        kinds[page['kind']] = kinds.get(page['kind'], 0) + 1
+
+    print("\n" + "=" * 60)
+    print("ZUSAMMENFASSUNG:")
+    for kind, count in sorted(kinds.items()):
+        print(f"   {kind}: {count}")
+    unlisted = manifest.of_kind('unlisted')
+    if unlisted:
+        print(f"   ⚠️  Nicht verlinkt: {', '.join(page['path'] for page in unlisted)}")
+    for key, paths in sorted(manifest.ambiguous.items()):
+        print(f"   ⚠️  Mehrdeutiger Slug '{key}' (nur per Pfad): {', '.join(paths)}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
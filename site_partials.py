@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Gemeinsame Seiten-Partials (Header, Footer, Kategorie-Navigation)
+Statt Header/Footer in jede Datei zu kopieren, werden die Bereiche in den
+Seiten mit Markern eingefasst:
+
+    <!-- partial:site_footer -->...<!-- /partial:site_footer -->
+
+Ein Abhängigkeits-Record (.build/partials.json) merkt sich, welche Seite
+welche Partials enthält. Ändert sich ein Partial, werden nur die Seiten
+neu geschrieben, die es einbinden.
+
+Verwendung:
+  python3 site_partials.py               # geänderte Partials in Seiten übernehmen
+  python3 site_partials.py --fragments   # Partials als eigene Dateien unter partials/ ausliefern
+  python3 site_partials.py --all         # alle Seiten neu prüfen
+"""
+
+import argparse
+import hashlib
+import json
+from pathlib import Path
+
+from safe_write import TreeLocked, tree_lock, write_text
+from template_engine import get_template
+
+BASE_PATH = Path(__file__).parent
+RECORD_PATH = BASE_PATH / '.build' / 'partials.json'
+
+# Ausgelieferte Fragmente (Modus --fragments)
+FRAGMENT_DIR = BASE_PATH / 'partials'
+FRAGMENT_URL = '/partials/{name}.html'
+
+# Verwaltete Partials (templates/partials/<name>.html)
+PARTIALS = ('site_header', 'site_footer', 'category_nav')
+
+# Verzeichnisse, die keine Seiten enthalten
+EXCLUDE_DIRS = {'templates', 'partials'}
+
+FRAGMENT_LOADER = (
+    '<script>(function(s){{fetch("{url}").then(function(r){{return r.text()}})'
+    '.then(function(h){{s.insertAdjacentHTML("beforebegin",h)}})}})(document.currentScript)</script>'
+)
+
+
+def start_marker(name):
+    return f'<!-- partial:{name} -->'
+
+
+def end_marker(name):
+    return f'<!-- /partial:{name} -->'
+
+
+def render_partial(name):
+    """Rendert ein Partial (verschachtelte Partials werden eingebunden)"""
+    return get_template(f'partials/{name}').render_text()
+
+
+def stamp(name, content=None):
+    """Liefert das Partial eingefasst in seine Marker"""
+    if content is None:
+        content = render_partial(name)
+    return start_marker(name) + content + end_marker(name)
+
+
+def fragment_placeholder(name):
+    """Platzhalter, der das Fragment im Browser nachlädt"""
+    return FRAGMENT_LOADER.format(url=FRAGMENT_URL.format(name=name))
+
+
+def find_regions(html, name):
+    """Findet alle markierten Bereiche eines Partials als (start, end) des Inhalts"""
+    start, end = start_marker(name), end_marker(name)
+    regions = []
+    pos = 0
+    while True:
+        a = html.find(start, pos)
+        if a < 0:
+            return regions
+        b = html.find(end, a + len(start))
+        if b < 0:
+            return regions
+        regions.append((a + len(start), b))
+        pos = b + len(end)
+
+
+def marked_spans(html, name):
+    """Markierte Bereiche inklusive der Marker"""
+    start, end = len(start_marker(name)), len(end_marker(name))
+    return [(a - start, b + end) for a, b in find_regions(html, name)]
+
+
+def adopt_regions(html, contents):
+    """Fasst unmarkierte, aber identische Partial-Kopien in Marker ein"""
+    for name, content in contents.items():
+        if start_marker(name) in html or content not in html:
+            continue
+        # Nur außerhalb bereits markierter Bereiche einfassen
+        protected = sorted(span for other in contents for span in marked_spans(html, other))
+        parts = []
+        pos = 0
+        for a, b in protected + [(len(html), len(html))]:
+            parts.append(html[pos:a].replace(content, stamp(name, content)))
+            parts.append(html[a:b])
+            pos = b
+        html = ''.join(parts)
+    return html
+
+
+def apply_partials(html, contents):
+    """Ersetzt den Inhalt aller markierten Bereiche. Gibt (html, namen) zurück."""
+    found = []
+    for name, content in contents.items():
+        regions = find_regions(html, name)
+        if not regions:
+            continue
+        found.append(name)
+        parts = []
+        pos = 0
+        for a, b in regions:
+            parts.append(html[pos:a])
+            parts.append(content)
+            pos = b
+        parts.append(html[pos:])
+        html = ''.join(parts)
+    return html, found
+
+
+def find_pages(directory):
+    """Findet alle HTML-Seiten (ohne Templates, Fragmente und Backups)"""
+    pages = []
+    for f in directory.rglob('*.html'):
+        parts = f.relative_to(directory).parts
+        if parts[0] in EXCLUDE_DIRS or any(p.startswith('.') for p in parts):
+            continue
+        if f.is_file():
+            pages.append(f)
+    return sorted(pages)
+
+
+def _hash(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def load_record():
+    try:
+        return json.loads(RECORD_PATH.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {'mode': None, 'partials': {}, 'pages': {}}
+
+
+def save_record(record):
+    RECORD_PATH.parent.mkdir(parents=True, exist_ok=True)
+    write_text(RECORD_PATH, json.dumps(record, indent=1, sort_keys=True))
+
+
+def write_fragments(rendered, changed):
+    """Schreibt geänderte Partials als eigenständig cachebare Fragmente"""
+    FRAGMENT_DIR.mkdir(exist_ok=True)
+    for name in changed:
+        write_text(FRAGMENT_DIR / f'{name}.html', rendered[name])
+
+
+def build(fragments=False, rescan=False):
+    """
+    Überträgt geänderte Partials in die abhängigen Seiten.
+    Gibt (geschriebene Seiten, geprüfte Seiten, geänderte Partials) zurück.
+    """
+    mode = 'fragments' if fragments else 'inline'
+    record = load_record()
+    rendered = {name: render_partial(name) for name in PARTIALS}
+    hashes = {name: _hash(content) for name, content in rendered.items()}
+
+    changed = {name for name in PARTIALS if record['partials'].get(name) != hashes[name]}
+    mode_changed = record.get('mode') != mode
+
+    if fragments:
+        write_fragments(rendered, changed | (set(PARTIALS) if mode_changed else set()))
+        contents = {name: fragment_placeholder(name) for name in PARTIALS}
+    else:
+        contents = rendered
+
+    # Seiten in den Seiteninhalt übernehmen, wenn sich dieser geändert hat
+    page_changed = set(PARTIALS) if mode_changed else (set() if fragments else changed)
+
+    pages = find_pages(BASE_PATH)
+    known = record['pages']
+    todo = []
+    for page in pages:
+        rel = page.relative_to(BASE_PATH).as_posix()
+        if rescan or rel not in known or page_changed.intersection(known[rel]):
+            todo.append((page, rel))
+
+    new_pages = {}
+    written = 0
+    for page, rel in todo:
+        try:
+            html = page.read_text(encoding='utf-8')
+            updated = adopt_regions(html, rendered)
+            updated, found = apply_partials(updated, contents)
+            new_pages[rel] = found
+            if updated != html:
+                write_text(page, updated)
+                print(f"  ✅ {rel}")
+                written += 1
+        except Exception as e:
+            print(f"  ❌ {rel}: {e}")
+
+    # Record aktualisieren (gelöschte Seiten fallen heraus)
+    existing = {page.relative_to(BASE_PATH).as_posix() for page in pages}
+    pages_record = {rel: names for rel, names in known.items() if rel in existing}
+    pages_record.update(new_pages)
+    save_record({'mode': mode, 'partials': hashes, 'pages': pages_record})
+
+    return written, len(todo), sorted(changed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gemeinsame Partials in die Seiten übernehmen")
+    parser.add_argument('--fragments', action='store_true',
+                        help="Partials als eigene Dateien unter partials/ ausliefern")
+    parser.add_argument('--all', action='store_true',
+                        help="alle Seiten neu prüfen statt nur die abhängigen")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("🧩 Gemeinsame Partials")
+    print("=" * 60)
+
+    try:
+        tree_lock()
+    except TreeLocked as e:
+        print(f"❌ {e}")
+        return
+
+    print(f"\n📁 Verzeichnis: {BASE_PATH}\n")
+
+    written, checked, changed = build(fragments=args.fragments, rescan=args.all)
+
+    print("\n" + "=" * 60)
+    print("ZUSAMMENFASSUNG:")
+    print(f"   🧩 Geänderte Partials: {', '.join(changed) or 'keine'}")
+    print(f"   🔍 Geprüfte Seiten: {checked}")
+    print(f"   ✅ Aktualisiert: {written}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Vorkompilierte Templates
+Ein Template wird einmal in statische Byte-Segmente plus Slots zerlegt und
+danach nur noch mit einem einzigen join gerendert. Die kompilierte Form wird
+unter .build/templates zwischengespeichert.
+
+Syntax (CSS und JS brauchen keine doppelten Klammern mehr):
+  {{ title }}        Slot, wird beim Rendern gefüllt
+  {{> header }}      Partial aus templates/partials/header.html
+"""
+
+import hashlib
+import marshal
+import re
+from pathlib import Path
+
+from safe_write import write_bytes
+
+TEMPLATE_DIR = Path(__file__).parent / 'templates'
+PARTIAL_DIR = TEMPLATE_DIR / 'partials'
+CACHE_DIR = Path(__file__).parent / '.build' / 'templates'
+
+# Bei Formatänderungen erhöhen, damit alte Cache-Dateien ignoriert werden
+CACHE_VERSION = 1
+
+_TOKEN = re.compile(r'\{\{\s*(>?)\s*([\w./-]+)\s*\}\}')
+
+# Bereits geladene Templates dieses Laufs
+_loaded = {}
+
+
+class TemplateError(Exception):
+    """Fehler beim Kompilieren oder Rendern eines Templates"""
+
+
+class CompiledTemplate:
+    """Statische Segmente und Slot-Namen: seg0, slot0, seg1, slot1, ..., segN"""
+
+    __slots__ = ('name', 'segments', 'slots', 'deps', '_size')
+
+    def __init__(self, name, segments, slots, deps):
+        self.name = name
+        self.segments = segments
+        self.slots = slots
+        self.deps = deps
+        self._size = len(segments) + len(slots)
+
+    def render(self, **values):
+        """Rendert als bytes; Werte dürfen str oder bytes sein"""
+        parts = [None] * self._size
+        parts[0::2] = self.segments
+        index = 1
+        for name in self.slots:
+            try:
+                value = values[name]
+            except KeyError:
+                raise TemplateError(f"{self.name}: Wert für '{name}' fehlt") from None
+            parts[index] = value if isinstance(value, bytes) else str(value).encode('utf-8')
+            index += 2
+        return b''.join(parts)
+
+    def render_text(self, **values):
+        """Rendert als str"""
+        return self.render(**values).decode('utf-8')
+
+
+def _read(path):
+    try:
+        return path.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        raise TemplateError(f"Template nicht gefunden: {path}") from None
+
+
+def _strip_final_newline(source):
+    """Der Zeilenumbruch am Dateiende gehört nicht zum Template"""
+    return source[:-1] if source.endswith('\n') else source
+
+
+def _hash(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def compile_template(source, name='<string>', load_partial=None, _stack=()):
+    """
+    Zerlegt einen Template-Text in Segmente und Slots.
+    Gibt (segments, slots, deps) zurück; deps bildet Partial-Namen auf
+    den Hash ihres Quelltexts ab.
+    """
+    if load_partial is None:
+        load_partial = lambda partial: _read(PARTIAL_DIR / f'{partial}.html')
+
+    segments = []
+    slots = []
+    deps = {}
+    pending = []
+    pos = 0
+
+    for match in _TOKEN.finditer(source):
+        pending.append(source[pos:match.start()])
+        pos = match.end()
+        is_partial, key = match.groups()
+
+        if is_partial:
+            if key in _stack:
+                raise TemplateError(f"{name}: Partial '{key}' bindet sich selbst ein")
+            partial_source = load_partial(key)
+            deps[key] = _hash(partial_source)
+            sub_segments, sub_slots, sub_deps = compile_template(
+                _strip_final_newline(partial_source), key, load_partial, _stack + (key,)
+            )
+            deps.update(sub_deps)
+            # Partial-Segmente mit dem aktuellen Text verschmelzen
+            pending.append(sub_segments[0])
+            for slot, segment in zip(sub_slots, sub_segments[1:]):
+                segments.append(''.join(pending))
+                slots.append(slot)
+                pending = [segment]
+        else:
+            segments.append(''.join(pending))
+            slots.append(key)
+            pending = []
+
+    pending.append(source[pos:])
+    segments.append(''.join(pending))
+    return segments, slots, deps
+
+
+def _cache_path(name):
+    return CACHE_DIR / (name.replace('/', '__') + '.marshal')
+
+
+def _load_cached(name, source_hash):
+    try:
+        version, cached_hash, deps, segments, slots = marshal.loads(_cache_path(name).read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+    if version != CACHE_VERSION or cached_hash != source_hash:
+        return None
+    for partial, partial_hash in deps.items():
+        path = PARTIAL_DIR / f'{partial}.html'
+        if not path.exists() or _hash(_read(path)) != partial_hash:
+            return None
+    return CompiledTemplate(name, segments, slots, deps)
+
+
+def _store_cached(template, source_hash):
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        data = (CACHE_VERSION, source_hash, template.deps, template.segments, template.slots)
+        write_bytes(_cache_path(template.name), marshal.dumps(data))
+    except OSError:
+        # Cache ist optional
+        pass
+
+
+def get_template(name, suffix='.html'):
+    """
+    Lädt templates/<name>.html - aus dem Speicher, dem Disk-Cache oder neu
+    kompiliert. Andere Dateiarten mit suffix='' und vollem Namen ('sw.js').
+    """
+    template = _loaded.get(name)
+    if template is not None:
+        return template
+
+    source = _read(TEMPLATE_DIR / f'{name}{suffix}')
+    source_hash = _hash(source)
+
+    template = _load_cached(name, source_hash)
+    if template is None:
+        segments, slots, deps = compile_template(_strip_final_newline(source), name)
+        template = CompiledTemplate(
+            name,
+            tuple(s.encode('utf-8') for s in segments),
+            tuple(slots),
+            deps
+        )
+        _store_cached(template, source_hash)
+
+    _loaded[name] = template
+    return template
+
+
+def render(name, **values):
+    """Kurzform: get_template(name).render_text(**values)"""
+    return get_template(name).render_text(**values)
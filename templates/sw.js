@@ -0,0 +1,160 @@
+/*
+ * Service Worker - wird von service_worker.py aus templates/sw.js erzeugt.
+ *
+ * eager: Shell, CSS, Schriften - beim Installieren geladen
+ * lazy:  Artikel und Paper - beim ersten Besuch gespeichert
+ * swr:   Übersichtsseite - sofort aus dem Cache, im Hintergrund aktualisiert
+ *
+ * Ausgelagerte Abschnitte langer Artikel (chunk_articles.py) werden wie die
+ * Übersichtsseite behandelt: sofort aus dem Cache, im Hintergrund aktualisiert.
+ *
+ * Jeder Eintrag trägt einen Hash seines Inhalts. Beim Deploy werden nur
+ * Dateien neu geladen bzw. verworfen, deren Hash sich geändert hat.
+ */
+// Version {{ version }}
+const PRECACHE = {{ precache }};
+
+const SHELL_CACHE = 'jac-shell';
+const PAGE_CACHE = 'jac-pages';
+const FONT_CACHE = 'jac-fonts';
+const REVISIONS_KEY = '__revisions__';
+const OFFLINE_PAGE = 'index.html';
+const FONT_HOSTS = ['fonts.googleapis.com', 'fonts.gstatic.com'];
+const FRAGMENT_DIR = '{{ fragment_dir }}/';
+
+const scope = new URL(self.registration.scope);
+const absolute = path => new URL(path, scope).href;
+const eager = new Set(PRECACHE.eager.map(([path]) => path));
+const lazy = new Set(PRECACHE.lazy.map(([path]) => path));
+const swr = new Set(PRECACHE.swr);
+const isFragment = path => path.startsWith(FRAGMENT_DIR) || path.includes('/' + FRAGMENT_DIR);
+
+async function storedRevisions(cache) {
+  const stored = await cache.match(absolute(REVISIONS_KEY));
+  return stored ? stored.json() : {};
+}
+
+async function install() {
+  const shell = await caches.open(SHELL_CACHE);
+  const pages = await caches.open(PAGE_CACHE);
+  const previous = await storedRevisions(shell);
+  const revisions = {};
+
+  // Nur neue oder geänderte Dateien laden
+  await Promise.all(PRECACHE.eager.map(async ([path, revision]) => {
+    revisions[path] = revision;
+    if (previous[path] === revision && await shell.match(absolute(path))) {
+      return;
+    }
+    const response = await fetch(absolute(path), {cache: 'reload'});
+    if (!response.ok) {
+      throw new Error(`${path}: ${response.status}`);
+    }
+    await shell.put(absolute(path), response);
+  }));
+
+  // Geänderte Seiten verwerfen - sie werden beim nächsten Besuch neu geladen
+  await Promise.all(PRECACHE.lazy.map(async ([path, revision]) => {
+    revisions[path] = revision;
+    if (path in previous && previous[path] !== revision) {
+      await pages.delete(absolute(path));
+    }
+  }));
+
+  // Entfernte Dateien löschen
+  await Promise.all(Object.keys(previous)
+    .filter(path => !(path in revisions))
+    .map(path => Promise.all([shell.delete(absolute(path)), pages.delete(absolute(path))])));
+
+  await shell.put(absolute(REVISIONS_KEY), new Response(JSON.stringify(revisions)));
+}
+
+function sitePath(url) {
+  let path = decodeURIComponent(url.pathname.slice(scope.pathname.length));
+  if (path === '' || path.endsWith('/')) {
+    path += 'index.html';
+  }
+  return path;
+}
+
+async function offline(request) {
+  if (request.mode === 'navigate') {
+    const fallback = await caches.match(absolute(OFFLINE_PAGE));
+    if (fallback) {
+      return fallback;
+    }
+  }
+  return Response.error();
+}
+
+async function cacheFirst(cacheName, key, request) {
+  const cache = await caches.open(cacheName);
+  const cached = await cache.match(key);
+  if (cached) {
+    return cached;
+  }
+  try {
+    const response = await fetch(request);
+    if (response.ok) {
+      await cache.put(key, response.clone());
+    }
+    return response;
+  } catch (error) {
+    return offline(request);
+  }
+}
+
+async function staleWhileRevalidate(cacheName, key, request, event) {
+  const cache = await caches.open(cacheName);
+  const cached = await cache.match(key);
+  const update = fetch(request).then(async response => {
+    if (response.ok) {
+      await cache.put(key, response.clone());
+    }
+    return response;
+  });
+  if (cached) {
+    event.waitUntil(update.catch(() => undefined));
+    return cached;
+  }
+  return update.catch(() => offline(request));
+}
+
+self.addEventListener('install', event => {
+  event.waitUntil(install().then(() => self.skipWaiting()));
+});
+
+self.addEventListener('activate', event => {
+  event.waitUntil(self.clients.claim());
+});
+
+self.addEventListener('fetch', event => {
+  const request = event.request;
+  if (request.method !== 'GET') {
+    return;
+  }
+  const url = new URL(request.url);
+
+  if (FONT_HOSTS.includes(url.hostname)) {
+    const cacheName = eager.has(url.href) ? SHELL_CACHE : FONT_CACHE;
+    event.respondWith(cacheFirst(cacheName, url.href, request));
+    return;
+  }
+  if (url.origin !== scope.origin || !url.pathname.startsWith(scope.pathname)) {
+    return;
+  }
+
+  const path = sitePath(url);
+  const key = absolute(path);
+  if (swr.has(path)) {
+    event.respondWith(staleWhileRevalidate(SHELL_CACHE, key, request, event));
+  } else if (eager.has(path)) {
+    event.respondWith(cacheFirst(SHELL_CACHE, key, request));
+  } else if (lazy.has(path)) {
+    event.respondWith(cacheFirst(PAGE_CACHE, key, request));
+  } else if (isFragment(path)) {
+    event.respondWith(staleWhileRevalidate(PAGE_CACHE, key, request, event));
+  } else if (request.mode === 'navigate') {
+    event.respondWith(fetch(request).catch(() => offline(request)));
+  }
+});
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+TF-IDF-Vektoren und Kosinus-Ähnlichkeit
+Gemeinsame Textextraktion und -mathematik für Build-Stufen (verwandte
+Artikel, Dubletten, Cluster).
+
+Dokumente werden als dünn besetzte Zeilen (Term-Indizes, Gewichte)
+gehalten. Ist NumPy installiert, werden die Ähnlichkeiten blockweise als
+Matrixprodukt berechnet; sonst über einen invertierten Index in reinem
+Python (gleiche Ergebnisse, für einige hundert Seiten schnell genug).
+"""
+
+import hashlib
+import heapq
+import html
+import json
+import math
+import re
+from collections import Counter
+
+from html_matcher import find_elements, remove_elements
+from page_blocks import strip_blocks
+from safe_write import write_text
+from site_manifest import BASE_PATH
+
+try:
+    import numpy as np
+except ImportError:
+    # Optional - ohne NumPy rechnet der invertierte Index
+    np = None
+
+# Termhäufigkeiten pro Seite, gemeinsam für alle Build-Stufen
+TERM_CACHE_PATH = BASE_PATH / '.build' / 'terms.json'
+TERM_CACHE_VERSION = 1
+
+# Zeilen pro Matrixblock (begrenzt den Speicher der Ähnlichkeitsmatrix)
+BLOCK_ROWS = 512
+
+# Häufige Wörter ohne Aussagekraft (Deutsch/Englisch)
+STOPWORDS = frozenset('''
+    aber alle allem allen aller alles als also am an ander andere anderen auch auf aus bei beim
+    bereits bis bzw da damit dann das dass dem den denen der deren des dessen die dies diese
+    diesem diesen dieser dieses doch dort durch ein eine einem einen einer eines einige er es
+    etwa für gegen hat hatte hatten hier ihr ihre im in ins ist je jedoch kann kein keine können
+    mehr mit nach nicht noch nur ob oder ohne pro sehr sein seine sich sie sind so sowie über
+    um und uns unter vom von vor war waren was weil welche wenn werden wie wird wurde wurden zu
+    zum zur zwischen sowohl häufig meist oft ggf usw
+    about after also and are been but can for from had has have into its more not than that
+    the their these this those was were which while with
+'''.split())
+
+# Bereiche ohne Fließtext
+NON_CONTENT_TAGS = ('script', 'style', 'nav', 'header', 'footer', 'aside')
+
+_WORD = re.compile(r'[^\W\d_]{3,}')
+_TAGS = re.compile(r'<[^>]+>')
+_SPACES = re.compile(r'\s+')
+
+
+def html_text(fragment):
+    """Sichtbarer Text eines HTML-Ausschnitts"""
+    for tag in NON_CONTENT_TAGS:
+        fragment = remove_elements(fragment, tag)
+    return _SPACES.sub(' ', html.unescape(_TAGS.sub(' ', fragment))).strip()
+
+
+def page_text(page_html):
+    """Fließtext aus <article> (sonst <main>/<body>) ohne generierte Blöcke"""
+    content = strip_blocks(page_html)
+    for container in ('article', 'main', 'body'):
+        spans = find_elements(content, container)
+        if spans:
+            content = ' '.join(content[start:end] for start, end in spans)
+            break
+    return html_text(content)
+
+
+def tokenize(text):
+    """Kleingeschriebene Wörter ab 3 Buchstaben ohne Stoppwörter"""
+    return [word for word in _WORD.findall(text.lower()) if word not in STOPWORDS]
+
+
+def term_counts(text):
+    """Termhäufigkeiten eines Textes (JSON-serialisierbar)"""
+    return dict(Counter(tokenize(text)))
+
+
+def content_hash(page_html):
+    """Hash des Seiteninhalts ohne generierte Blöcke"""
+    return hashlib.sha256(strip_blocks(page_html).encode('utf-8')).hexdigest()[:16]
+
+
+def load_term_cache():
+    try:
+        data = json.loads(TERM_CACHE_PATH.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if data.get('version') != TERM_CACHE_VERSION:
+        return {}
+    return data['pages']
+
+
+def store_term_cache(entries, directory=BASE_PATH):
+    """Ergänzt den Cache um entries; Einträge gelöschter Seiten entfallen"""
+    pages = {rel: entry for rel, entry in load_term_cache().items() if (directory / rel).is_file()}
+    pages.update(entries)
+    try:
+        TERM_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        write_text(TERM_CACHE_PATH, json.dumps({'version': TERM_CACHE_VERSION, 'pages': pages}, ensure_ascii=False))
+    except OSError:
+        # Cache ist optional
+        pass
+
+
+def collect_terms(paths, cache, directory=BASE_PATH):
+    """
+    Liest die Seiten und liefert (HTML pro Seite, Cache-Einträge, Anzahl neu
+    eingelesener Seiten). Unveränderte Seiten übernehmen ihre Termhäufigkeiten.
+    """
+    texts = {}
+    entries = {}
+    scanned = 0
+    for rel in paths:
+        try:
+            page_html = (directory / rel).read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"  ⚠️  {rel}: {e}")
+            continue
+        texts[rel] = page_html
+        digest = content_hash(page_html)
+        cached = cache.get(rel)
+        if cached is not None and cached['hash'] == digest:
+            entries[rel] = cached
+            continue
+        entries[rel] = {'hash': digest, 'terms': term_counts(page_text(page_html))}
+        scanned += 1
+    return texts, entries, scanned
+
+
+def tfidf_rows(documents, min_df=2, max_df=0.5, max_features=None, max_terms=None):
+    """
+    Gewichtet Termhäufigkeiten mit sublinearem TF und geglättetem IDF.
+
+    documents: Liste von {Term: Anzahl}. Die Zeilen werden über den
+    vollständigen Vektor normiert; danach bleiben nur Terme, die in
+    mindestens min_df und höchstens max_df (Anteil) der Dokumente vorkommen
+    (höchstens max_features, die häufigsten zuerst). max_terms behält pro
+    Zeile nur die stärksten Terme - das hält die Indexlisten kurz, die
+    Ähnlichkeiten werden dadurch eher unter- als überschätzt.
+    Gibt (Vokabular, Zeilen) zurück, eine Zeile ist (Indizes, Gewichte).
+    """
+    total = len(documents)
+    df = Counter()
+    for counts in documents:
+        df.update(counts.keys())
+
+    upper = max(min_df, int(max_df * total))
+    kept = sorted((term for term, n in df.items() if min_df <= n <= upper), key=lambda t: (-df[t], t))
+    if max_features is not None:
+        kept = kept[:max_features]
+    vocabulary = {term: i for i, term in enumerate(kept)}
+    idf = {term: math.log((1 + total) / (1 + n)) + 1 for term, n in df.items()}
+
+    rows = []
+    for counts in documents:
+        weights = {term: (1 + math.log(n)) * idf[term] for term, n in counts.items()}
+        norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+        row = [(vocabulary[term], w / norm) for term, w in weights.items() if term in vocabulary]
+        if max_terms is not None and len(row) > max_terms:
+            row = heapq.nlargest(max_terms, row, key=lambda pair: pair[1])
+        row.sort()
+        rows.append(([i for i, _ in row], [w for _, w in row]))
+    return kept, rows
+
+
+def _dense(rows, width):
+    matrix = np.zeros((len(rows), width), dtype=np.float32)
+    for r, (indices, values) in enumerate(rows):
+        matrix[r, indices] = values
+    return matrix
+
+
+def _ranked(candidates, k, min_score):
+    """Beste k (Index, Wert)-Paare; gleiche Werte nach Index, ohne Nullwerte"""
+    best = heapq.nsmallest(k, candidates, key=lambda pair: (-pair[1], pair[0]))
+    return [(j, score) for j, score in best if score > 0 and score >= min_score]
+
+
+def _top_similar_numpy(rows, width, k, min_score):
+    matrix = _dense(rows, width)
+    total = len(rows)
+    result = []
+    for start in range(0, total, BLOCK_ROWS):
+        block = matrix[start:start + BLOCK_ROWS] @ matrix.T
+        local = np.arange(block.shape[0])
+        block[local, start + local] = -1.0
+        if k < total - 1:
+            top = np.argpartition(-block, k, axis=1)[:, :k + 1]
+        else:
+            top = np.broadcast_to(np.arange(total), block.shape)
+        for r in range(block.shape[0]):
+            scores = block[r, top[r]]
+            result.append(_ranked(zip(top[r].tolist(), scores.tolist()), k, min_score))
+    return result
+
+
+def _top_similar_python(rows, k, min_score):
+    postings = {}
+    for doc, (indices, values) in enumerate(rows):
+        for term, weight in zip(indices, values):
+            postings.setdefault(term, []).append((doc, weight))
+
+    result = []
+    for doc, (indices, values) in enumerate(rows):
+        scores = {}
+        for term, weight in zip(indices, values):
+            for other, other_weight in postings[term]:
+                if other != doc:
+                    scores[other] = scores.get(other, 0.0) + weight * other_weight
+        result.append(_ranked(scores.items(), k, min_score))
+    return result
+
+
+def top_similar(rows, width, k=5, min_score=0.0):
+    """
+    Die k ähnlichsten Dokumente pro Dokument (Kosinus, ohne sich selbst).
+    Gibt pro Zeile eine Liste von (Index, Ähnlichkeit) zurück, absteigend.
+    """
+    if not rows or k <= 0:
+        return [[] for _ in rows]
+    if np is not None and width:
+        return _top_similar_numpy(rows, width, k, min_score)
+    return _top_similar_python(rows, k, min_score)
+
+
+def _centroids_python(rows, labels):
+    sums = {}
+    for (indices, values), label in zip(rows, labels):
+        if label is None:
+            continue
+        centroid = sums.setdefault(label, {})
+        for term, weight in zip(indices, values):
+            centroid[term] = centroid.get(term, 0.0) + weight
+    for centroid in sums.values():
+        norm = math.sqrt(sum(w * w for w in centroid.values())) or 1.0
+        for term in centroid:
+            centroid[term] /= norm
+    return sums
+
+
+def nearest_centroids(rows, labels, width):
+    """
+    Kosinus-Ähnlichkeit jeder Zeile zum Schwerpunkt jeder Klasse.
+
+    labels: pro Zeile ein Label oder None (ohne Label - zählt nicht zum
+    Schwerpunkt). Gibt pro Zeile eine Liste von (Label, Ähnlichkeit)
+    zurück, absteigend.
+    """
+    classes = sorted({label for label in labels if label is not None})
+    if not classes:
+        return [[] for _ in rows]
+
+    if np is not None and width:
+        matrix = _dense(rows, width)
+        centroids = np.zeros((len(classes), width), dtype=np.float32)
+        for k, label in enumerate(classes):
+            members = [r for r, own in enumerate(labels) if own == label]
+            centroids[k] = matrix[members].sum(axis=0)
+        centroids /= np.maximum(np.linalg.norm(centroids, axis=1, keepdims=True), 1e-12)
+        scores = (matrix @ centroids.T).tolist()
+    else:
+        centroids = _centroids_python(rows, labels)
+        scores = [
+            [sum(centroids[label].get(term, 0.0) * weight for term, weight in zip(indices, values)) for label in classes]
+            for indices, values in rows
+        ]
+
+    return [
+        sorted(zip(classes, row), key=lambda pair: -pair[1])
+        for row in scores
+    ]
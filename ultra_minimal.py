@@ -4,211 +4,27 @@ Ultra-minimales Artikel-Design
 - Entfernt "Zurück zur Übersicht"
 - Minimalstes Design
 - Garantiert nichts zerschossen
+- Abgebrochene Läufe mit --resume fortsetzen (Journal, siehe batch_journal.py)
 """
 
+import argparse
 import re
 from pathlib import Path
 
-# Ultra-minimales HTML-Template
-MINIMAL_TEMPLATE = '''<!DOCTYPE html>
-<html lang="de">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
+from batch_journal import Journal, JournalError
+from html_matcher import Budget, MatcherTimeout, remove_elements
+from minify_html import minify_output
+from safe_write import TreeLocked, tree_lock, write_text
+from site_manifest import load_manifest
+from template_engine import get_template
 
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-            line-height: 1.5;
-            color: #000;
-            background: #fff;
-            padding: 20px;
-            max-width: 1200px;
-            margin: 0 auto;
-        }}
+NAV_START = re.compile(r'<nav[^>]*class=["\']nav["\']', re.IGNORECASE)
 
-        .container {{
-            display: flex;
-            gap: 30px;
-        }}
+# Ultra-minimales HTML-Template: templates/ultra_minimal.html
+TEMPLATE_NAME = 'ultra_minimal'
 
-        /* Navigation Sidebar */
-        .nav {{
-            width: 250px;
-            flex-shrink: 0;
-            padding: 15px;
-            background: #f8f8f8;
-            border: 1px solid #ddd;
-            border-radius: 8px;
-            position: sticky;
-            top: 20px;
-            height: fit-content;
-        }}
-
-        .nav h3 {{
-            font-size: 12px;
-            text-transform: uppercase;
-            color: #666;
-            margin-bottom: 10px;
-        }}
-
-        .nav ul {{
-            list-style: none;
-        }}
-
-        .nav li {{
-            margin-bottom: 5px;
-        }}
-
-        .nav a {{
-            font-size: 13px;
-            color: #000;
-            text-decoration: none;
-            display: block;
-            padding: 5px;
-            border-radius: 4px;
-        }}
-
-        .nav a:hover {{
-            background: #e8e8e8;
-            color: #0066cc;
-        }}
-
-        /* Content */
-        .content {{
-            flex: 1;
-            min-width: 0;
-        }}
-
-        .breadcrumbs {{
-            font-size: 13px;
-            color: #666;
-            margin-bottom: 15px;
-        }}
-
-        .breadcrumbs a {{
-            color: #0066cc;
-            text-decoration: none;
-        }}
-
-        .back-link {{
-            display: inline-block;
-            color: #0066cc;
-            text-decoration: none;
-            margin-bottom: 20px;
-            font-size: 14px;
-        }}
-
-        .back-link:hover {{
-            text-decoration: underline;
-        }}
-
-        h1 {{
-            font-size: 28px;
-            margin-bottom: 20px;
-            font-weight: 600;
-        }}
-
-        h2 {{
-            font-size: 22px;
-            margin-top: 30px;
-            margin-bottom: 10px;
-            font-weight: 600;
-        }}
-
-        h3 {{
-            font-size: 18px;
-            margin-top: 20px;
-            margin-bottom: 8px;
-            font-weight: 600;
-        }}
-
-        h4 {{
-            font-size: 16px;
-            margin-top: 15px;
-            margin-bottom: 5px;
-            font-weight: 600;
-        }}
-
-        p {{
-            margin-bottom: 10px;
-        }}
-
-        ul, ol {{
-            margin-bottom: 10px;
-            padding-left: 25px;
-        }}
-
-        li {{
-            margin-bottom: 3px;
-        }}
-
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin: 15px 0;
-        }}
-
-        th, td {{
-            border: 1px solid #ddd;
-            padding: 8px;
-            text-align: left;
-        }}
-
-        th {{
-            background: #f0f0f0;
-            font-weight: 600;
-        }}
-
-        strong {{
-            font-weight: 600;
-        }}
-
-        /* Mobile */
-        @media (max-width: 768px) {{
-            .container {{
-                flex-direction: column;
-            }}
-
-            .nav {{
-                width: 100%;
-                position: static;
-            }}
-        }}
-
-        /* Smooth scroll */
-        html {{
-            scroll-behavior: smooth;
-        }}
-
-        h2[id] {{
-            scroll-margin-top: 20px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <!-- Navigation Sidebar -->
-        <nav class="nav">
-            <h3>Navigation</h3>
-            <ul>
-{nav}
-            </ul>
-        </nav>
-
-        <!-- Content -->
-        <div class="content">
-{content}
-        </div>
-    </div>
-</body>
-</html>'''
+# Name des Journals in .build/journal
+JOURNAL_NAME = 'ultra_minimal'
 
 
 def extract_title(html):
@@ -266,7 +82,7 @@ def make_nav(headings):
     return '\n'.join(items)
 
 
-def extract_content(html):
+def extract_content(html, budget=None):
     """Extrahiert Body - Breadcrumbs und Zurück-Links bleiben drin!"""
     match = re.search(r'<body[^>]*>(.*?)</body>', html, re.I | re.S)
     if not match:
@@ -275,28 +91,27 @@ def extract_content(html):
     content = match.group(1)
     
     # Entferne nur störende Elemente
-    content = re.sub(r'<script[^>]*>.*?</script>', '', content, flags=re.I | re.S)
-    content = re.sub(r'<style[^>]*>.*?</style>', '', content, flags=re.I | re.S)
-    content = re.sub(r'<nav[^>]*class=["\']nav["\'][^>]*>.*?</nav>', '', content, flags=re.I | re.S)
-    content = re.sub(r'<header[^>]*>.*?</header>', '', content, flags=re.I | re.S)
-    content = re.sub(r'<footer[^>]*>.*?</footer>', '', content, flags=re.I | re.S)
-    content = re.sub(r'<aside[^>]*>.*?</aside>', '', content, flags=re.I | re.S)
+    for tag in ('script', 'style'):
+        content = remove_elements(content, tag, budget=budget)
+    content = remove_elements(content, 'nav', NAV_START, budget)
+    for tag in ('header', 'footer', 'aside'):
+        content = remove_elements(content, tag, budget=budget)
     
     # WICHTIG: Breadcrumbs und "Zurück"-Links bleiben erhalten!
     
     return content.strip()
 
 
-def convert(filepath):
-    """Konvertiert Artikel"""
+def convert(filepath, journal):
+    """Konvertiert Artikel; jeder Schritt wird im Journal festgehalten"""
     print(f"📄 {filepath.name}")
     
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
             html = f.read()
         
-        title = extract_title(html)
-        content = extract_content(html)
+        title = load_manifest().title(filepath.stem) or extract_title(html)
+        content = extract_content(html, Budget())
         headings = extract_h2(content)
         
         print(f"   📋 {len(headings)} Abschnitte")
@@ -305,34 +120,50 @@ def convert(filepath):
         nav = make_nav(headings)
         breadcrumb = title if len(title) < 40 else title[:37] + '...'
         
-        new_html = MINIMAL_TEMPLATE.format(
+        new_html = get_template(TEMPLATE_NAME).render_text(
             title=title,
             breadcrumb=breadcrumb,
             nav=nav,
             content=content
         )
+        new_html = minify_output(new_html)
         
         # Backup
         backup = filepath.with_suffix('.html.backup')
-        with open(backup, 'w', encoding='utf-8') as f:
-            f.write(html)
+        write_text(backup, html)
         
         # Schreibe
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(new_html)
+        journal.write(filepath, html, new_html)
         
         print(f"   ✅ Konvertiert")
         return True
         
+    except MatcherTimeout as e:
+        print(f"   ⏱️  Übersprungen: {e}")
+        journal.finish(filepath, 'skipped')
+        return False
     except Exception as e:
         print(f"   ❌ Fehler: {e}")
+        journal.finish(filepath, 'error')
         return False
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Artikel ins ultra-minimale Design konvertieren")
+    parser.add_argument('--resume', action='store_true', help="abgebrochenen Lauf fortsetzen")
+    parser.add_argument('--restart', action='store_true', help="abgebrochenen Lauf verwerfen und neu beginnen")
+    args = parser.parse_args()
+
     print("=" * 70)
     print("🎨 ULTRA-MINIMAL DESIGN")
     print("=" * 70)
+
+    try:
+        tree_lock()
+    except TreeLocked as e:
+        print(f"❌ {e}")
+        return
+
     print()
     print("• Entfernt 'Zurück zur Übersicht'")
     print("• Kleinstmögliches Design")
@@ -340,43 +171,60 @@ def main():
     print()
     
     cwd = Path.cwd()
-    
-    # Backups löschen
-    backups = list(cwd.glob('*.backup')) + list(cwd.glob('*.backup2'))
-    if backups:
-        print(f"🗑️  {len(backups)} Backups gefunden")
-        resp = input("Backups löschen? (j/n): ")
-        if resp.lower() in ['j', 'ja', 'y']:
-            for b in backups:
-                b.unlink()
-            print(f"✅ {len(backups)} Backups gelöscht")
+    journal = Journal(JOURNAL_NAME, cwd)
+    
+    if args.resume:
+        try:
+            files = journal.resume()
+        except JournalError as e:
+            print(f"❌ {e}")
+            return
+        print(f"⏩ Fortsetzen: {len(journal.done)}/{len(files)} Artikel bereits erledigt")
         print()
+    else:
+        if journal.unfinished() and not args.restart:
+            print("⚠️  Ein früherer Lauf wurde abgebrochen")
+            print("   Fortsetzen mit --resume, neu beginnen mit --restart")
+            return
+        
+        # Backups löschen
+        backups = list(cwd.glob('*.backup')) + list(cwd.glob('*.backup2'))
+        if backups:
+            print(f"🗑️  {len(backups)} Backups gefunden")
+            resp = input("Backups löschen? (j/n): ")
+            if resp.lower() in ['j', 'ja', 'y']:
+                for b in backups:
+                    b.unlink()
+                print(f"✅ {len(backups)} Backups gelöscht")
+            print()
+        
+        # Finde Artikel
+        exclude = load_manifest().skip_names
+        files = sorted(f for f in cwd.glob('*.html')
+                       if f.name.lower() not in exclude
+                       and not f.name.endswith('.backup'))
+        
+        if not files:
+            print("❌ Keine Artikel")
+            return
+        
+        print(f"📋 {len(files)} Artikel")
+        print()
+        
+        resp = input("Konvertieren? (j/n): ")
+        if resp.lower() not in ['j', 'ja', 'y']:
+            print("Abgebrochen")
+            return
+        
+        print()
+        files = journal.begin(files)
     
-    # Finde Artikel
-    exclude = {'index.html', 'huefte.html', 'hufte.html'}
-    files = [f for f in cwd.glob('*.html') 
-             if f.name.lower() not in exclude 
-             and not f.name.endswith('.backup')]
-    
-    if not files:
-        print("❌ Keine Artikel")
-        return
-    
-    print(f"📋 {len(files)} Artikel")
-    print()
-    
-    resp = input("Konvertieren? (j/n): ")
-    if resp.lower() not in ['j', 'ja', 'y']:
-        print("Abgebrochen")
-        return
-    
-    print()
-    
-    ok = 0
     for f in files:
-        if convert(f):
-            ok += 1
+        if not journal.is_done(f):
+            convert(f, journal)
+    journal.end()
     
+    ok = journal.counts().get('updated', 0)
     print()
     print("=" * 70)
     print(f"✅ {ok}/{len(files)} erfolgreich")